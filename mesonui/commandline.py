@@ -8,14 +8,146 @@
 # copyright 2020 The Meson-UI development team
 #
 from .projectinfo import ProjectInfo
+from os.path import join as join_paths
+from pathlib import Path
 import argparse
+import json
+import sys
 
+#
+# Groups printed by "meson-ui introspect" when none are given.
+INTROSPECT_GROUPS: list = ['projectinfo', 'buildoptions', 'targets', 'tests']
+
+
+def _add_dirs(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument('--sourcedir', default=str(Path().cwd()), help='project source directory')
+    parser.add_argument('--builddir', default=None, help='build directory, "builddir" in the sourcedir by default')
+
+
+def _dirs(args: argparse.Namespace) -> tuple:
+    builddir: str = args.builddir if args.builddir is not None else join_paths(args.sourcedir, 'builddir')
+    return (args.sourcedir, builddir)
+
+
+def _run(handle) -> int:
+    '''
+    this function streams the output of a process handle to the console
+    and gives back its exit code.  The process runs already, so the lines
+    it printed before the listener was added are replayed first.
+    '''
+    handle.add_listener(lambda line: print(line, end='', flush=True), replay=True)
+    returncode: int = handle.wait()
+    sys.stderr.write(handle.errors())
+    return returncode
+
+
+def cli_introspect(args: argparse.Namespace) -> int:
+    from .repository.mesonapi import MesonAPI
+
+    sourcedir, builddir = _dirs(args)
+    meson_api: MesonAPI = MesonAPI(sourcedir=sourcedir, builddir=builddir)
+    info: dict = meson_api.get_objects(groups=args.groups or INTROSPECT_GROUPS, extract_method=args.method)
+    print(json.dumps(info, indent=args.indent))
+    if all(value is None for value in info.values()):
+        sys.stderr.write(f'No introspection data found for {sourcedir}\n')
+        return 1
+    return 0
+
+
+def cli_setup(args: argparse.Namespace) -> int:
+    from .mesonuilib.buildsystem import Meson
+    from .mesonuilib.profiles import load_profile
+    from .mesonuilib.profiles import profile_args
+
+    sourcedir, builddir = _dirs(args)
+    meson_args: list = profile_args(load_profile(args.profile)) if args.profile else list()
+    meson_args.extend(f'-D{option}' for option in args.options)
+    if args.wipe and Path(builddir).exists():
+        meson_args.append('--wipe')
+    return _run(Meson(sourcedir=sourcedir, builddir=builddir).setup_async(args=meson_args))
+
+
+def cli_build(args: argparse.Namespace) -> int:
+    from .mesonuilib.buildsystem import Meson
 
-def mesonui_cli() -> argparse:
+    sourcedir, builddir = _dirs(args)
+    return _run(Meson(sourcedir=sourcedir, builddir=builddir).compile_async())
+
+
+def cli_test(args: argparse.Namespace) -> int:
+    from .mesonuilib.buildsystem import Meson
+
+    sourcedir, builddir = _dirs(args)
+    return _run(Meson(sourcedir=sourcedir, builddir=builddir).test_async())
+
+
+def cli_matrix(args: argparse.Namespace) -> int:
+    from .mesonuilib.setupmatrix import SetupMatrix
+    from .mesonuilib.profiles import SETUP_PROFILES
+    from .mesonuilib.profiles import load_profile
+
+    profiles: dict = dict()
+    for profile in args.profiles:
+        profiles[profile if profile in SETUP_PROFILES else Path(profile).stem] = load_profile(profile)
+    matrix: SetupMatrix = SetupMatrix(args.sourcedir, profiles, jobs=args.jobs).start()
+    matrix.wait()
+    print('\n'.join(matrix.summary()), flush=True)
+    for entry in matrix.failed():
+        sys.stderr.write(f'{entry.profile}:\n{entry.errors()}')
+    return 1 if matrix.failed() else 0
+
+
+def mesonui_cli(argv: list = None) -> argparse.Namespace:
+    '''
+    this function parses the command line.  With one of the headless
+    commands given it is run right away and the process exits with its
+    exit code, without Qt ever being imported.  Else the parsed values
+    are given back and the GUI starts.
+    '''
     data: ProjectInfo = ProjectInfo()
 
     parser: argparse = argparse.ArgumentParser(description='Meson-ui Build GUI.')
 
     parser.add_argument('-v', '--version', action='version', version=data.get_version(), help='print version number')
 
-    parser.parse_args()
+    commands = parser.add_subparsers(dest='command', metavar='command')
+
+    introspect = commands.add_parser('introspect', help='print introspection data as "JSON"')
+    _add_dirs(introspect)
+    introspect.add_argument('groups', nargs='*', help=f'groups to print, default: {" ".join(INTROSPECT_GROUPS)}')
+    introspect.add_argument('--method', default='loader', choices=['loader', 'reader', 'script'],
+                            help='how the data is read, build directory files are used when found')
+    introspect.add_argument('--indent', type=int, default=None, help='indent the "JSON" output')
+    introspect.set_defaults(func=cli_introspect)
+
+    setup = commands.add_parser('setup', help='set up a build directory')
+    _add_dirs(setup)
+    setup.add_argument('--profile', help='built in profile name or "JSON" file of option values')
+    setup.add_argument('-D', dest='options', action='append', default=[], metavar='option=value',
+                       help='set an option, given after the profile values so it wins')
+    setup.add_argument('--wipe', action='store_true', help='wipe the build directory if it exists')
+    setup.set_defaults(func=cli_setup)
+
+    matrix = commands.add_parser('matrix', help='set up one build directory for each profile at once')
+    matrix.add_argument('--sourcedir', default=str(Path().cwd()), help='project source directory')
+    matrix.add_argument('profiles', nargs='+', help='built in profile names or "JSON" files of option values')
+    matrix.add_argument('-j', '--jobs', type=int, default=None,
+                        help='Meson runs at the same time, one per core by default')
+    matrix.set_defaults(func=cli_matrix)
+
+    build = commands.add_parser('build', help='compile the project')
+    _add_dirs(build)
+    build.set_defaults(func=cli_build)
+
+    test = commands.add_parser('test', help='run the project tests')
+    _add_dirs(test)
+    test.set_defaults(func=cli_test)
+
+    args: argparse.Namespace = parser.parse_args(argv)
+    if args.command is not None:
+        from .mesonuilib.utilitylib import MesonUiExceptionType
+        try:
+            sys.exit(args.func(args))
+        except MesonUiExceptionType as error:
+            parser.exit(2, f'meson-ui: error: {error}\n')
+    return args
@@ -7,18 +7,182 @@
 #
 # copyright 2020 The Meson-UI development team
 #
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import QObject
+
 from .buildoptions import IntroBuildOptionsTab
 from .projectinfo import IntroProjectInfoTab
 from .tests import IntroTestlogInfoTab
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future
+import threading
+import logging
+
+#
+# Groups read by the dashboard tabs, fetched together before the tabs
+# update so Meson only has to introspect the project once.
+DASHBOARD_GROUPS: list = ['buildoptions', 'projectinfo', 'tests', 'testlog']
+#
+# Groups each tab shows, a background refresh fetches the groups of every
+# tab it updates in one go.
+DASHBOARD_TAB_GROUPS: dict = {
+    'buildoptions': ['buildoptions'],
+    'projectinfo': ['projectinfo'],
+    'tests': ['tests', 'testlog']
+}
+
+
+class IntrospectionSnapshot:
+    '''
+    this class holds the groups fetched for the tabs off the GUI thread, and
+    answers the models the same way "MesonAPI" does without reading
+    anything again.
+    '''
+    def __init__(self, objects: dict):
+        self._objects: dict = objects
+
+    def get_object(self, group: str = None, extract_method: str = 'script', use_fallback: bool = False) -> any:
+        return self._objects.get(group)
+
+    def iter_object(self, group: str = None) -> any:
+        return iter(self._objects.get(group) or [])
+
+    @staticmethod
+    def fetch(meson_api, groups: list) -> 'IntrospectionSnapshot':
+        objects: dict = meson_api.get_objects(groups=[group for group in groups if group != 'testlog'])
+        if 'testlog' in groups:
+            objects['testlog'] = list(meson_api.iter_object(group='testlog'))
+        return IntrospectionSnapshot(objects)
+
 
-class IntrospectionDashboard:
-    def __init__(self, context, meson_api):
+class IntrospectionDashboard(QObject):
+    '''
+    this class keeps the introspection tabs of the main window up to
+    date.  "update" and "update_groups" work on the GUI thread, "refresh"
+    fetches the groups of all its tabs with one "get_objects" in a thread
+    pool and only fills the tabs in once back on the GUI thread.
+
+    Every refresh of a tab bumps its generation, a tab is only filled in
+    from the newest refresh that asked for it, results of an older one
+    still running are dropped for that tab when they come in.
+    '''
+    refreshed = pyqtSignal(list)
+    _fetched = pyqtSignal(object, object)
+
+    def __init__(self, context, meson_api, workers: int = len(DASHBOARD_TAB_GROUPS)):
         super().__init__()
+        self._pool: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=workers)
+        self._generations: dict = dict.fromkeys(DASHBOARD_TAB_GROUPS, 0)
+        self._pending: dict = {}
+        self._lock = threading.Lock()
+        self._fetched.connect(self._on_fetched)
         self._buildoptions: IntroBuildOptionsTab = IntroBuildOptionsTab(context=context, meson_api=meson_api)
         self._projectinfo: IntroProjectInfoTab = IntroProjectInfoTab(context=context, meson_api=meson_api)
         self._testloginfo: IntroTestlogInfoTab = IntroTestlogInfoTab(context=context, meson_api=meson_api)
+        self._tabs: dict = {
+            'buildoptions': [self._buildoptions],
+            'projectinfo': [self._projectinfo],
+            'tests': [self._testloginfo],
+            'testlog': [self._testloginfo]
+        }
+        self._tab_names: dict = {
+            'buildoptions': self._buildoptions,
+            'projectinfo': self._projectinfo,
+            'tests': self._testloginfo
+        }
 
     def update(self, meson_api: None):
+        self._supersede(list(DASHBOARD_TAB_GROUPS))
+        meson_api.get_objects(groups=DASHBOARD_GROUPS)
         self._buildoptions.update_introspection(meson_api)
         self._projectinfo.update_introspection(meson_api)
         self._testloginfo.update_introspection(meson_api)
+
+    def update_groups(self, meson_api: None, groups: list) -> list:
+        '''
+        this method only updates the tabs showing one of the given
+        groups, and gives back the tabs it updated.
+        '''
+        tabs: list = []
+        for group in groups:
+            for tab in self._tabs.get(group, []):
+                if tab not in tabs:
+                    tabs.append(tab)
+        if not tabs:
+            return tabs
+
+        self._supersede([name for name, tab in self._tab_names.items() if tab in tabs])
+        meson_api.get_objects(groups=[group for group in DASHBOARD_GROUPS if self._tabs[group][0] in tabs])
+        for tab in tabs:
+            tab.update_introspection(meson_api)
+        return tabs
+
+    def refresh(self, meson_api: None, groups: list = None) -> list:
+        '''
+        this method fetches the tabs showing one of the given groups (all
+        tabs if none given) in the background, and gives back the names
+        of the tabs it started.  The call never waits for Meson.
+        '''
+        names: list = [name for name, tab_groups in DASHBOARD_TAB_GROUPS.items()
+                       if groups is None or set(tab_groups).intersection(groups)]
+        if not names:
+            return names
+        fetch_groups: list = [group for name in names for group in DASHBOARD_TAB_GROUPS[name]]
+        self._supersede(names)
+        with self._lock:
+            generations: dict = {name: self._generations[name] for name in names}
+            future: Future = self._pool.submit(IntrospectionSnapshot.fetch, meson_api, fetch_groups)
+            for name in names:
+                self._pending[name] = future
+        future.add_done_callback(lambda done, generations=generations: self._on_done(generations, done))
+        return names
+
+    def is_busy(self) -> bool:
+        with self._lock:
+            return len(self._pending) != 0
+
+    def shutdown(self) -> None:
+        '''
+        this method drops every refresh still waiting, a fetch already
+        running is left to finish but is never shown.
+        '''
+        self._supersede(list(DASHBOARD_TAB_GROUPS))
+        self._pool.shutdown(wait=False)
+
+    def _supersede(self, names: list) -> None:
+        #
+        # A new generation makes any refresh of these tabs still running
+        # stale, one not started yet is not run at all unless other tabs
+        # still wait for it.
+        with self._lock:
+            for name in names:
+                self._generations[name] += 1
+                stale: Future = self._pending.pop(name, None)
+                if stale is not None and stale not in self._pending.values():
+                    stale.cancel()
+
+    def _on_done(self, generations: dict, future: Future) -> None:
+        #
+        # Called on the pool thread, the signal hands the result over to
+        # the GUI thread.
+        if future.cancelled():
+            return
+        error: BaseException = future.exception()
+        if error is not None:
+            logging.warning(f'Dashboard refresh of {list(generations)} failed: {error}')
+            self._fetched.emit(generations, None)
+            return
+        self._fetched.emit(generations, future.result())
+
+    def _on_fetched(self, generations: dict, snapshot: IntrospectionSnapshot) -> None:
+        with self._lock:
+            names: list = [name for name, generation in generations.items() if generation == self._generations[name]]
+            for name in names:
+                self._pending.pop(name, None)
+        if len(names) != len(generations):
+            logging.debug(f'Dropped stale dashboard refresh of {[name for name in generations if name not in names]}')
+        if snapshot is None or not names:
+            return
+        for name in names:
+            self._tab_names[name].update_introspection(snapshot)
+        self.refreshed.emit(names)
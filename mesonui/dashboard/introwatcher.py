@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from PyQt5.QtCore import QFileSystemWatcher
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import QObject
+from PyQt5.QtCore import QTimer
+
+from ..repository.datacache import MESON_GROUP_FILES
+from ..repository.datacache import stat_stamp
+from ..repository.datascanner import SCRIPT_GROUPS
+from os.path import join as join_paths
+from os.path import dirname
+from os.path import exists
+import logging
+import json
+
+#
+# A burst of writes (like "meson setup" rewriting every intro file) is
+# reported once this many milliseconds after the last write.
+WATCH_DEBOUNCE_INTERVAL: int = 250
+#
+# How often paths that can not be watched are checked by hand.
+WATCH_POLL_INTERVAL: int = 1000
+
+
+class IntrospectionWatcher(QObject):
+    '''
+    this class watches the intro files in the build directory, the test
+    log and the build system files of the project, and tells which API
+    groups changed.
+
+    Every change notice only triggers a compare of the file stamps, the
+    groups of the files that really changed are collected and dropped
+    from the API cache, then "changed" is emitted once when the writes
+    stop.  Paths the system can not watch (like a build directory that
+    does not exist yet) are polled instead.
+    '''
+    changed = pyqtSignal(list)
+
+    def __init__(self, meson_api, debounce: int = WATCH_DEBOUNCE_INTERVAL,
+                 poll_interval: int = WATCH_POLL_INTERVAL, use_polling: bool = False):
+        super().__init__()
+        self._meson_api = meson_api
+        self._use_polling: bool = use_polling
+        self._stamps: dict = {}
+        self._pending: set = set()
+        self._buildsystem_stamp: tuple = None
+        self._buildsystem_files: list = []
+
+        self._watcher: QFileSystemWatcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_change)
+        self._watcher.directoryChanged.connect(self._on_change)
+
+        self._debounce: QTimer = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(debounce)
+        self._debounce.timeout.connect(self._flush)
+
+        self._poll: QTimer = QTimer(self)
+        self._poll.setInterval(poll_interval)
+        self._poll.timeout.connect(self._on_change)
+
+        self.rewatch()
+
+    def rewatch(self) -> None:
+        '''
+        this method starts over with the current source and build
+        directory of the API, without reporting anything as changed.
+        '''
+        self._pending.clear()
+        self._debounce.stop()
+        self._buildsystem_stamp = None
+        self._stamps = self._take_stamps()
+        self._update_watches()
+
+    def pending_groups(self) -> list:
+        return sorted(self._pending)
+
+    def watched_paths(self) -> dict:
+        '''
+        this method gives back every path being looked at, mapped onto
+        the API groups that go stale when it changes.
+        '''
+        builddir: str = str(self._meson_api.builddir)
+        paths: dict = {}
+        for group, (subdir, name) in MESON_GROUP_FILES.items():
+            paths[join_paths(builddir, subdir, name)] = [group]
+        for path in self._read_buildsystem_files():
+            paths.setdefault(path, [])
+            paths[path] = sorted(set(paths[path]).union(SCRIPT_GROUPS))
+        return paths
+
+    def _read_buildsystem_files(self) -> list:
+        #
+        # Meson lists every "meson.build" and options file it read, the
+        # list only has to be read again when the file itself changes.
+        intro_file: str = join_paths(str(self._meson_api.builddir), 'meson-info', 'intro-buildsystem_files.json')
+        stamp: tuple = stat_stamp(intro_file)
+        if stamp == self._buildsystem_stamp:
+            return self._buildsystem_files
+        self._buildsystem_stamp = stamp
+        try:
+            with open(intro_file) as loaded_json:
+                self._buildsystem_files = [str(path) for path in json.loads(loaded_json.read())]
+        except (OSError, ValueError):
+            self._buildsystem_files = [join_paths(str(self._meson_api.sourcedir), 'meson.build')]
+        return self._buildsystem_files
+
+    def _take_stamps(self) -> dict:
+        stamps: dict = {}
+        for path, groups in self.watched_paths().items():
+            stamps[path] = (stat_stamp(path), groups)
+        return stamps
+
+    def _update_watches(self) -> None:
+        files: set = set(self._stamps)
+        directories: set = set(dirname(path) for path in files)
+        watched: set = set(self._watcher.files()).union(self._watcher.directories())
+
+        stale: list = sorted(watched - files - directories)
+        if stale:
+            self._watcher.removePaths(stale)
+        #
+        # Files replaced by a rename drop out of the watch and are added
+        # back here.  A file that does not exist yet is seen through its
+        # directory, only a missing directory has to be polled for.
+        candidates: list = sorted(path for path in (files | directories) - watched if exists(path))
+        failed: list = candidates
+        if candidates and not self._use_polling:
+            failed = self._watcher.addPaths(candidates)
+
+        if self._use_polling or failed or not all(exists(path) for path in directories):
+            if not self._poll.isActive():
+                self._poll.start()
+        else:
+            self._poll.stop()
+
+    def _on_change(self, path: str = None) -> None:
+        stamps: dict = self._take_stamps()
+        changed: bool = False
+        for file, (stamp, groups) in stamps.items():
+            old: tuple = self._stamps.get(file)
+            if old is None or old[0] != stamp:
+                logging.debug(f'Watched file changed: {file}')
+                self._pending.update(groups)
+                changed = True
+        self._stamps = stamps
+        self._update_watches()
+        #
+        # Only a real change restarts the debounce, otherwise polling
+        # would keep pushing the update back forever.
+        if changed:
+            self._debounce.start()
+
+    def _flush(self) -> None:
+        groups: list = sorted(self._pending)
+        self._pending.clear()
+        if not groups:
+            return
+        logging.info(f'Watched groups changed: {groups}')
+        for group in groups:
+            self._meson_api.cache.invalidate(group)
+        self.changed.emit(groups)
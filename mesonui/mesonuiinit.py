@@ -9,7 +9,6 @@
 #
 from PyQt5.QtWidgets import QApplication
 from .models.appmodel import MainModel
-from .view import main_activity
 import logging
 
 
@@ -20,5 +19,6 @@ class MesonUiApplication(QApplication):
 
     def runner_start(self):
         logging.info(' Init Meson-UI Application runner')
+        from .view import main_activity
         self.activity = main_activity.MainActivity(self._model)
         self.activity.show()
@@ -12,17 +12,107 @@ from mesonui.repository.mesonapi import MesonAPI
 from mesonui.mesonuilib.mesonapi.projectinfo import ProjectInfo
 from mesonui.mesonuilib.mesonapi.projectinfo import MesonInfo
 from .backendimpl import BackendImplementionApi
+from concurrent.futures import ProcessPoolExecutor
 from os.path import join as join_paths
 from ..buildsystem import Ninja
+from collections import deque
+from io import StringIO
+import multiprocessing
+import itertools
+import tempfile
 import logging
 import os
 
+import typing as T
+
 BUILD_OPTION_EXECUTABLE = 1
 BUILD_OPTION_STATIC_LIBRARY = 2
 BUILD_OPTION_SHARED_LIBRARY = 3
 BUILD_OPTION_COMMANDS_ONLY = 4
 CBP_VERSION_MAJOR = 1
 CBP_VERSION_MINOR = 6
+#
+# Below this many sources the targets are written in this process, a
+# worker pool only pays off once there is a lot of XML to write.
+CBP_PARALLEL_SOURCES = 5000
+#
+# Targets handed to the pool ahead of the one being written, per worker.
+CBP_JOBS_PER_WORKER = 4
+#
+# Characters copied at a time from the unit spill file.
+CBP_SPILL_CHUNK = 1 << 16
+
+_HEADER_EXTS: tuple = ('h', 'hpp')
+_BUILD_OPTION_TYPES: dict = {
+    'executable': f'{BUILD_OPTION_EXECUTABLE}',
+    'static library': f'{BUILD_OPTION_STATIC_LIBRARY}',
+    'shared library': f'{BUILD_OPTION_SHARED_LIBRARY}',
+    'custom': f'{BUILD_OPTION_COMMANDS_ONLY}',
+    'run': f'{BUILD_OPTION_COMMANDS_ONLY}'
+}
+
+
+class HeaderIndex:
+    '''
+    this class finds the headers next to a source file.  Each directory is
+    listed once and kept, so a lookup costs no "os.path.exists" calls.
+    '''
+    def __init__(self):
+        self._listings: dict = {}
+
+    def _listing(self, directory: str) -> frozenset:
+        listing: frozenset = self._listings.get(directory)
+        if listing is None:
+            try:
+                listing = frozenset(os.listdir(directory))
+            except OSError:
+                listing = frozenset()
+            self._listings[directory] = listing
+        return listing
+
+    def headers_for(self, source: str) -> list:
+        directory, name = os.path.split(source)
+        base: str = os.path.splitext(name)[0]
+        listing: frozenset = self._listing(directory)
+        return [join_paths(directory, f'{base}.{ext}') for ext in _HEADER_EXTS if f'{base}.{ext}' in listing]
+
+
+def _target_fragments(job: tuple) -> tuple:
+    '''
+    this function writes the "Target" and "Unit" elements of one target as
+    two XML fragments, it runs in the worker processes.  The fragments are
+    built as text so they are only encoded once, when written to the file.
+    '''
+    target, units, builddir, ninja_exe, compiler = job
+    output: str = join_paths(builddir, target['id'])
+    xml: Builder = Builder(stream=StringIO(), indentation=2)
+    with xml.Target(title=target['name']):
+        xml.Option(output=output)
+        xml.Option(working_dir=os.path.split(output)[0])
+        xml.Option(object_output=join_paths(os.path.split(output)[0], target['id']))
+        xml.Option(type=_BUILD_OPTION_TYPES[target['type']])
+        xml.Option(compiler=compiler)
+    with xml.Compiler:
+        for target_source in target['target_sources']:
+            for defs in target_source.get('parameters', []):
+                if defs.startswith('-D'):
+                    xml.Add(option=defs)
+
+            for dirs in target_source.get('parameters', []):
+                if dirs.startswith('-I') or dirs.startswith('/I'):
+                    xml.Add(option=dirs)
+
+    with xml.MakeCommands:
+        xml.Build(command=f'{ninja_exe} -v {target["name"]}')
+        xml.CompileFile(command=f'{ninja_exe} -v {target["name"]}')
+        xml.Clean(command=f'{ninja_exe} -v clean')
+        xml.DistClean(command=f'{ninja_exe} -v clean')
+
+    unit_xml: Builder = Builder(stream=StringIO(), indentation=1)
+    for filename in units:
+        with unit_xml.Unit(filename=filename):
+            unit_xml.Option(target=target['name'])
+    return (str(xml), str(unit_xml))
 
 
 class CodeBlocksBackend(BackendImplementionApi):
@@ -31,17 +121,75 @@ class CodeBlocksBackend(BackendImplementionApi):
         self.projectinfo = ProjectInfo(meson_api=meson_api)
         self.mesoninfo = MesonInfo(meson_api=meson_api)
         self.buildsystem_files = meson_api.get_object(group='buildsystem-files', extract_method='loader')
-        self.targetsinfo: any = meson_api.get_object(group='targets', extract_method='loader')
+        self.meson_api: MesonAPI = meson_api
         self.ninja = Ninja(self.mesoninfo.sourcedir, self.mesoninfo.builddir)
-        self.compiler = self.targetsinfo[0]['target_sources'][0]['compiler'][0]
+        #
+        # Targets are streamed on each pass instead of kept around, only
+        # the first one is needed here for the compiler name.
+        first_target: any = next(meson_api.iter_object(group='targets'))
+        self.compiler = first_target['target_sources'][0]['compiler'][0]
 
-    def generator(self):
+    def generator(self, jobs: int = None):
         logging.info(f'Generating {self.backend} project')
-        self.generate_project()
+        self.generate_project(jobs=jobs)
+
+    def _iter_jobs(self, headers: HeaderIndex) -> T.Iterator[tuple]:
+        #
+        # The header lookups use one listing per directory and are done
+        # here, so the workers only have to turn plain data into XML.
+        # Targets are streamed, one job is made at a time.
+        for target in self.meson_api.iter_object(group='targets'):
+            units: list = []
+            for target_source in target['target_sources']:
+                for file in target_source.get('sources', []):
+                    source: str = join_paths(self.mesoninfo.sourcedir, file)
+                    units.append(source)
+                    units.extend(os.path.abspath(header) for header in headers.headers_for(source))
+            yield (target, units, str(self.mesoninfo.builddir), self.ninja.exe, self.compiler)
 
-    def generate_project(self):
-        xml: Builder = Builder(version='1.0', encoding='UTF-8')
-        with xml.CodeBlocks_project_file(Name=self.projectinfo.descriptive_name, Version='0.1', InternalType='Console'):
+    def _fragments(self, jobs: T.Iterator[tuple], workers: int = None) -> T.Iterator[tuple]:
+        '''
+        this method yields the fragments of each target in target order as
+        soon as they are done.  Only the first targets (until there are
+        enough sources for a worker pool to pay off) and the jobs in
+        flight are held at any time.
+        '''
+        workers = workers or os.cpu_count() or 1
+        jobs = iter(jobs)
+        head: list = []
+        sources: int = 0
+        if workers > 1:
+            for job in jobs:
+                head.append(job)
+                sources += len(job[1])
+                if sources >= CBP_PARALLEL_SOURCES and len(head) >= 2:
+                    break
+        if workers == 1 or len(head) < 2 or sources < CBP_PARALLEL_SOURCES:
+            yield from map(_target_fragments, itertools.chain(head, jobs))
+            return
+
+        logging.info(f'Writing targets with {workers} workers')
+        #
+        # Spawned workers do not inherit the threads of the GUI process.
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            window: deque = deque()
+            for job in itertools.chain(head, jobs):
+                window.append(pool.submit(_target_fragments, job))
+                if len(window) >= workers * CBP_JOBS_PER_WORKER:
+                    yield window.popleft().result()
+            while window:
+                yield window.popleft().result()
+
+    def generate_project(self, jobs: int = None):
+        #
+        # The project file is written while it is built, so it never has
+        # to be held in memory as a whole.  The units follow the build
+        # targets in the file, so they wait in a spill file meanwhile.
+        project_file: str = join_paths(self.mesoninfo.builddir, f'{self.projectinfo.descriptive_name}.cbp')
+        with Builder.to_file(project_file, version='1.0', encoding='UTF-8') as xml, \
+                tempfile.TemporaryFile('w+', encoding='utf-8') as units, \
+                xml.CodeBlocks_project_file(Name=self.projectinfo.descriptive_name, Version='0.1', InternalType='Console'):
             xml.FileVersion(major=f'{CBP_VERSION_MAJOR}', minor=f'{CBP_VERSION_MINOR}')
             with xml.Project:
                 xml.Option(title=self.projectinfo.descriptive_name)
@@ -50,58 +198,14 @@ class CodeBlocksBackend(BackendImplementionApi):
                 xml.Option(makefile_is_custom='1')
 
             with xml.Build:
-                for targets in self.targetsinfo:
-                    output = join_paths(self.mesoninfo.builddir, targets['id'])
-                    with xml.Target(title=targets['name']):
-                        xml.Option(output=output)
-                        xml.Option(working_dir=os.path.split(output)[0])
-                        xml.Option(object_output=join_paths(os.path.split(output)[0], targets['id']))
-                        ty = {
-                            'executable': f'{BUILD_OPTION_EXECUTABLE}',
-                            'static library': f'{BUILD_OPTION_STATIC_LIBRARY}',
-                            'shared library': f'{BUILD_OPTION_SHARED_LIBRARY}',
-                            'custom': f'{BUILD_OPTION_COMMANDS_ONLY}',
-                            'run': f'{BUILD_OPTION_COMMANDS_ONLY}'
-                        }[targets['type']]
-                        xml.Option(type=ty)
-                        compiler = targets
-                        if compiler:
-                            xml.Option(compiler=self.compiler)
-                    with xml.Compiler:
-                        for target in targets['target_sources']:
-                            for defs in target['parameters']:
-                                if defs.startswith('-D'):
-                                    logging.info(f'add def: {defs}')
-                                    xml.Add(option=defs)
-
-                            for dirs in target['parameters']:
-                                if dirs.startswith('-I') or dirs.startswith('/I'):
-                                    logging.info(f'add include: {dirs}')
-                                    xml.Add(option=dirs)
-
-                    with xml.MakeCommands:
-                        xml.Build(command=f'{self.ninja.exe} -v {targets["name"]}')
-                        xml.CompileFile(command=f'{self.ninja.exe} -v {targets["name"]}')
-                        xml.Clean(command=f'{self.ninja.exe} -v clean')
-                        xml.DistClean(command=f'{self.ninja.exe} -v clean')
-
-            for targets in self.targetsinfo:
-                for target in targets['target_sources']:
-                    for file in target['sources']:
-                        with xml.Unit(filename=join_paths(self.mesoninfo.sourcedir, file)):
-                            xml.Option(target=targets['name'])
-
-                    base = os.path.splitext(os.path.basename(file))[0]
-                    header_exts = ('h', 'hpp')
-                    for ext in header_exts:
-                        header_file = os.path.abspath(
-                            join_paths(self.mesoninfo.sourcedir, os.path.dirname(file), f'{base}.{ext}'))
-                        if os.path.exists(header_file):
-                            with xml.Unit(filename=header_file):
-                                xml.Option(target=targets['name'])
+                for target_xml, unit_xml in self._fragments(self._iter_jobs(HeaderIndex()), workers=jobs):
+                    xml.write_fragment(target_xml)
+                    if unit_xml:
+                        units.write(f'\n{unit_xml}')
+
+            units.seek(0)
+            for chunk in iter(lambda: units.read(CBP_SPILL_CHUNK), ''):
+                xml.write(chunk)
             for file in self.buildsystem_files:
                 with xml.Unit(filename=join_paths(self.mesoninfo.sourcedir, file)):
                     xml.Option(target=join_paths('Meson Files', os.path.dirname(file)))
-
-        with open(join_paths(self.mesoninfo.builddir, f'{self.projectinfo.descriptive_name}.cbp'), 'w') as ide_file:
-            ide_file.write(str(xml))
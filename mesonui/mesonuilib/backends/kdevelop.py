@@ -13,7 +13,7 @@ from mesonui.mesonuilib.mesonapi.projectinfo import ProjectInfo
 from mesonui.mesonuilib.mesonapi.projectinfo import MesonInfo
 from .backendimpl import BackendImplementionApi
 from os.path import join as join_paths
-from ..buildsystem import Meson
+from ..utilitylib import tool_registry
 import logging
 import os
 
@@ -25,7 +25,6 @@ class KDevelopBackend(BackendImplementionApi):
         self.buildoptions = BuildOption(meson_api=meson_api)
         self.projectinfo = ProjectInfo(meson_api=meson_api)
         self.mesoninfo = MesonInfo(meson_api=meson_api)
-        self.meson = Meson()
 
     def generator(self):
         logging.info(f'Generating {self.backend} project')
@@ -56,7 +55,7 @@ class KDevelopBackend(BackendImplementionApi):
             file.write('Additional meson arguments=\n')
             file.write(f'Build Build Path={self.mesoninfo.builddir}\n')
             file.write(f'Meson Generator Backend={self.buildoptions.combo("backend").value}\n')
-            file.write(f'Meson executable={self.meson.exe}\n')
+            file.write(f'Meson executable={tool_registry.path("meson")}\n')
 
     def _variant(self) -> str:
         variant: str = '\\x00\\x00\\x00\\t\\x00\\x00\\x00\\x00\\x01\\x00\\x00\\x00\\x0b\\x00\\x00\\x00\\x00\\x01\\x00\\x00\\x00\\x16'
@@ -22,7 +22,7 @@ class QtCreatorBackend(BackendImplementionApi):
         self.projectinfo = ProjectInfo(meson_api=meson_api)
         self.mesoninfo = MesonInfo(meson_api=meson_api)
         self.buildsystem_files: list = meson_api.get_object(group='buildsystem-files', extract_method='loader')
-        self.targetsinfo: list = meson_api.get_object(group='targets', extract_method='loader')
+        self.meson_api: MesonAPI = meson_api
 
     def generator(self):
         logging.info(f'Generating {self.backend} project')
@@ -33,29 +33,24 @@ class QtCreatorBackend(BackendImplementionApi):
         with open(join_paths(self.mesoninfo.builddir, f'{self.projectinfo.descriptive_name}.creator'), 'w') as file:
             file.write('[General]')
 
-        # Generate the .config file.
-        with open(join_paths(self.mesoninfo.builddir, f'{self.projectinfo.descriptive_name}.config'), 'w') as file:
-            file.write('// Add predefined macros for your project here. For example:')
-            file.write('// #define THE_ANSWER 42')
-            for targets in self.targetsinfo:
+        # Generate the .config, .files and .includes files in one pass
+        # over the targets, so the intro file is only read once.
+        name: str = join_paths(self.mesoninfo.builddir, self.projectinfo.descriptive_name)
+        with open(f'{name}.config', 'w') as config, open(f'{name}.files', 'w') as files, \
+                open(f'{name}.includes', 'w') as includes:
+            config.write('// Add predefined macros for your project here. For example:')
+            config.write('// #define THE_ANSWER 42')
+            for targets in self.meson_api.iter_object(group='targets'):
                 for item in targets['target_sources'][0]['parameters']:
                     if item.startswith('-D'):
                         logging.info(f'add def: {item}')
                         item = ' '.join(item.split('='))
-                        file.write(f'#define {item}\n')
+                        config.write(f'#define {item}\n')
+                    elif item.startswith('-I') or item.startswith('/I'):
+                        includes.write(os.path.relpath(item, self.mesoninfo.builddir) + '\n')
 
-        # Generate the .files file.
-        with open(join_paths(self.mesoninfo.builddir, f'{self.projectinfo.descriptive_name}.files'), 'w') as file:
-            for targets in self.targetsinfo:
-                for items in targets['target_sources'][0]['sources']:
-                    file.write(os.path.relpath(item, self.mesoninfo.builddir) + '\n')
+                for item in targets['target_sources'][0]['sources']:
+                    files.write(os.path.relpath(item, self.mesoninfo.builddir) + '\n')
 
-                for item in self.buildsystem_files:
-                    file.write(os.path.relpath(item, self.mesoninfo.builddir) + '\n')
-
-        # Generate the .includes file.
-        with open(join_paths(self.mesoninfo.builddir, f'{self.projectinfo.descriptive_name}.includes'), 'w') as file:
-            for targets in self.targetsinfo:
-                for item in targets['target_sources'][0]['parameters']:
-                    if item.startswith('-I') or item.startswith('/I'):
-                        file.write(os.path.relpath(item, self.mesoninfo.builddir) + '\n')
+            for item in self.buildsystem_files:
+                files.write(os.path.relpath(item, self.mesoninfo.builddir) + '\n')
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from .processrunner import ProcessHandle
+from collections import deque
+import threading
+import time
+import os
+import re
+
+import typing as T
+
+#
+# Status line format asked from Ninja: edges finished, edges in total
+# and edges running.  Ninja's own default "[%f/%t] " is read as well.
+NINJA_STATUS_FORMAT: str = '[%f/%t %r] '
+#
+# Throughput is measured over this many seconds, so a slow phase (like
+# linking) shows up in the rate instead of being averaged away.
+PROGRESS_RATE_WINDOW: float = 10.0
+#
+# How many descriptions of the last finished edges are kept.  Ninja only
+# prints an edge when it finished if its output is not a terminal, so the
+# edges still running are not known by their name.
+PROGRESS_FINISHED_EDGES: int = 8
+
+_NINJA_STATUS_LINE = re.compile(r'^\[(\d+)/(\d+)(?: (\d+))?\] (.*)$')
+
+
+def ninja_status_env(env: dict = None) -> dict:
+    '''
+    this function gives back a copy of the environment (of this process
+    if none given) that makes Ninja print the status lines this module
+    reads.
+    '''
+    env = dict(os.environ if env is None else env)
+    env['NINJA_STATUS'] = NINJA_STATUS_FORMAT
+    return env
+
+
+class BuildProgress:
+    '''
+    this class is one reading of a running build.  "rate" is in edges per
+    second, "eta" in seconds, both are None until they can be told.
+    '''
+    def __init__(self, finished: int = 0, total: int = 0, running: int = None, rate: float = None,
+                 eta: float = None, elapsed: float = 0.0, idle: float = 0.0, last_finished: list = None):
+        self.finished: int = finished
+        self.total: int = total
+        self.running: int = running
+        self.rate: float = rate
+        self.eta: float = eta
+        self.elapsed: float = elapsed
+        self.idle: float = idle
+        self.last_finished: list = last_finished if last_finished is not None else list()
+
+    @property
+    def last_edge(self) -> str:
+        return self.last_finished[-1] if self.last_finished else ''
+
+    @property
+    def fraction(self) -> float:
+        return self.finished / self.total if self.total else 0.0
+
+    def summary(self) -> str:
+        text: str = f'{self.finished}/{self.total} edges'
+        if self.rate is not None:
+            text += f', {self.rate:.1f}/s'
+        if self.eta is not None:
+            minutes, seconds = divmod(int(self.eta), 60)
+            text += f', ETA {minutes}:{seconds:02d}'
+        return text
+
+    def __repr__(self) -> str:
+        return f'<BuildProgress {self.summary()}>'
+
+
+class NinjaProgressParser:
+    '''
+    this class reads Ninja status lines ("[12/345] Compiling C object
+    foo.o") as they stream in and keeps track of how far the build is.
+
+    Listeners get a "BuildProgress" for every status line, on the thread
+    that fed the line (the reader thread of a process handle).  GUI code
+    can poll "progress" from its own thread instead.  Lines that are not
+    status lines (compiler warnings, Meson output) are ignored.
+    '''
+    def __init__(self, rate_window: float = PROGRESS_RATE_WINDOW, clock: T.Callable[[], float] = time.monotonic):
+        self._rate_window: float = rate_window
+        self._clock = clock
+        self._start_time: float = clock()
+        self._last_time: float = self._start_time
+        self._samples: deque = deque()
+        self._last_finished: deque = deque(maxlen=PROGRESS_FINISHED_EDGES)
+        self._listeners: list = list()
+        self._lock = threading.Lock()
+        self.finished: int = 0
+        self.total: int = 0
+        self.running: int = None
+
+    def add_listener(self, listener: T.Callable[[BuildProgress], None]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def attach(self, handle: ProcessHandle) -> 'NinjaProgressParser':
+        '''
+        this method feeds every stdout line of the process to the parser,
+        the lines read before it was attached too.
+        '''
+        handle.add_listener(self.feed, replay=True)
+        return self
+
+    def feed(self, line: str) -> BuildProgress:
+        '''
+        this method reads one output line and gives back the progress if
+        it was a status line, else None.
+        '''
+        match = _NINJA_STATUS_LINE.match(line.rstrip('\r\n'))
+        if match is None:
+            return None
+        now: float = self._clock()
+        with self._lock:
+            self.finished = int(match.group(1))
+            self.total = int(match.group(2))
+            self.running = int(match.group(3)) if match.group(3) is not None else None
+            if self._samples and self.finished < self._samples[-1][1]:
+                #
+                # Ninja starts counting again after Meson regenerated
+                # the build files.
+                self._samples.clear()
+            self._last_finished.append(match.group(4))
+            self._last_time = now
+            self._samples.append((now, self.finished))
+            while len(self._samples) > 2 and now - self._samples[0][0] > self._rate_window:
+                self._samples.popleft()
+            progress: BuildProgress = self._progress(now)
+            listeners: list = list(self._listeners)
+        for listener in listeners:
+            listener(progress)
+        return progress
+
+    def progress(self) -> BuildProgress:
+        with self._lock:
+            return self._progress(self._clock())
+
+    def _progress(self, now: float) -> BuildProgress:
+        rate: float = None
+        eta: float = None
+        if len(self._samples) > 1:
+            first_time, first_finished = self._samples[0]
+            last_time, last_finished = self._samples[-1]
+            if last_time > first_time:
+                rate = (last_finished - first_finished) / (last_time - first_time)
+        if rate:
+            eta = max(self.total - self.finished, 0) / rate
+        return BuildProgress(finished=self.finished, total=self.total, running=self.running, rate=rate, eta=eta,
+                             elapsed=now - self._start_time, idle=now - self._last_time,
+                             last_finished=list(self._last_finished))
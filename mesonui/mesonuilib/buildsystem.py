@@ -10,7 +10,6 @@
 from .mesonbuild.subprojects import MesonSubprojects
 from .mesonbuild.configure import MesonConfigure
 from .mesonbuild.install import MesonInstall
-from .mesonbuild.version import MesonVersion
 from .mesonbuild.compile import MesonCompile
 from .mesonbuild.setup import MesonSetup
 from .mesonbuild.clean import MesonClean
@@ -20,13 +19,14 @@ from .mesonbuild.wrap import MesonWrap
 from .mesonbuild.test import MesonTest
 
 from .ninjabuild.install import NinjaInstall
-from .ninjabuild.version import NinjaVersion
 from .ninjabuild.build import NinjaBuild
 from .ninjabuild.clean import NinjaClean
 from .ninjabuild.dist import NinjaDist
 from .ninjabuild.test import NinjaTest
 
-from .utilitylib import find_executables
+from .processrunner import ProcessHandle
+from .mesonengine import meson_engine
+from .utilitylib import tool_registry
 from os.path import join as join_paths
 from pathlib import Path
 import logging
@@ -39,7 +39,7 @@ class Meson:
     def __init__(self, sourcedir: Path = Path().cwd(), builddir: Path = join_paths(Path().cwd(), 'builddir')):
         super().__init__()
         self.name = 'Meson build'
-        self.exe = find_executables(['meson', 'meson.py'])
+        self.exe = tool_registry.path('meson')
         self._sourcedir = sourcedir
         self._builddir = builddir
     # end of method
@@ -60,18 +60,31 @@ class Meson:
     def builddir(self, new_dir: Path):
         self._builddir = new_dir
 
-    def version(self) -> MesonVersion:
+    def version(self) -> str:
         logging.info(f'Getting {self.name} version')
-        return MesonVersion().run()
+        #
+        # The warm worker answers without starting Meson again.
+        returncode, output, errors = meson_engine.run(['--version'])
+        if returncode != 0:
+            return tool_registry.version('meson')
+        return output.strip()
 
     def configure(self, args: list = []) -> MesonConfigure:
         logging.info(f'Configure {self.name} project')
         return MesonConfigure(self.builddir).run(args=args)
 
+    def configure_async(self, args: list = []) -> ProcessHandle:
+        logging.info(f'Configure {self.name} project in the background')
+        return MesonConfigure(self.builddir).start(args=args)
+
     def setup(self, args: list = []) -> MesonSetup:
         logging.info(f'Setting up new {self.name} project')
         return MesonSetup(self.sourcedir, self.builddir).run(args=args)
 
+    def setup_async(self, args: list = []) -> ProcessHandle:
+        logging.info(f'Setting up new {self.name} project in the background')
+        return MesonSetup(self.sourcedir, self.builddir).start(args=args)
+
     def subprojects(self) -> MesonSubprojects:
         logging.info(f'Getting {self.name} subproject commands')
         return MesonSubprojects(self.sourcedir)
@@ -80,6 +93,10 @@ class Meson:
         logging.info(f'Compile {self.name} project')
         return MesonCompile(self.builddir).run(args=args)
 
+    def compile_async(self, args: list = [], on_progress=None) -> ProcessHandle:
+        logging.info(f'Compile {self.name} project in the background')
+        return MesonCompile(self.builddir).start(args=args, on_progress=on_progress)
+
     def install(self, args: list = []) -> MesonInstall:
         logging.info(f'Install {self.name} project')
         return MesonInstall(self.builddir).run(args=args)
@@ -88,10 +105,18 @@ class Meson:
         logging.info(f'Build {self.name} project')
         return NinjaBuild(self.builddir).run()
 
+    def build_async(self, on_progress=None) -> ProcessHandle:
+        logging.info(f'Build {self.name} project in the background')
+        return NinjaBuild(self.builddir).start(on_progress=on_progress)
+
     def clean(self) -> MesonClean:
         logging.info(f'Clean {self.name} project')
         return MesonClean(self.builddir).run()
 
+    def clean_async(self) -> ProcessHandle:
+        logging.info(f'Clean {self.name} project in the background')
+        return MesonClean(self.builddir).start()
+
     def init(self, args: list = []) -> MesonInit:
         logging.info(f'Create new {self.name} project with: {args}')
         return MesonInit(self.sourcedir).run(args=args)
@@ -104,6 +129,10 @@ class Meson:
         logging.info(f'Test {self.name} project')
         return MesonTest(self.builddir).run()
 
+    def test_async(self) -> ProcessHandle:
+        logging.info(f'Test {self.name} project in the background')
+        return MesonTest(self.builddir).start()
+
     def wrap(self) -> MesonWrap:
         logging.info(f'Getting {self.name} wrap-tools commands')
         return MesonWrap()
@@ -115,7 +144,7 @@ class Ninja:
     '''
     def __init__(self, sourcedir: Path = Path().cwd(), builddir: Path = join_paths(Path().cwd(), 'builddir')):
         self.name = 'Ninja-build'
-        self.exe = find_executables(['ninja-build', 'ninja'])
+        self.exe = tool_registry.path('ninja')
         self._sourcedir = sourcedir
         self._builddir = builddir
 
@@ -135,9 +164,9 @@ class Ninja:
     def builddir(self, new_dir: Path):
         self._builddir = new_dir
 
-    def version(self) -> NinjaVersion:
+    def version(self) -> str:
         logging.info(f'Getting {self.name} version')
-        return NinjaVersion().run()
+        return tool_registry.version('ninja')
 
     def install(self, args: list = []) -> NinjaInstall:
         logging.info(f'Install {self.name} project')
@@ -147,10 +176,18 @@ class Ninja:
         logging.info(f'Build {self.name} project')
         return NinjaBuild(self.builddir).run()
 
+    def build_async(self, on_progress=None) -> ProcessHandle:
+        logging.info(f'Build {self.name} project in the background')
+        return NinjaBuild(self.builddir).start(on_progress=on_progress)
+
     def clean(self) -> NinjaClean:
         logging.info(f'Clean {self.name} project')
         return NinjaClean(self.builddir).run()
 
+    def clean_async(self) -> ProcessHandle:
+        logging.info(f'Clean {self.name} project in the background')
+        return NinjaClean(self.builddir).start()
+
     def dist(self, args: list = []) -> NinjaDist:
         logging.info(f'Dist new release with {self.name} project')
         return NinjaDist(self.builddir).run(args=args)
@@ -158,3 +195,7 @@ class Ninja:
     def test(self) -> NinjaTest:
         logging.info(f'Tests {self.name} project')
         return NinjaTest(self.builddir).run()
+
+    def test_async(self) -> ProcessHandle:
+        logging.info(f'Tests {self.name} project in the background')
+        return NinjaTest(self.builddir).start()
@@ -24,6 +24,7 @@ from .mapmeson import default_test
 from .mapmeson import default_dist
 from .mapmeson import default_init
 from .mapmeson import default_install
+from .utilitylib import MesonUiException
 
 import typing as T
 
@@ -35,6 +36,7 @@ class MesonUiCache:
         self._conf_test: MesonTestConfig = MesonTestConfig()
         self._conf_path: MesonPathConfig = MesonPathConfig()
         self._conf_backend: MesonBackendConfig = MesonBackendConfig()
+        self._conf_project: T.Dict = dict()
 
     def init_cache(self):
         self._init_cache_core()
@@ -78,6 +80,14 @@ class MesonUiCache:
     def configure_backend(self, option: T.AnyStr, value: T.AnyStr = ''):
         self._conf_backend.config(option=option, value=value)
 
+    def configure_project(self, option: T.AnyStr, value: T.AnyStr = ''):
+        #
+        # Compiler and project options have no fixed set of names, any
+        # option the build directory knows is taken as it is.
+        if option == '':
+            raise MesonUiException('Option key passed as empty string object')
+        self._conf_project[f'-D{option}'] = value
+
     def get_core(self) -> T.Dict[T.AnyStr, set]:
         return self._conf_core.extract()
 
@@ -93,6 +103,16 @@ class MesonUiCache:
     def get_backend(self) -> T.Dict[T.AnyStr, set]:
         return self._conf_backend.extract()
 
+    def get_project(self) -> T.Dict[T.AnyStr, set]:
+        return self._conf_project
+
+    def get_options(self) -> T.Dict[T.AnyStr, set]:
+        options: dict = dict()
+        for extracted in (self.get_core(), self.get_base(), self.get_test(), self.get_path(), self.get_backend(),
+                          self.get_project()):
+            options.update(extracted)
+        return options
+
 
 class MesonUiDistCache:
     def __init__(self):
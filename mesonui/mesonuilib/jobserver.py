@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from .utilitylib import tool_registry
+import tempfile
+import threading
+import atexit
+import logging
+import select
+import shutil
+import os
+import re
+
+#
+# Environment variable that sets how many jobs every build and test run
+# Meson-UI starts may run together, one per core when not set.
+JOBSERVER_BUDGET_ENV: str = 'MESONUI_JOBS'
+#
+# Environment variable "meson test" reads the number of tests it runs at
+# once from.
+MESON_TEST_THREADS_ENV: str = 'MESON_TESTTHREADS'
+#
+# First Ninja version that takes its job slots from a make jobserver
+# ("--jobserver-auth=fifo:PATH" in "MAKEFLAGS") when no "-j" is given.
+NINJA_JOBSERVER_VERSION: tuple = (1, 13)
+#
+# How often a process waiting for a slot checks whether it got cancelled.
+_POLL_INTERVAL: float = 0.1
+_TOKEN: bytes = b'+'
+
+
+def jobserver_budget() -> int:
+    '''
+    this function gives back how many jobs may run at once, taken from
+    "MESONUI_JOBS" or else the number of cores.
+    '''
+    value: str = os.environ.get(JOBSERVER_BUDGET_ENV, '')
+    if value.strip().isdigit() and int(value) > 0:
+        return int(value)
+    return os.cpu_count() or 1
+
+
+def version_tuple(version: str) -> tuple:
+    '''
+    this function turns the leading numbers of a version text ("1.13.2"
+    or "1.13.2.git.kitware") into a tuple that compares.
+    '''
+    found = re.match(r'^\s*(\d+(?:\.\d+)*)', version or '')
+    return tuple(int(part) for part in found.group(1).split('.')) if found else ()
+
+
+class JobServer:
+    '''
+    this class hands out job slots to every build and test process
+    Meson-UI runs, so all of them together never run more jobs than the
+    budget allows.
+
+    The slots are tokens in a named pipe, the same way GNU make shares
+    them, so a Ninja that knows the protocol takes and gives back tokens
+    for each edge on its own.  Every process holds one slot of its own
+    while it runs (the "implicit" slot of make), a process that can not
+    read the pipe is instead handed all the slots free at its start and
+    told to use that many with its "-j" flag.
+
+    A Ninja that gets killed can not give back the tokens it held, so
+    the pipe is filled up to the budget again whenever no process holds
+    a slot.  Where named pipes do not exist (Windows) the slots are only
+    counted in this process and every tool gets a "-j".
+    '''
+    def __init__(self, budget: int = None):
+        self.budget: int = max(1, budget if budget is not None else jobserver_budget())
+        self.fifo: str = None
+        self._fd: int = None
+        self._tempdir: str = None
+        self._free: int = self.budget
+        self._held: int = 0
+        self._condition = threading.Condition()
+        if hasattr(os, 'mkfifo'):
+            self._open_fifo()
+        logging.info(f'Jobserver with {self.budget} slots' + (f' at {self.fifo}' if self.fifo else ''))
+
+    def _open_fifo(self) -> None:
+        try:
+            self._tempdir = tempfile.mkdtemp(prefix='mesonui-jobserver-')
+            path: str = os.path.join(self._tempdir, 'fifo')
+            os.mkfifo(path, 0o600)
+            self._fd = os.open(path, os.O_RDWR | os.O_NONBLOCK)
+            os.write(self._fd, _TOKEN * self.budget)
+            self.fifo = path
+        except OSError as error:
+            logging.warning(f'Jobserver can not make its pipe, slots are only counted: {error}')
+            self.close()
+
+    def acquire(self, wanted: int = 1, cancelled: threading.Event = None) -> int:
+        '''
+        this method waits until a slot is free and then also takes up to
+        "wanted" minus one more that are free right away.  It gives back
+        how many slots it took, 0 if "cancelled" got set while waiting.
+        '''
+        while not self._take(_POLL_INTERVAL):
+            if cancelled is not None and cancelled.is_set():
+                return 0
+        taken: int = 1
+        while taken < min(wanted, self.budget) and self._take(0):
+            taken += 1
+        return taken
+
+    def try_acquire(self, wanted: int = 1) -> int:
+        '''
+        this method takes up to "wanted" slots without waiting, it gives
+        back how many it took (maybe none).
+        '''
+        taken: int = 0
+        while taken < min(wanted, self.budget) and self._take(0):
+            taken += 1
+        return taken
+
+    def release(self, count: int = 1) -> None:
+        if count <= 0:
+            return
+        with self._condition:
+            self._held = max(0, self._held - count)
+            if self._fd is None:
+                self._free += count
+                self._condition.notify_all()
+            elif self._held == 0:
+                self._refill()
+            else:
+                os.write(self._fd, _TOKEN * count)
+
+    @property
+    def held(self) -> int:
+        '''
+        the slots taken through this object and not given back yet, the
+        ones a Ninja took from the pipe on its own are not counted.
+        '''
+        with self._condition:
+            return self._held
+
+    def _take(self, timeout: float) -> bool:
+        if self._fd is None:
+            with self._condition:
+                if self._free == 0:
+                    self._condition.wait(timeout)
+                if self._free == 0:
+                    return False
+                self._free -= 1
+                self._held += 1
+                return True
+        #
+        # Ninja reads the same pipe, so a token seen by "select" may be
+        # gone by the time it is read.
+        if timeout and not select.select([self._fd], [], [], timeout)[0]:
+            return False
+        with self._condition:
+            try:
+                if len(os.read(self._fd, 1)) != 1:
+                    return False
+            except BlockingIOError:
+                return False
+            self._held += 1
+            return True
+
+    def _refill(self) -> None:
+        try:
+            while os.read(self._fd, self.budget):
+                pass
+        except BlockingIOError:
+            pass
+        os.write(self._fd, _TOKEN * self.budget)
+
+    def env(self, env: dict = None) -> dict:
+        '''
+        this method gives back a copy of the environment (of this process
+        if none given) that points make-style clients at the slots.
+        '''
+        env = dict(os.environ if env is None else env)
+        if self.fifo is not None:
+            env['MAKEFLAGS'] = f' -j{self.budget} --jobserver-auth=fifo:{self.fifo}'
+        else:
+            env.pop('MAKEFLAGS', None)
+        return env
+
+    def ninja_reads_fifo(self) -> bool:
+        '''
+        this method tells whether the Ninja found takes its slots from
+        the pipe, any other one needs to be given a "-j".
+        '''
+        if self.fifo is None:
+            return False
+        try:
+            return version_tuple(tool_registry.version('ninja')) >= NINJA_JOBSERVER_VERSION
+        except (RuntimeError, OSError):
+            return False
+
+    def ninja_jobs_arg(self) -> str:
+        '''
+        this method gives back the "-j" a Ninja (or "meson compile") run
+        is started with, None when Ninja reads the pipe on its own.
+        '''
+        return None if self.ninja_reads_fifo() else '-j{jobs}'
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+        if self._tempdir is not None:
+            shutil.rmtree(self._tempdir, ignore_errors=True)
+            self._tempdir = None
+        self.fifo = None
+
+    def __repr__(self) -> str:
+        return f'<JobServer budget={self.budget} fifo={self.fifo}>'
+
+
+#
+# Slots shared by every build and test process Meson-UI starts, made on
+# the first build or test run so importing this module leaves no pipe.
+_shared: JobServer = None
+_shared_lock = threading.Lock()
+
+
+def shared_jobserver() -> JobServer:
+    '''
+    this function gives back the job slots every build and test run
+    shares, they are made (and closed at exit) the first time asked for.
+    '''
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = JobServer()
+            atexit.register(_shared.close)
+        return _shared
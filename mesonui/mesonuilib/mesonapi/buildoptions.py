@@ -8,6 +8,7 @@
 # copyright 2020 The Meson-UI development team
 #
 from mesonui.mesonuilib.utilitylib import MesonUiException
+import bisect
 
 
 MESON_OPTION_TYPES = {
@@ -35,111 +36,171 @@ MESON_OPTION_MACHINE = {
 }
 
 
-class ComboBuildOption:
-    def __init__(self, info: any):
-        self.type = 'combo'
-        self.name = info['name']
+class MesonBuildOption:
+    '''
+    base class for all typed build options, each option is built once
+    when the option index is made and handed out as-is after that.
+    '''
+    __slots__ = ('type', 'name', 'value', 'section', 'machine', 'description', 'subproject')
+
+    def __init__(self, info: any, name: str = None, subproject: str = ''):
+        self.type = info['type']
+        self.name = info['name'] if name is None else name
         self.value = info['value']
         self.section = info['section']
         self.machine = info['machine']
         self.description = info['description']
-        self.choices = info['choices']
+        self.subproject = subproject
 
 
-class ArrayBuildOption:
-    def __init__(self, info: any):
-        self.type = 'array'
-        self.name = info['name']
-        self.value = info['value']
-        self.section = info['section']
-        self.machine = info['machine']
-        self.description = info['description']
+class ComboBuildOption(MesonBuildOption):
+    __slots__ = ('choices',)
 
+    def __init__(self, info: any, name: str = None, subproject: str = ''):
+        super().__init__(info, name, subproject)
+        self.choices = info['choices']
 
-class StringBuildOption:
-    def __init__(self, info: any):
-        self.type = 'string'
-        self.name = info['name']
-        self.value = info['value']
-        self.section = info['section']
-        self.machine = info['machine']
-        self.description = info['description']
 
+class ArrayBuildOption(MesonBuildOption):
+    __slots__ = ()
 
-class BooleanBuildOption:
-    def __init__(self, info: any):
-        self.type = 'boolean'
-        self.name = info['name']
-        self.value = info['value']
-        self.section = info['section']
-        self.machine = info['machine']
-        self.description = info['description']
 
+class StringBuildOption(MesonBuildOption):
+    __slots__ = ()
 
-class IntegerBuildOption:
-    def __init__(self, info: any):
-        self.type = 'integer'
-        self.name = info['name']
-        self.value = info['value']
-        self.section = info['section']
-        self.machine = info['machine']
-        self.description = info['description']
 
+class BooleanBuildOption(MesonBuildOption):
+    __slots__ = ()
 
-class BuildOption:
-    def __init__(self, meson_api):
-        self.options = meson_api.get_object(group='buildoptions', extract_method='loader')
 
-    def _find_option(self, name):
-        for option in self.options:
-            if option['name'] == name:
-                if not option['machine'] in MESON_OPTION_MACHINE:
-                    raise MesonUiException()
+class IntegerBuildOption(MesonBuildOption):
+    __slots__ = ()
 
-                if not option['section'] in MESON_OPTION_SECTION:
-                    raise MesonUiException()
 
-                if not option['type'] in MESON_OPTION_TYPES:
-                    raise MesonUiException()
-                return option
-        raise MesonUiException(f'Option {name} not found!')
+_OPTION_CLASSES: dict = {
+    'combo': ComboBuildOption,
+    'array': ArrayBuildOption,
+    'string': StringBuildOption,
+    'boolean': BooleanBuildOption,
+    'integer': IntegerBuildOption
+}
 
-    def combo(self, name: str) -> ComboBuildOption:
-        if not isinstance(name, str):
-            raise MesonUiException(f'Option has wrong type {type(name)} should be string!')
-        opt = self._find_option(name)
-        if opt['type'] != 'combo':
-            raise MesonUiException('Option has wrong type!')
-        return ComboBuildOption(opt)
 
-    def array(self, name: str) -> ArrayBuildOption:
-        if not isinstance(name, str):
-            raise MesonUiException(f'Option has wrong type {type(name)} should be string!')
-        opt = self._find_option(name)
-        if opt['type'] != 'array':
-            raise MesonUiException('Option has wrong type!')
-        return ArrayBuildOption(opt)
+def split_option_name(name: str, machine: str) -> tuple:
+    '''
+    this function splits a Meson option name like "sub:build.c_args" into
+    its plain name and subproject, ("c_args", "sub") for that example.
+    '''
+    subproject, _, plain = name.rpartition(':')
+    if machine == 'build' and plain.startswith('build.'):
+        plain = plain[len('build.'):]
+    return (plain, subproject)
 
-    def string(self, name: str) -> StringBuildOption:
-        if not isinstance(name, str):
-            raise MesonUiException(f'Option has wrong type {type(name)} should be string!')
-        opt = self._find_option(name)
-        if opt['type'] != 'string':
-            raise MesonUiException('Option has wrong type!')
-        return StringBuildOption(opt)
 
-    def integer(self, name: str) -> IntegerBuildOption:
-        if not isinstance(name, str):
-            raise MesonUiException(f'Option has wrong type {type(name)} should be string!')
-        opt = self._find_option(name)
-        if opt['type'] != 'integer':
-            raise MesonUiException('Option has wrong type!')
-        return IntegerBuildOption(opt)
+class BuildOption:
+    '''
+    this class gives typed access to the build options of a project, all
+    options are validated once and indexed by (name, machine, subproject),
+    by section, by subproject and by name (sorted, for prefix lookups).
+
+    An option can be asked for by its full Meson name too, like
+    "sub:c_args" or "build.c_args".
+    '''
+    def __init__(self, meson_api):
+        self.options = meson_api.get_object(group='buildoptions', extract_method='loader')
+        self._index: dict = {}
+        self._invalid: set = set()
+        self._sections: dict = {}
+        self._subprojects: dict = {}
+        self._names: list = []
+        self._by_position: list = []
+        self._build_index()
+
+    def _build_index(self) -> None:
+        for option in self.options or []:
+            name, subproject = split_option_name(option['name'], option['machine'])
+            key: tuple = (name, option['machine'], subproject)
+            if option['machine'] not in MESON_OPTION_MACHINE or \
+               option['section'] not in MESON_OPTION_SECTION or \
+               option['type'] not in MESON_OPTION_TYPES:
+                self._invalid.add(key)
+                continue
+            opt: MesonBuildOption = _OPTION_CLASSES[option['type']](option, name, subproject)
+            self._index[key] = opt
+        for opt in self._index.values():
+            self._sections.setdefault(opt.section, []).append(opt)
+            self._subprojects.setdefault(opt.subproject, []).append(opt)
+        self._by_position = list(self._index.values())
+        self._names = sorted((opt.name, position) for position, opt in enumerate(self._by_position))
+
+    def _find_option(self, name: str, machine: str = None, subproject: str = '') -> MesonBuildOption:
+        #
+        # A full Meson name carries its subproject and build machine.
+        if not subproject and ':' in name:
+            subproject, _, name = name.rpartition(':')
+        if name.startswith('build.') and machine in (None, 'build'):
+            name, machine = name[len('build.'):], 'build'
+        #
+        # Without a given machine we look for a machine independent option
+        # first and then for the host one, same as Meson does for "-D".
+        for mach in (('any', 'host') if machine is None else (machine,)):
+            key: tuple = (name, mach, subproject)
+            if key in self._invalid:
+                raise MesonUiException()
+            if key in self._index:
+                return self._index[key]
+        raise MesonUiException(f'Option {name} not found!')
 
-    def boolean(self, name: str) -> BooleanBuildOption:
+    def _typed_option(self, name: str, kind: str, machine: str = None, subproject: str = '') -> MesonBuildOption:
         if not isinstance(name, str):
             raise MesonUiException(f'Option has wrong type {type(name)} should be string!')
-        opt = self._find_option(name)
-        if opt['type'] != 'boolean':
+        opt = self._find_option(name, machine, subproject)
+        if opt.type != kind:
             raise MesonUiException('Option has wrong type!')
-        return BooleanBuildOption(opt)
+        return opt
+
+    def combo(self, name: str, machine: str = None, subproject: str = '') -> ComboBuildOption:
+        return self._typed_option(name, 'combo', machine, subproject)
+
+    def array(self, name: str, machine: str = None, subproject: str = '') -> ArrayBuildOption:
+        return self._typed_option(name, 'array', machine, subproject)
+
+    def string(self, name: str, machine: str = None, subproject: str = '') -> StringBuildOption:
+        return self._typed_option(name, 'string', machine, subproject)
+
+    def integer(self, name: str, machine: str = None, subproject: str = '') -> IntegerBuildOption:
+        return self._typed_option(name, 'integer', machine, subproject)
+
+    def boolean(self, name: str, machine: str = None, subproject: str = '') -> BooleanBuildOption:
+        return self._typed_option(name, 'boolean', machine, subproject)
+
+    def get(self, name: str, machine: str = None, subproject: str = '') -> MesonBuildOption:
+        '''
+        this method gives back an option of any type, or None if the
+        project has no such option.
+        '''
+        try:
+            return self._find_option(name, machine, subproject)
+        except MesonUiException:
+            return None
+
+    def all(self) -> list:
+        return list(self._index.values())
+
+    def by_section(self, section: str) -> list:
+        return list(self._sections.get(section, []))
+
+    def by_prefix(self, prefix: str) -> list:
+        #
+        # Names sharing a prefix sit next to each other in the sorted list,
+        # the result keeps the order the options were loaded in.
+        start: int = bisect.bisect_left(self._names, (prefix,))
+        positions: list = []
+        for name, position in self._names[start:]:
+            if not name.startswith(prefix):
+                break
+            positions.append(position)
+        return [self._by_position[position] for position in sorted(positions)]
+
+    def by_subproject(self, subproject: str = '') -> list:
+        return list(self._subprojects.get(subproject, []))
@@ -8,15 +8,35 @@
 # copyright 2020 The Meson-UI development team
 #
 from pathlib import Path
-import subprocess
+from ..processrunner import ProcessHandle
+from ..processrunner import default_runner
+from ..jobserver import shared_jobserver
+from ..jobserver import JobServer
+from ..buildprogress import NinjaProgressParser
+from ..buildprogress import ninja_status_env
+from ..utilitylib import tool_registry
 
 
 class MesonCompile:
     def __init__(self, builddir: Path):
         self._builddir: Path = builddir
 
-    def run(self, args: list = []):
-        run_cmd = ['meson', 'compile', '-C', str(self._builddir)]
+    def run(self, args: list = [], on_progress=None):
+        return self.start(args=args, on_progress=on_progress).communicate()
+
+    def start(self, args: list = [], on_progress=None) -> ProcessHandle:
+        run_cmd = tool_registry.command('meson', 'compile', '-C', str(self._builddir))
         run_cmd.extend(args)
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        #
+        # A "-j" of the caller wins, the run still holds one job slot.
+        jobserver: JobServer = shared_jobserver()
+        jobs_arg: str = jobserver.ninja_jobs_arg()
+        if any(str(arg).startswith(('-j', '--jobs')) for arg in args):
+            jobs_arg = None
+        handle: ProcessHandle = default_runner.start(run_cmd, env=ninja_status_env(), jobserver=jobserver,
+                                                     jobs_arg=jobs_arg)
+        if on_progress is not None:
+            parser: NinjaProgressParser = NinjaProgressParser()
+            parser.add_listener(on_progress)
+            parser.attach(handle)
+        return handle
@@ -8,7 +8,9 @@
 # copyright 2020 The Meson-UI development team
 #
 from pathlib import Path
-import subprocess
+from ..processrunner import ProcessHandle
+from ..processrunner import default_runner
+from ..utilitylib import tool_registry
 
 
 class MesonInstall:
@@ -16,7 +18,9 @@ class MesonInstall:
         self._builddir: Path = builddir
 
     def run(self, args: list = []):
-        run_cmd = ['meson', 'install', '-C', str(self._builddir)]
+        return self.start(args=args).communicate()
+
+    def start(self, args: list = []) -> ProcessHandle:
+        run_cmd = tool_registry.command('meson', 'install', '-C', str(self._builddir))
         run_cmd.extend(args)
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        return default_runner.start(run_cmd)
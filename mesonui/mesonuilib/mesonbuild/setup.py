@@ -8,7 +8,9 @@
 # copyright 2020 The Meson-UI development team
 #
 from pathlib import Path
-import subprocess
+from ..processrunner import ProcessHandle
+from ..processrunner import default_runner
+from ..utilitylib import tool_registry
 
 
 class MesonSetup:
@@ -18,8 +20,9 @@ class MesonSetup:
         super().__init__()
 
     def run(self, args: list = []):
-        run_cmd = ['meson', 'setup', str(self._sourcedir), str(self._builddir)]
-        run_cmd.extend(args)
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        return self.start(args=args).communicate()
 
-        return process.communicate()[0]
+    def start(self, args: list = []) -> ProcessHandle:
+        run_cmd = tool_registry.command('meson', 'setup', str(self._sourcedir), str(self._builddir))
+        run_cmd.extend(args)
+        return default_runner.start(run_cmd)
@@ -8,7 +8,8 @@
 # copyright 2020 The Meson-UI development team
 #
 from pathlib import Path
-import subprocess
+from ..processrunner import default_runner
+from ..utilitylib import tool_registry
 import logging
 
 
@@ -19,18 +20,15 @@ class MesonSubprojects:
 
     def update(self, subproject):
         logging.info(f'Update Subproject {subproject}')
-        run_cmd = ['meson', 'subprojects', 'update', subproject, '--sourcedir', str(self._sourcedir)]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        run_cmd = tool_registry.command('meson', 'subprojects', 'update', subproject, '--sourcedir', str(self._sourcedir))
+        return default_runner.run(run_cmd)
 
     def checkout(self, branch: str, subproject):
         logging.info(f'Checkout to {branch} in Subproject {subproject}')
-        run_cmd = ['meson', 'subprojects', 'checkout', branch, subproject, '--sourcedir', str(self._sourcedir)]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        run_cmd = tool_registry.command('meson', 'subprojects', 'checkout', branch, subproject, '--sourcedir', str(self._sourcedir))
+        return default_runner.run(run_cmd)
 
     def download(self, subproject):
         logging.info(f'Download Subproject {subproject}')
-        run_cmd = ['meson', 'subprojects', 'download', subproject, '--sourcedir', str(self._sourcedir)]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        run_cmd = tool_registry.command('meson', 'subprojects', 'download', subproject, '--sourcedir', str(self._sourcedir))
+        return default_runner.run(run_cmd)
@@ -8,7 +8,11 @@
 # copyright 2020 The Meson-UI development team
 #
 from pathlib import Path
-import subprocess
+from ..processrunner import ProcessHandle
+from ..processrunner import default_runner
+from ..jobserver import MESON_TEST_THREADS_ENV
+from ..jobserver import shared_jobserver
+from ..utilitylib import tool_registry
 
 
 class MesonTest:
@@ -17,6 +21,8 @@ class MesonTest:
         super().__init__()
 
     def run(self):
-        run_cmd = ['meson', 'test', '-C', str(self._builddir)]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        return self.start().communicate()
+
+    def start(self) -> ProcessHandle:
+        run_cmd = tool_registry.command('meson', 'test', '-C', str(self._builddir))
+        return default_runner.start(run_cmd, jobserver=shared_jobserver(), jobs_env=MESON_TEST_THREADS_ENV)
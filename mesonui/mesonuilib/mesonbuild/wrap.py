@@ -7,7 +7,8 @@
 #
 # copyright 2020 The Meson-UI development team
 #
-import subprocess
+from ..processrunner import default_runner
+from ..utilitylib import tool_registry
 
 
 class MesonWrap:
@@ -15,31 +16,25 @@ class MesonWrap:
         super().__init__()
 
     def update(self, wrap_args) -> None:
-        run_cmd = ['meson', 'wrap', 'update', wrap_args]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        run_cmd = tool_registry.command('meson', 'wrap', 'update', wrap_args)
+        return default_runner.run(run_cmd)
 
     def search(self, wrap_args) -> None:
-        run_cmd = ['meson', 'wrap', 'search', wrap_args]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        run_cmd = tool_registry.command('meson', 'wrap', 'search', wrap_args)
+        return default_runner.run(run_cmd)
 
     def info(self, wrap_args) -> None:
-        run_cmd = ['meson', 'wrap', 'info', wrap_args]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        run_cmd = tool_registry.command('meson', 'wrap', 'info', wrap_args)
+        return default_runner.run(run_cmd)
 
     def install(self, wrap_args) -> None:
-        run_cmd = ['meson', 'wrap', 'install', wrap_args]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        run_cmd = tool_registry.command('meson', 'wrap', 'install', wrap_args)
+        return default_runner.run(run_cmd)
 
     def list_wraps(self) -> None:
-        run_cmd = ['meson', 'wrap', 'list']
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        run_cmd = tool_registry.command('meson', 'wrap', 'list')
+        return default_runner.run(run_cmd)
 
     def status(self) -> None:
-        run_cmd = ['meson', 'wrap', 'status']
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        run_cmd = tool_registry.command('meson', 'wrap', 'status')
+        return default_runner.run(run_cmd)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from .processrunner import default_runner
+from .utilitylib import tool_registry
+from os.path import join as join_paths
+from os.path import dirname
+import subprocess
+import threading
+import logging
+import atexit
+import json
+import sys
+import os
+
+import typing as T
+
+#
+# Set to "0" to always start a new "meson" process.
+MESON_IN_PROCESS_ENV: str = 'MESONUI_IN_PROCESS'
+#
+# The worker runs with the script directory taken off "sys.path", else
+# "mesonuilib/mesonbuild" would hide the real "mesonbuild" package.
+_WORKER_BOOTSTRAP: str = 'import runpy, sys; del sys.path[0]; runpy.run_path(sys.argv[1], run_name="__main__")'
+_WORKER_SCRIPT: str = join_paths(dirname(__file__), 'mesonworker.py')
+#
+# Commands that only read and are run in the worker.  Anything else (like
+# "setup" or "configure") writes to a build directory and can leave state
+# behind in the "mesonbuild" modules, so it always gets its own process.
+_WORKER_COMMANDS: tuple = ('introspect', '--version')
+
+
+class MesonWorkerError(Exception):
+    '''Raised when the Meson worker process can not answer'''
+
+
+class MesonWorker:
+    '''
+    this class is the handle to one warm worker process, see
+    "mesonworker.py" for what it does.
+    '''
+    def __init__(self, python: str = sys.executable):
+        self._process = subprocess.Popen([python, '-c', _WORKER_BOOTSTRAP, _WORKER_SCRIPT],
+                                         stdin=subprocess.PIPE, stdout=subprocess.PIPE, encoding='utf-8')
+        hello: dict = self._read()
+        if 'version' not in hello:
+            self.close()
+            raise MesonWorkerError(hello.get('error', 'no version given'))
+        self.version: str = hello['version']
+
+    def _read(self) -> dict:
+        line: str = self._process.stdout.readline()
+        if not line:
+            raise MesonWorkerError(f'worker exited with {self._process.poll()}')
+        return json.loads(line)
+
+    def is_alive(self) -> bool:
+        return self._process.poll() is None
+
+    def call(self, args: list, cwd: str = None, stamp: T.Any = None) -> dict:
+        request: dict = {'args': args, 'cwd': cwd}
+        if stamp is not None:
+            request['stamp'] = stamp
+        try:
+            self._process.stdin.write(json.dumps(request) + '\n')
+            self._process.stdin.flush()
+        except (OSError, ValueError) as error:
+            raise MesonWorkerError(str(error))
+        return self._read()
+
+    def close(self) -> None:
+        if self.is_alive():
+            self._process.stdin.close()
+            try:
+                self._process.wait(5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process.stdout.close()
+
+
+class MesonEngine:
+    '''
+    this class runs Meson commands and gives back (returncode, stdout,
+    stderr).
+
+    When the "mesonbuild" package of the "meson" found on "PATH" can be
+    imported by this Python, "introspect" and "--version" run in one
+    worker process that stays warm for the whole session.  Every other
+    command, or any command when the worker fails, gets a new "meson"
+    process like before.  The worker is started again when "meson" on
+    "PATH" changes.
+    '''
+    def __init__(self, in_process: bool = None):
+        if in_process is None:
+            in_process = os.environ.get(MESON_IN_PROCESS_ENV, '1') != '0'
+        self.in_process: bool = in_process
+        self._worker: MesonWorker = None
+        self._worker_meson: str = None
+        self._lock = threading.Lock()
+
+    def _get_worker(self) -> MesonWorker:
+        meson: str = tool_registry.path('meson')
+        if self._worker is not None and (self._worker_meson != meson or not self._worker.is_alive()):
+            self._drop_worker()
+        if self._worker is None and self._worker_meson != meson:
+            #
+            # Only one try for each "meson" found, a failed start is not
+            # repeated for every command.
+            self._worker_meson = meson
+            try:
+                worker: MesonWorker = MesonWorker()
+            except (OSError, MesonWorkerError) as error:
+                logging.info(f'Meson worker not started, running Meson as a process: {error}')
+                return None
+            if worker.version != tool_registry.version('meson'):
+                logging.info(f'Meson worker has version {worker.version}, "{meson}" is used instead')
+                worker.close()
+                return None
+            logging.info(f'Meson {worker.version} worker started')
+            self._worker = worker
+        return self._worker
+
+    def _drop_worker(self) -> None:
+        if self._worker is not None:
+            self._worker.close()
+        self._worker = None
+        self._worker_meson = None
+
+    def run(self, args: list, cwd: str = None, stamp: T.Any = None) -> tuple:
+        '''
+        this method runs one Meson command line.  With a "stamp" the
+        worker keeps the answer and gives it back again for the same
+        command and stamp without running Meson.
+        '''
+        args = [str(arg) for arg in args]
+        if self.in_process and args and args[0] in _WORKER_COMMANDS:
+            with self._lock:
+                worker: MesonWorker = self._get_worker()
+                if worker is not None:
+                    try:
+                        answer: dict = worker.call(args, cwd=str(cwd) if cwd is not None else None, stamp=stamp)
+                        return (answer['returncode'], answer['stdout'], answer['stderr'])
+                    except MesonWorkerError as error:
+                        logging.warning(f'Meson worker failed, running Meson as a process: {error}')
+                        self._drop_worker()
+        handle = default_runner.start(tool_registry.command('meson', *args), cwd=cwd)
+        returncode: int = handle.wait()
+        return (returncode, handle.output(), handle.errors())
+
+    def close(self) -> None:
+        with self._lock:
+            self._drop_worker()
+
+
+class MesonEnginePool:
+    '''
+    this class keeps one engine, and so one warm worker, for each source
+    directory the script scanner reads.  Only the "size" most recently
+    used engines are kept, older ones are closed.
+    '''
+    def __init__(self, size: int = 4):
+        self.size: int = size
+        self._engines: dict = {}
+        self._lock = threading.Lock()
+
+    def engine(self, key: str) -> MesonEngine:
+        with self._lock:
+            engine: MesonEngine = self._engines.pop(key, None)
+            if engine is None:
+                engine = MesonEngine()
+            self._engines[key] = engine
+            while len(self._engines) > max(self.size, 1):
+                self._engines.pop(next(iter(self._engines))).close()
+            return engine
+
+    def keys(self) -> list:
+        with self._lock:
+            return list(self._engines)
+
+    def close(self) -> None:
+        with self._lock:
+            engines: list = list(self._engines.values())
+            self._engines.clear()
+        for engine in engines:
+            engine.close()
+
+
+#
+# Engine shared by the Meson wrappers and the build directory reader,
+# and the engines the script scanner keeps for each source directory.
+meson_engine: MesonEngine = MesonEngine()
+script_engines: MesonEnginePool = MesonEnginePool()
+atexit.register(meson_engine.close)
+atexit.register(script_engines.close)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+'''
+this script is the warm Meson worker process started by the Meson
+engine.  It imports "mesonbuild" once and then runs one Meson command
+line per request read from stdin, so no request pays for starting
+Python and importing Meson again.
+
+Only the standard library is used here, the script is run on its own
+without the "mesonui" package.  Requests and answers are "JSON" lines:
+
+    -> {"args": ["introspect", "--projectinfo", "builddir"], "cwd": "/project"}
+    <- {"returncode": 0, "stdout": "...", "stderr": "..."}
+
+The first line written is {"version": "..."} once Meson is imported,
+or {"error": "..."} if it can not be.
+
+A request may also carry a "stamp" (any JSON value, the Meson-UI side
+sends the stamps of the "meson.build" files).  A good answer is then
+kept, and the same request with the same stamp is answered from memory
+without Meson parsing the project again.
+'''
+import contextlib
+import json
+import sys
+import io
+import os
+
+import typing as T
+
+
+def _capture() -> io.TextIOWrapper:
+    return io.TextIOWrapper(io.BytesIO(), encoding='utf-8', errors='replace', write_through=True)
+
+
+def _run(mesonmain, request: dict) -> dict:
+    stdout: io.TextIOWrapper = _capture()
+    stderr: io.TextIOWrapper = _capture()
+    cwd: str = os.getcwd()
+    try:
+        if request.get('cwd'):
+            os.chdir(request['cwd'])
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                returncode: int = mesonmain.run(list(request['args']), 'meson')
+            except SystemExit as error:
+                returncode = error.code if isinstance(error.code, int) else 1
+            except Exception as error:
+                print(f'meson-ui worker: {type(error).__name__}: {error}', file=sys.stderr)
+                returncode = 1
+    finally:
+        os.chdir(cwd)
+    return {
+        'returncode': returncode,
+        'stdout': stdout.buffer.getvalue().decode('utf-8', 'replace'),
+        'stderr': stderr.buffer.getvalue().decode('utf-8', 'replace')
+    }
+
+
+def serve() -> None:
+    #
+    # The answers get their own copy of stdout, anything Meson writes to
+    # the real stdout outside of a request ends up on stderr instead.
+    protocol = os.fdopen(os.dup(sys.stdout.fileno()), 'w', encoding='utf-8')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    try:
+        from mesonbuild import mesonmain
+        from mesonbuild import coredata
+    except Exception as error:
+        protocol.write(json.dumps({'error': f'{type(error).__name__}: {error}'}) + '\n')
+        protocol.flush()
+        return
+    protocol.write(json.dumps({'version': coredata.version}) + '\n')
+    protocol.flush()
+
+    answers: dict = {}
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        request: dict = json.loads(line)
+        stamp: T.Any = request.get('stamp')
+        key: str = json.dumps([request['args'], request.get('cwd')])
+        if stamp is not None and key in answers and answers[key][0] == stamp:
+            answer: dict = answers[key][1]
+        else:
+            answer = _run(mesonmain, request)
+            if stamp is not None and answer['returncode'] == 0:
+                answers[key] = (stamp, answer)
+        protocol.write(json.dumps(answer) + '\n')
+        protocol.flush()
+
+
+if __name__ == '__main__':
+    serve()
@@ -8,7 +8,13 @@
 # copyright 2020 The Meson-UI development team
 #
 from pathlib import Path
-import subprocess
+from ..processrunner import ProcessHandle
+from ..processrunner import default_runner
+from ..jobserver import shared_jobserver
+from ..jobserver import JobServer
+from ..buildprogress import NinjaProgressParser
+from ..buildprogress import ninja_status_env
+from ..utilitylib import tool_registry
 
 
 class NinjaBuild:
@@ -16,7 +22,16 @@ class NinjaBuild:
         self._builddir: Path = builddir
         super().__init__()
 
-    def run(self):
-        run_cmd: list = ['ninja', '-C', str(self._builddir)]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+    def run(self, on_progress=None):
+        return self.start(on_progress=on_progress).communicate()
+
+    def start(self, on_progress=None) -> ProcessHandle:
+        run_cmd: list = tool_registry.command('ninja', '-C', str(self._builddir))
+        jobserver: JobServer = shared_jobserver()
+        handle: ProcessHandle = default_runner.start(run_cmd, env=ninja_status_env(), jobserver=jobserver,
+                                                     jobs_arg=jobserver.ninja_jobs_arg())
+        if on_progress is not None:
+            parser: NinjaProgressParser = NinjaProgressParser()
+            parser.add_listener(on_progress)
+            parser.attach(handle)
+        return handle
@@ -8,7 +8,9 @@
 # copyright 2020 The Meson-UI development team
 #
 from pathlib import Path
-import subprocess
+from ..processrunner import ProcessHandle
+from ..processrunner import default_runner
+from ..utilitylib import tool_registry
 
 
 class NinjaClean:
@@ -17,6 +19,8 @@ class NinjaClean:
         super().__init__()
 
     def run(self):
-        run_cmd = ['ninja', 'clean', '-C', str(self._builddir)]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        return self.start().communicate()
+
+    def start(self) -> ProcessHandle:
+        run_cmd = tool_registry.command('ninja', 'clean', '-C', str(self._builddir))
+        return default_runner.start(run_cmd)
@@ -8,7 +8,12 @@
 # copyright 2020 The Meson-UI development team
 #
 from pathlib import Path
-import subprocess
+from ..processrunner import ProcessHandle
+from ..processrunner import default_runner
+from ..jobserver import MESON_TEST_THREADS_ENV
+from ..jobserver import shared_jobserver
+from ..jobserver import JobServer
+from ..utilitylib import tool_registry
 
 
 class NinjaTest:
@@ -17,6 +22,10 @@ class NinjaTest:
         super().__init__()
 
     def run(self):
-        run_cmd = ['ninja', 'test', '-C', str(self._builddir)]
-        process = subprocess.Popen(run_cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return process.communicate()[0]
+        return self.start().communicate()
+
+    def start(self) -> ProcessHandle:
+        run_cmd = tool_registry.command('ninja', 'test', '-C', str(self._builddir))
+        jobserver: JobServer = shared_jobserver()
+        return default_runner.start(run_cmd, jobserver=jobserver, jobs_arg=jobserver.ninja_jobs_arg(),
+                                    jobs_env=MESON_TEST_THREADS_ENV)
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+import logging
+
+#
+# Options "meson configure" refuses to change once a build directory is
+# set up, changing one of them needs "meson setup --wipe".
+WIPE_OPTIONS: tuple = ('backend',)
+#
+# Dialog options that are named differently by Meson.
+_OPTION_NAMES: dict = {
+    'warnlevel': 'warning_level'
+}
+#
+# Values an array option (like "b_sanitize") shows when it holds nothing.
+_EMPTY_VALUES: tuple = ('', 'none')
+
+
+def option_name(flag: str) -> str:
+    '''
+    this function turns a dialog flag ("--buildtype", "-Db_lto") into the
+    name Meson gives the option in "intro-buildoptions.json".
+    '''
+    if flag.startswith('-D'):
+        return flag[2:]
+    name: str = flag[2:] if flag.startswith('--') else flag
+    return _OPTION_NAMES.get(name, name.replace('-', '_'))
+
+
+def option_value(value: any) -> str:
+    '''
+    this function turns an introspected option value into the text the
+    dialogs use for it.
+    '''
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, list):
+        return ','.join(str(item) for item in value)
+    return str(value)
+
+
+class OptionDelta:
+    '''
+    this class compares the options set in a dialog against the options
+    of an already configured build directory.  Only the options that
+    differ are handed to "meson configure", a full "meson setup --wipe"
+    (throwing away every object built) is only asked for when one of the
+    "WIPE_OPTIONS" changed.
+
+    Options the build directory does not know (like "b_vscrt" on Linux
+    or "--fatal-meson-warnings" which is not an option at all) are left
+    out.
+    '''
+    def __init__(self, wanted: dict, buildoptions: list):
+        self.current: dict = {}
+        self.wanted: dict = {}
+        self.changed: dict = {}
+        self.unknown: list = []
+        for option in buildoptions or []:
+            self.current[option['name']] = option_value(option['value'])
+        for flag, value in wanted.items():
+            name: str = option_name(flag)
+            if name not in self.current:
+                self.unknown.append(flag)
+                continue
+            self.wanted[name] = str(value)
+            if not self._same(self.current[name], self.wanted[name]):
+                self.changed[name] = self.wanted[name]
+        if self.unknown:
+            logging.debug(f'Options not known by the build directory: {self.unknown}')
+
+    @staticmethod
+    def _same(current: str, wanted: str) -> bool:
+        if current in _EMPTY_VALUES and wanted in _EMPTY_VALUES:
+            return True
+        return current.split(',') == [item.strip() for item in wanted.split(',')]
+
+    @staticmethod
+    def from_api(meson_api, wanted: dict) -> 'OptionDelta':
+        '''
+        this method compares against the build directory of the given
+        API, it gives back None when there is no configured build
+        directory to compare against.
+        '''
+        if not meson_api.state().has_intro_files:
+            return None
+        buildoptions: list = meson_api.get_object(group='buildoptions', extract_method='loader')
+        if not buildoptions:
+            return None
+        return OptionDelta(wanted, buildoptions)
+
+    @property
+    def needs_wipe(self) -> bool:
+        return any(name in self.changed for name in WIPE_OPTIONS)
+
+    def is_empty(self) -> bool:
+        return len(self.changed) == 0
+
+    def configure_args(self) -> list:
+        '''
+        this method gives back the "meson configure" arguments that set
+        only the options that changed.
+        '''
+        return [f'-D{name}={value}' for name, value in self.changed.items()]
+
+    def setup_args(self) -> list:
+        '''
+        this method gives back the "meson setup" arguments that wipe the
+        build directory and set it up again with every known option.
+        '''
+        return ['--wipe'] + [f'-D{name}={value}' for name, value in self.wanted.items()]
+
+    def __repr__(self) -> str:
+        return f'<OptionDelta changed={self.changed} wipe={self.needs_wipe}>'
@@ -7,10 +7,29 @@
 #
 # copyright 2020 The Meson-UI development team
 #
+from PyQt5.QtCore import QTimer
+from .processrunner import ProcessHandle
+
+#
+# Lines pushed by a running process are collected and drawn once per
+# frame (in ms), and the console only keeps the last max lines.
+CONSOLE_FRAME_INTERVAL: int = 16
+CONSOLE_MAX_LINES: int = 10000
+
 
 class OutputConsole:
-    def __init__(self, context=None):
+    def __init__(self, context=None, max_lines: int = CONSOLE_MAX_LINES):
         self._context = context
+        self._watched: list = list()
+        self.set_max_lines(max_lines)
+
+    def set_max_lines(self, max_lines: int) -> None:
+        '''
+        this method sets how many lines the console keeps, older lines
+        are dropped from the top.
+        '''
+        self._max_lines: int = max_lines
+        self._context.output_console.setMaximumBlockCount(max_lines)
 
     def append_line(self, text: str) -> None:
         if text == '':
@@ -24,3 +43,55 @@ class OutputConsole:
     def command_run(self, text: str):
         self._context.output_console.setPlainText(text)
         self.append_line(text)
+
+    def command_stream(self, lines: list) -> None:
+        '''
+        this method adds a batch of lines at the end of the console with
+        a single layout pass.
+        '''
+        if not lines:
+            return
+        lines = lines[-self._max_lines:]
+        self._context.output_console.appendPlainText(''.join(lines).rstrip('\n'))
+        self._context.output_console.ensureCursorVisible()
+
+    def command_start(self, handle: ProcessHandle, on_finished=None) -> None:
+        '''
+        this method streams the output of a process running in the background
+        into the console, and calls "on_finished" with the handle once the
+        process is done.  Lines are picked up once per frame from a timer so
+        the GUI thread never blocks.
+        '''
+        handle.limit_output(self._max_lines)
+        self.command_run(f'Running: {" ".join(handle.cmd)}')
+        timer: QTimer = QTimer(self._context)
+        self._watched.append(timer)
+        shown: list = [0]
+
+        def poll():
+            running: bool = handle.is_running()
+            lines: list = handle.take_lines()
+            #
+            # Lines the process wrote faster than they were drawn were
+            # dropped from its buffer, say so where they would have been.
+            dropped: int = handle.dropped_lines - shown[0]
+            if dropped > 0:
+                shown[0] += dropped
+                self.command_stream([f'... {dropped} lines dropped'])
+            self.command_stream(lines)
+            if running:
+                return
+            timer.stop()
+            self._watched.remove(timer)
+            finished: str = f'Finished with exit code {handle.returncode} in {handle.elapsed:.2f}s'
+            if shown[0]:
+                finished += f', {shown[0]} lines dropped'
+            self.command_stream([finished])
+            if on_finished is not None:
+                on_finished(handle)
+
+        timer.timeout.connect(poll)
+        timer.start(CONSOLE_FRAME_INTERVAL)
+
+    def is_busy(self) -> bool:
+        return len(self._watched) != 0
@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from collections import deque
+import subprocess
+import threading
+import logging
+import time
+
+import typing as T
+
+
+class _ReplayGate:
+    '''
+    this class holds back the lines meant for a listener until the lines
+    read before it was added have been replayed to it.
+    '''
+    def __init__(self, listener: T.Callable[[str], None]):
+        self._listener = listener
+        self._held: deque = deque()
+        self._is_open: bool = False
+        self._lock = threading.Lock()
+
+    def __call__(self, line: str) -> None:
+        with self._lock:
+            if not self._is_open:
+                self._held.append(line)
+                return
+        self._listener(line)
+
+    def open(self) -> None:
+        while True:
+            with self._lock:
+                if not self._held:
+                    self._is_open = True
+                    return
+                line: str = self._held.popleft()
+            self._listener(line)
+
+
+class ProcessHandle:
+    '''
+    this class is a handle to a process started by the ProcessRunner.
+
+    The process output is read on background threads, so nothing here
+    blocks unless "wait" or "communicate" is called.  Listeners get every
+    stdout line as soon as it is read, GUI code can instead poll for new
+    lines (stdout and stderr) with "take_lines" from its own thread.
+
+    By default all output is kept, "max_lines" (or "limit_output") turns
+    the buffers into ring buffers so a huge build log does not grow memory
+    without bound.
+
+    With a "jobserver" the process only starts once it holds a job slot,
+    it waits on its own thread if none is free.  A process told how many
+    jobs to run with "jobs_arg" (a format like "-j{jobs}") or "jobs_env"
+    (an environment variable) is handed every slot free at its start, any
+    other one gets the jobserver in its environment and holds one slot.
+    The slots are given back as soon as the process exits.
+    '''
+    def __init__(self, cmd: list, cwd: str = None, env: dict = None, max_lines: int = None, jobserver=None,
+                 jobs_arg: str = None, jobs_env: str = None):
+        self.cmd: list = [str(arg) for arg in cmd]
+        self.returncode: int = None
+        self.cancelled: bool = False
+        self.dropped_lines: int = 0
+        self.slots: int = 0
+        self._stdout: deque = deque(maxlen=max_lines)
+        self._stderr: deque = deque(maxlen=max_lines)
+        self._pending: deque = deque(maxlen=max_lines)
+        self._listeners: list = list()
+        self._done_callbacks: list = list()
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._cancel = threading.Event()
+        self._process: subprocess.Popen = None
+        self._jobserver = jobserver
+        self._jobs_arg: str = jobs_arg
+        self._jobs_env: str = jobs_env
+        self._start_time: float = None
+        self._end_time: float = None
+
+        if jobserver is None:
+            self._launch(cwd, env)
+            return
+        self.slots = jobserver.try_acquire(self._slots_wanted())
+        if self.slots == 0:
+            logging.info(f'Waiting for a job slot: {" ".join(self.cmd)}')
+            threading.Thread(target=self._wait_for_slot, args=(cwd, env), daemon=True).start()
+            return
+        try:
+            self._launch(cwd, env)
+        except OSError:
+            self._release_slots()
+            raise
+
+    def _slots_wanted(self) -> int:
+        if self._jobs_arg is None and self._jobs_env is None:
+            return 1
+        return self._jobserver.budget
+
+    def _wait_for_slot(self, cwd: str, env: dict) -> None:
+        self.slots = self._jobserver.acquire(self._slots_wanted(), cancelled=self._cancel)
+        if self.slots == 0 or self._cancel.is_set():
+            self._finish(-1)
+            return
+        try:
+            self._launch(cwd, env)
+        except OSError as error:
+            logging.warning(f'Can not start process {" ".join(self.cmd)}: {error}')
+            with self._lock:
+                self._stderr.append(f'{error}\n')
+                self._push_pending(f'{error}\n')
+            self._finish(-1)
+
+    def _launch(self, cwd: str, env: dict) -> None:
+        if self._jobserver is not None:
+            env = self._jobserver.env(env)
+            if self._jobs_arg is not None:
+                self.cmd.append(self._jobs_arg.format(jobs=self.slots))
+            if self._jobs_env is not None:
+                env[self._jobs_env] = str(self.slots)
+        logging.info(f'Start process: {" ".join(self.cmd)}')
+        process: subprocess.Popen = subprocess.Popen(self.cmd, cwd=cwd, env=env, encoding='utf8', errors='replace',
+                                                     stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        with self._lock:
+            self._process = process
+            self._start_time = time.monotonic()
+        self._readers: list = [
+            threading.Thread(target=self._read_stdout, daemon=True),
+            threading.Thread(target=self._read_stderr, daemon=True)
+        ]
+        for reader in self._readers:
+            reader.start()
+        threading.Thread(target=self._wait_for_exit, daemon=True).start()
+        if self._cancel.is_set():
+            process.terminate()
+
+    def _read_stdout(self) -> None:
+        for line in iter(self._process.stdout.readline, ''):
+            with self._lock:
+                self._stdout.append(line)
+                self._push_pending(line)
+                listeners: list = list(self._listeners)
+            for listener in listeners:
+                listener(line)
+        self._process.stdout.close()
+
+    def _read_stderr(self) -> None:
+        for line in iter(self._process.stderr.readline, ''):
+            with self._lock:
+                self._stderr.append(line)
+                self._push_pending(line)
+        self._process.stderr.close()
+
+    def _push_pending(self, line: str) -> None:
+        if len(self._pending) == self._pending.maxlen:
+            self.dropped_lines += 1
+        self._pending.append(line)
+
+    def _wait_for_exit(self) -> None:
+        for reader in self._readers:
+            reader.join()
+        self._finish(self._process.wait())
+
+    def _finish(self, returncode: int) -> None:
+        #
+        # The slots go back before the callbacks run, a callback that
+        # starts the next process finds them free.
+        self._release_slots()
+        with self._lock:
+            self.returncode = returncode
+            self._end_time = time.monotonic()
+            callbacks: list = list(self._done_callbacks)
+        logging.info(f'Process finished with {returncode} after {self.elapsed:.2f}s: {" ".join(self.cmd)}')
+        self._done.set()
+        for callback in callbacks:
+            callback(self)
+
+    def _release_slots(self) -> None:
+        with self._lock:
+            slots: int = self.slots
+            self.slots = 0
+        if self._jobserver is not None:
+            self._jobserver.release(slots)
+
+    def add_listener(self, listener: T.Callable[[str], None], replay: bool = False) -> None:
+        '''
+        this method adds a callback that gets each stdout line, it is
+        called on the reader thread.  With "replay" it first gets the
+        stdout lines read before it was added.
+        '''
+        if not replay:
+            with self._lock:
+                self._listeners.append(listener)
+            return
+        #
+        # The listener is called without holding the lock, so it may call
+        # back into the handle.  Lines read while the old ones are being
+        # replayed wait in the gate and follow them in order.
+        gate: _ReplayGate = _ReplayGate(listener)
+        with self._lock:
+            lines: list = list(self._stdout)
+            self._listeners.append(gate)
+        for line in lines:
+            listener(line)
+        gate.open()
+
+    def add_done_callback(self, callback: T.Callable[['ProcessHandle'], None]) -> None:
+        '''
+        this method adds a callback run once the process has exited, it is
+        called right away if the process is already done.
+        '''
+        with self._lock:
+            if not self._done.is_set():
+                self._done_callbacks.append(callback)
+                return
+        callback(self)
+
+    def limit_output(self, max_lines: int) -> None:
+        '''
+        this method keeps only the last "max_lines" lines of each stream
+        and of the lines not taken yet, older lines are dropped.
+        '''
+        with self._lock:
+            self.dropped_lines += max(0, len(self._pending) - max_lines)
+            self._stdout = deque(self._stdout, maxlen=max_lines)
+            self._stderr = deque(self._stderr, maxlen=max_lines)
+            self._pending = deque(self._pending, maxlen=max_lines)
+
+    def take_lines(self) -> list:
+        '''
+        this method hands back the output lines read since the last call.
+        '''
+        with self._lock:
+            lines: list = list(self._pending)
+            self._pending.clear()
+        return lines
+
+    def is_running(self) -> bool:
+        return not self._done.is_set()
+
+    def wait(self, timeout: float = None) -> int:
+        self._done.wait(timeout)
+        return self.returncode
+
+    def cancel(self, grace: float = 3.0) -> None:
+        '''
+        this method stops the process, first nicely and after the grace
+        time by killing it.
+        '''
+        if not self.is_running():
+            return
+        logging.info(f'Cancel process: {" ".join(self.cmd)}')
+        self.cancelled = True
+        self._cancel.set()
+        with self._lock:
+            process: subprocess.Popen = self._process
+        if process is None:
+            self._done.wait(grace)
+            return
+        process.terminate()
+        if not self._done.wait(grace):
+            process.kill()
+
+    def is_waiting(self) -> bool:
+        '''
+        this method tells whether the process still waits for a job slot.
+        '''
+        with self._lock:
+            return self._process is None and not self._done.is_set()
+
+    @property
+    def pid(self) -> int:
+        with self._lock:
+            return self._process.pid if self._process is not None else None
+
+    @property
+    def elapsed(self) -> float:
+        '''
+        wall time in seconds since the process started, up to now if it is
+        still running.  It is 0 while the process waits for a job slot.
+        '''
+        with self._lock:
+            start_time: float = self._start_time
+            end_time: float = self._end_time if self._end_time is not None else time.monotonic()
+        if start_time is None:
+            return 0.0
+        return end_time - start_time
+
+    def output(self) -> str:
+        with self._lock:
+            return ''.join(self._stdout)
+
+    def errors(self) -> str:
+        with self._lock:
+            return ''.join(self._stderr)
+
+    def communicate(self) -> str:
+        '''
+        this method waits for the process and gives back its stdout, the
+        same way "Popen.communicate()[0]" did.
+        '''
+        self.wait()
+        return self.output()
+
+
+class ProcessRunner:
+    '''
+    this class starts every Meson and Ninja process Meson-UI runs and
+    keeps track of the ones still running.
+    '''
+    def __init__(self):
+        self._handles: list = list()
+        self._lock = threading.Lock()
+
+    def start(self, cmd: list, cwd: str = None, env: dict = None, max_lines: int = None, jobserver=None,
+              jobs_arg: str = None, jobs_env: str = None) -> ProcessHandle:
+        handle: ProcessHandle = ProcessHandle(cmd, cwd=cwd, env=env, max_lines=max_lines, jobserver=jobserver,
+                                              jobs_arg=jobs_arg, jobs_env=jobs_env)
+        with self._lock:
+            self._handles.append(handle)
+        handle.add_done_callback(self._forget)
+        return handle
+
+    def run(self, cmd: list, cwd: str = None, env: dict = None) -> str:
+        return self.start(cmd, cwd=cwd, env=env).communicate()
+
+    def running(self) -> list:
+        with self._lock:
+            return list(self._handles)
+
+    def cancel_all(self) -> None:
+        for handle in self.running():
+            handle.cancel()
+
+    def _forget(self, handle: ProcessHandle) -> None:
+        with self._lock:
+            if handle in self._handles:
+                self._handles.remove(handle)
+
+
+#
+# Runner shared by all Meson and Ninja wrapper classes.
+default_runner: ProcessRunner = ProcessRunner()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from .utilitylib import MesonUiException
+from pathlib import Path
+import json
+
+#
+# Setup profiles are named sets of Meson options handed to "meson setup"
+# as "-D" arguments.  Any other profile can be given as a "JSON" file
+# holding an object of option names and values.
+SETUP_PROFILES: dict = {
+    'debug': {'buildtype': 'debug'},
+    'debugoptimized': {'buildtype': 'debugoptimized'},
+    'release': {'buildtype': 'release', 'b_ndebug': 'if-release'},
+    'minsize': {'buildtype': 'minsize', 'b_ndebug': 'true'},
+    'coverage': {'buildtype': 'debug', 'b_coverage': 'true'},
+    'sanitize': {'buildtype': 'debug', 'b_sanitize': 'address,undefined'},
+    'asan': {'buildtype': 'debug', 'b_sanitize': 'address'},
+    'tsan': {'buildtype': 'debug', 'b_sanitize': 'thread'},
+    'lto': {'buildtype': 'release', 'b_ndebug': 'if-release', 'b_lto': 'true'},
+}
+
+
+def load_profile(profile: str) -> dict:
+    '''
+    this function gives back the options of a built in profile, or the
+    ones stored in the given "JSON" file.
+    '''
+    if profile in SETUP_PROFILES:
+        return dict(SETUP_PROFILES[profile])
+    if not Path(profile).is_file():
+        raise MesonUiException(f'Setup profile {profile} not found, use one of {sorted(SETUP_PROFILES)} or a file')
+    with open(profile) as profile_file:
+        try:
+            options: any = json.load(profile_file)
+        except ValueError as error:
+            raise MesonUiException(f'Setup profile {profile} is not valid "JSON": {error}')
+    if not isinstance(options, dict):
+        raise MesonUiException(f'Setup profile {profile} must hold an object of option values')
+    return options
+
+
+def profile_args(options: dict) -> list:
+    '''
+    this function turns option values into "-D" arguments, lists and
+    booleans are written the way Meson reads them.
+    '''
+    args: list = list()
+    for name, value in options.items():
+        if isinstance(value, bool):
+            value = 'true' if value else 'false'
+        elif isinstance(value, (list, tuple)):
+            value = ','.join(str(item) for item in value)
+        args.append(f'-D{name}={value}')
+    return args
@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from .optiondelta import OptionDelta
+from .optiondelta import option_value
+from .processrunner import ProcessHandle
+from .buildsystem import Meson
+from ..repository.mesonapi import MesonAPI
+from os.path import join as join_paths
+from collections import deque
+import threading
+import logging
+import time
+import os
+
+import typing as T
+
+#
+# Build directories of a matrix are made in the source directory, each
+# one named after its profile.
+MATRIX_BUILDDIR: str = 'builddir-{profile}'
+#
+# States a profile of the matrix goes through, the last four are final.
+MATRIX_WAITING: str = 'waiting'
+MATRIX_RUNNING: str = 'running'
+MATRIX_DONE: str = 'done'
+MATRIX_UNCHANGED: str = 'unchanged'
+MATRIX_FAILED: str = 'failed'
+MATRIX_CANCELLED: str = 'cancelled'
+
+
+def matrix_jobs(profiles: int) -> int:
+    '''
+    this function gives back how many Meson runs of a matrix go at the
+    same time, one per core but never more than there are profiles.
+    '''
+    return max(1, min(profiles, os.cpu_count() or 1))
+
+
+class MatrixEntry:
+    '''
+    this class is one profile of a setup matrix and the state of its run,
+    "command" tells whether Meson had to "setup" or only to "configure"
+    the build directory.
+    '''
+    def __init__(self, profile: str, builddir: str, options: dict):
+        self.profile: str = profile
+        self.builddir: str = builddir
+        self.options: dict = options
+        self.status = MATRIX_WAITING
+        self.command: str = None
+        self.handle: ProcessHandle = None
+        self.returncode: int = None
+        self.elapsed: float = None
+        self.error: str = ''
+
+    @property
+    def is_final(self) -> bool:
+        return self.status not in (MATRIX_WAITING, MATRIX_RUNNING)
+
+    def errors(self) -> str:
+        if self.handle is not None:
+            return self.handle.errors() or self.handle.output()
+        return self.error
+
+    def __repr__(self) -> str:
+        return f'<MatrixEntry {self.profile} {self.status} {self.builddir}>'
+
+
+class SetupMatrix:
+    '''
+    this class sets up one build directory for each profile (a dict of
+    option values).  The Meson runs go at the same time, at most "jobs"
+    of them, and the next profile starts as soon as one is done.  That
+    happens on the reader thread of the process that finished, and the
+    first ones (which read the build directories) on a thread of their
+    own, so "start" never waits for Meson.
+
+    A build directory that is set up already only gets the options that
+    differ passed to "meson configure", and is left alone when none do.
+
+    Listeners get an entry every time its status changes, on whichever
+    thread changed it.
+    '''
+    def __init__(self, sourcedir, profiles: dict, jobs: int = None, builddir_root=None):
+        self.sourcedir: str = str(sourcedir)
+        root: str = self.sourcedir if builddir_root is None else str(builddir_root)
+        self.entries: list = [
+            MatrixEntry(name, join_paths(root, MATRIX_BUILDDIR.format(profile=name)), dict(options))
+            for name, options in profiles.items()
+        ]
+        self.jobs: int = jobs if jobs is not None else matrix_jobs(len(self.entries))
+        self.cancelled: bool = False
+        self._waiting: deque = deque(self.entries)
+        self._listeners: list = list()
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._start_time: float = None
+        self._end_time: float = None
+
+    def add_listener(self, listener: T.Callable[[MatrixEntry], None]) -> None:
+        with self._lock:
+            self._listeners.append(listener)
+
+    def start(self) -> 'SetupMatrix':
+        logging.info(f'Setup matrix of {len(self.entries)} profiles, {self.jobs} at a time')
+        self._start_time = time.monotonic()
+        if not self.entries:
+            self._finish()
+            return self
+        threading.Thread(target=self._first, name='setup-matrix', daemon=True).start()
+        return self
+
+    def _first(self) -> None:
+        for count in range(max(1, self.jobs)):
+            self._next()
+
+    def wait(self, timeout: float = None) -> bool:
+        return self._done.wait(timeout)
+
+    def is_running(self) -> bool:
+        return self._start_time is not None and not self._done.is_set()
+
+    def cancel(self) -> None:
+        '''
+        this method drops the profiles not started yet and stops the Meson
+        runs still going.
+        '''
+        with self._lock:
+            self.cancelled = True
+            dropped: list = list(self._waiting)
+            self._waiting.clear()
+            #
+            # A profile still being read has no process yet, "_launch"
+            # stops it once it has.
+            handles: list = [entry.handle for entry in self.entries
+                             if entry.status == MATRIX_RUNNING and entry.handle is not None]
+        for entry in dropped:
+            self._update(entry, MATRIX_CANCELLED)
+        for handle in handles:
+            handle.cancel()
+        self._finish()
+
+    def failed(self) -> list:
+        return [entry for entry in self.entries if entry.status == MATRIX_FAILED]
+
+    @property
+    def elapsed(self) -> float:
+        '''
+        wall time of the whole matrix in seconds, up to now if it is
+        still running.
+        '''
+        if self._start_time is None:
+            return 0.0
+        end_time: float = self._end_time if self._end_time is not None else time.monotonic()
+        return end_time - self._start_time
+
+    def summary(self) -> list:
+        '''
+        this method gives back one line of text for each profile.
+        '''
+        lines: list = list()
+        for entry in self.entries:
+            elapsed: str = f'{entry.elapsed:.1f}s' if entry.elapsed is not None else '-'
+            lines.append(f'{entry.profile:<16} {entry.status:<10} {elapsed:>8}  {entry.builddir}')
+        return lines
+
+    def _next(self) -> None:
+        with self._lock:
+            entry: MatrixEntry = self._waiting.popleft() if self._waiting else None
+        if entry is None:
+            self._finish()
+            return
+        self._update(entry, MATRIX_RUNNING)
+        self._launch(entry)
+
+    def _launch(self, entry: MatrixEntry) -> None:
+        start: float = time.monotonic()
+        meson: Meson = Meson(sourcedir=self.sourcedir, builddir=entry.builddir)
+        wanted: dict = {f'-D{name}': option_value(value) for name, value in entry.options.items()}
+        handle: ProcessHandle = None
+        status: str = None
+        #
+        # Anything going wrong here has to end the entry, else the matrix
+        # never finishes and "wait" blocks for good.
+        try:
+            delta: OptionDelta = OptionDelta.from_api(MesonAPI(self.sourcedir, entry.builddir), wanted)
+            if self.cancelled:
+                status = MATRIX_CANCELLED
+            elif delta is None:
+                entry.command = 'setup'
+                handle = meson.setup_async(args=[f'{flag}={value}' for flag, value in wanted.items()])
+            elif delta.is_empty():
+                status = MATRIX_UNCHANGED
+            elif delta.needs_wipe:
+                entry.command = 'setup'
+                handle = meson.setup_async(args=delta.setup_args())
+            else:
+                entry.command = 'configure'
+                handle = meson.configure_async(args=delta.configure_args())
+        except Exception as error:
+            logging.warning(f'Setup matrix can not start {entry.profile}: {error}')
+            entry.error = str(error)
+            status = MATRIX_FAILED
+        if handle is None:
+            entry.elapsed = time.monotonic() - start
+            self._update(entry, status)
+            self._next()
+            return
+        with self._lock:
+            entry.handle = handle
+            cancelled: bool = self.cancelled
+        #
+        # "cancel" came while Meson was being started and did not see
+        # the process.
+        if cancelled:
+            handle.cancel()
+        handle.add_done_callback(lambda handle, entry=entry: self._finished(entry, handle))
+
+    def _finished(self, entry: MatrixEntry, handle: ProcessHandle) -> None:
+        entry.returncode = handle.returncode
+        entry.elapsed = handle.elapsed
+        if handle.cancelled:
+            self._update(entry, MATRIX_CANCELLED)
+        else:
+            self._update(entry, MATRIX_DONE if handle.returncode == 0 else MATRIX_FAILED)
+        self._next()
+
+    def _update(self, entry: MatrixEntry, status: str) -> None:
+        with self._lock:
+            entry.status = status
+            listeners: list = list(self._listeners)
+        for listener in listeners:
+            listener(entry)
+
+    def _finish(self) -> None:
+        with self._lock:
+            if self._done.is_set() or not all(entry.is_final for entry in self.entries):
+                return
+            self._end_time = time.monotonic()
+            self._done.set()
+        logging.info(f'Setup matrix finished after {self.elapsed:.2f}s, {len(self.failed())} failed')
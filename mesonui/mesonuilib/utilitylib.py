@@ -8,14 +8,16 @@
 # copyright 2020 The Meson-UI development team
 #
 """A library of random helper functionality."""
-from distutils.spawn import find_executable
 from pathlib import Path
 import subprocess
 import functools
+import threading
 import platform
 import operator
 import unittest
+import logging
 import shutil
+import sys
 import os
 import re
 
@@ -24,12 +26,84 @@ import typing as T
 
 def find_executables(file_names):
     for file_name in file_names:
-        res = find_executable(file_name)
+        res = shutil.which(file_name)
         if res:
             return res
     raise RuntimeError(f'Executables "{file_names}" not found in path.')
 
 
+#
+# Names each tool is looked up by, in order.  Samurai is a drop in
+# replacement for Ninja so it is used when no Ninja is installed.
+TOOL_NAMES: dict = {
+    'meson': ('meson', 'meson.py'),
+    'ninja': ('ninja-build', 'ninja', 'samu'),
+    'samurai': ('samu',),
+}
+
+
+class ToolRegistry:
+    '''
+    this class finds the Meson, Ninja and Samurai executables once and
+    keeps their path and version, so starting a process does not walk
+    "PATH" again.  Everything found is forgotten as soon as "PATH"
+    changes.
+    '''
+    def __init__(self, tool_names: dict = TOOL_NAMES):
+        self._tool_names: dict = tool_names
+        self._paths: dict = {}
+        self._versions: dict = {}
+        self._search_path: str = None
+        self._lock = threading.Lock()
+
+    def _check_search_path(self) -> None:
+        search_path: str = os.environ.get('PATH', os.defpath)
+        if search_path != self._search_path:
+            self._paths.clear()
+            self._versions.clear()
+            self._search_path = search_path
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._paths.clear()
+            self._versions.clear()
+
+    def path(self, tool: str) -> str:
+        '''
+        this method gives back the full path of a tool, it raises a
+        "RuntimeError" if the tool is not found.
+        '''
+        with self._lock:
+            self._check_search_path()
+            if tool not in self._paths:
+                self._paths[tool] = find_executables(self._tool_names.get(tool, (tool,)))
+                logging.info(f'Found {tool} at {self._paths[tool]}')
+            return self._paths[tool]
+
+    def command(self, tool: str, *args: str) -> list:
+        '''
+        this method gives back the command line to run a tool with the
+        given arguments, a "meson.py" script is run by this Python.
+        '''
+        exe: str = self.path(tool)
+        if exe.endswith('.py'):
+            return [sys.executable, exe, *args]
+        return [exe, *args]
+
+    def version(self, tool: str) -> str:
+        cmd: list = self.command(tool, '--version')
+        with self._lock:
+            if tool not in self._versions:
+                self._versions[tool] = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                                      encoding='utf8').stdout.strip()
+            return self._versions[tool]
+
+
+#
+# Registry shared by the Meson and Ninja wrappers and every runner.
+tool_registry: ToolRegistry = ToolRegistry()
+
+
 '''
 This is the main exception class for Meson-UI
 '''
@@ -9,20 +9,37 @@
 #
 from xml.sax.saxutils import escape, quoteattr
 from keyword import kwlist as PYTHON_KWORD_LIST
+import re
 
 
 unicode = str
 
+from io import TextIOBase
 from io import BytesIO
 
+#
+# Buffer size of files written by "Builder.to_file", the buffer is
+# written out each time it fills up.
+XML_BUFFER_SIZE = 256 * 1024
+#
+# Values without any of these chars come out of "quoteattr" and
+# "escape" unchanged (apart from the quotes), so they are not run
+# through them.
+_UNSAFE_ATTRIBUTE = re.compile('[&<>"\'\n\r\t]').search
+_UNSAFE_CONTENT = re.compile('[&<>]').search
+
 
 class Builder:
-    def __init__(self, encoding='utf-8', indent=' ' * 2, version=None, stream=None):
+    """XML document writer, tags are closed by the next tag, the end of
+    their parent block or by reading, flushing or closing the document"""
+    def __init__(self, encoding='utf-8', indent=' ' * 2, version=None, stream=None, indentation=0):
         self._document = stream or BytesIO()
+        self._text_stream = isinstance(self._document, TextIOBase)
+        self._owns_stream = False
 
         self._encoding = encoding
         self._indent = indent
-        self._indentation = 0
+        self._indentation = indentation
         self._open_tag = None
         self._newline = ''
         self._to_str = self._to_bytes if str == bytes else self._to_unicode
@@ -57,12 +74,37 @@ class Builder:
         else:
             return f'<streaming {self.__class__.__name__} object>'
 
-    def __del__(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, tb):
+        self.close()
+
+    @classmethod
+    def to_file(cls, path, encoding='utf-8', indent=' ' * 2, version=None, buffer_size=XML_BUFFER_SIZE):
+        """Make a builder that streams the document into a file"""
+        stream = open(path, 'w', encoding=encoding, newline='', buffering=buffer_size)
+        builder = cls(encoding=encoding, indent=indent, version=version, stream=stream)
+        builder._owns_stream = True
+        return builder
+
+    def flush(self):
+        """Write out everything buffered so far"""
         self._open_tag and self._open_tag.close()
+        self._document.flush()
+
+    def close(self):
+        """Close the open tag, and the file if the builder opened it"""
+        self._open_tag and self._open_tag.close()
+        if self._owns_stream and not self._document.closed:
+            self._document.close()
 
     def write(self, content):
         """Write raw content to the document"""
-        self._document.write(self._to_bytes(content))
+        if self._text_stream:
+            self._document.write(content if content.__class__ is str else self._to_str(content))
+        else:
+            self._document.write(content.encode(self._encoding) if content.__class__ is str else self._to_bytes(content))
         self._newline = '\n'
 
     def write_escaped(self, content):
@@ -73,56 +115,88 @@ class Builder:
         """Write indented content to the document"""
         self.write(f'{self._newline}{self._indent * self._indentation}{self._to_str(content)}')
 
+    def write_fragment(self, content):
+        """Write elements made by another builder, started at this indentation"""
+        if content:
+            self._open_tag and self._open_tag.close()
+            self.write(f'{self._newline}{self._to_str(content)}')
+
 
 builder = Builder  # 0.1 backward compatibility
 
 class Element:
+    """A tag of the document, written out in one piece once its
+    attributes and content are known"""
+    __slots__ = ('name', 'content', 'attributes', 'builder')
+
     PYTHON_KWORD_MAP = dict([(k + '_', k) for k in PYTHON_KWORD_LIST])
+    #
+    # Tag and attribute names after "_nameprep", a document only uses a
+    # handful of them so they are worked out once.
+    PREPARED_NAMES = {}
 
     def __init__(self, name, builder):
-        self.name = self._nameprep(name)
+        self.name = self.PREPARED_NAMES.get(name) or self._nameprep(name)
         self.content = ''
+        self.attributes = ''
         self.builder = builder
-        self.builder._open_tag and self.builder._open_tag.close()
-        self.builder.write_indented(f'<{self.name}')
-        self.builder._open_tag = self
+        builder._open_tag and builder._open_tag.close()
+        builder._open_tag = self
+
+    def _start_tag(self):
+        builder = self.builder
+        return f'{builder._newline}{builder._indent * builder._indentation}<{self.name}{self.attributes}'
 
     def close(self):
-        if self.builder._open_tag is self:
+        builder = self.builder
+        if builder._open_tag is self:
+            builder._open_tag = None
             if self.content:
-                self.builder.write(f'>{self.content}</{self.name}>')
+                builder.write(f'{self._start_tag()}>{self.content}</{self.name}>')
             else:
-                self.builder.write(' />')
-            self.builder._open_tag = None
+                builder.write(f'{self._start_tag()} />')
 
     def __enter__(self):
         """Add a parent element to the document"""
-        self.builder.write(f'>{self.content}')
-        self.builder._indentation += 1
-        self.builder._open_tag = None
+        builder = self.builder
+        builder._open_tag = None
+        builder.write(f'{self._start_tag()}>{self.content}')
+        builder._indentation += 1
         return self
 
     def __exit__(self, type, value, tb):
         """Add close tag to current parent element"""
-        self.builder._open_tag and self.builder._open_tag.close()
-        self.builder._indentation -= 1
-        self.builder.write_indented(f'</{self.name}>')
+        builder = self.builder
+        builder._open_tag and builder._open_tag.close()
+        builder._indentation -= 1
+        builder.write_indented(f'</{self.name}>')
 
     def __call__(*args, **kargs):
         """Add content & attributes to the opened tag"""
         self = args[0]
-        for attr, value in sorted(kargs.items()):
-            self.builder.write(f' {self._nameprep(attr)}={quoteattr(self.builder._to_str(value))}')
+        to_str = self.builder._to_str
+        if kargs:
+            attributes = [self.attributes]
+            for attr, value in (sorted(kargs.items()) if len(kargs) > 1 else kargs.items()):
+                if value.__class__ is not str:
+                    value = to_str(value)
+                name = self.PREPARED_NAMES.get(attr) or self._nameprep(attr)
+                if _UNSAFE_ATTRIBUTE(value):
+                    attributes.append(f' {name}={quoteattr(value)}')
+                else:
+                    attributes.append(f' {name}="{value}"')
+            self.attributes = ''.join(attributes)
         for s in args[1:]:
             if s:
-                self.content += escape(self.builder._to_str(s))
+                if s.__class__ is not str:
+                    s = to_str(s)
+                self.content += escape(s) if _UNSAFE_CONTENT(s) else s
         return self
 
-    def __del__(self):
-        self.close()
-
     @classmethod
     def _nameprep(cls, name):
         """Undo keyword and colon mangling"""
-        name = cls.PYTHON_KWORD_MAP.get(name, name)
-        return name.replace('__', ':')
+        prepared = cls.PYTHON_KWORD_MAP.get(name, name).replace('__', ':')
+        if len(cls.PREPARED_NAMES) < 4096:
+            cls.PREPARED_NAMES[name] = prepared
+        return prepared
@@ -7,10 +7,8 @@
 #
 # copyright 2020 The Meson-UI development team
 #
-from .mesonuiinit import MesonUiApplication
 from .mesonuilogs import mesonui_log
 from .commandline import mesonui_cli
-from PyQt5.QtGui import QIcon
 import logging
 import sys
 import os
@@ -19,6 +17,11 @@ import os
 def mesonui_main():
     mesonui_log()
     mesonui_cli()
+    #
+    # Qt, the views and the embedded resources are only imported once the
+    # command line has been parsed, so "--version" and "--help" start fast.
+    from .mesonuiinit import MesonUiApplication
+    from PyQt5.QtGui import QIcon
 
     logging.info(' Getting Meson-UI Application started')
     app: MesonUiApplication = MesonUiApplication(sys_argv=sys.argv)
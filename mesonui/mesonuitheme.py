@@ -102,7 +102,9 @@ QScrollBar::add-page:vertical, sub-page:vertical {
     background: none;
 }
 
-QListWidget {
+QListView#buildoptions_list,
+QListView#projectinfo_list,
+QListView#testsinfo_list {
     background-attachment: scroll;
     background-color: rgb(61, 64, 55);
     border-color: rgb(245, 251, 251);
@@ -7,29 +7,23 @@
 #
 # copyright 2020 The Meson-UI development team
 #
-from ..containers.doublylist import MesonUiDLL
+from .introlistmodel import IntroListModel
 
 
-class BuildOptionsModel:
-    def __init__(self):
-        super().__init__()
-        self._dll: MesonUiDLL = MesonUiDLL()
-
-    def get_list(self) -> MesonUiDLL:
-        return self._dll
-
+class BuildOptionsModel(IntroListModel):
     def set_list(self, value) -> None:
         options = value.get_object(group='buildoptions')
         if options is None:
             return
+        self.set_records(options, source=options)
 
-        while self._dll.head is not None:
-            self._dll.remove_item()
+    def sort_key(self, record: any) -> any:
+        return (record['section'], record['name'])
 
-        for values in range(len(options)):
-            self._dll.append_item(f' section: {options[values]["section"]}\n'
-                                  f' option:  {options[values]["name"]:<25}\n'
-                                  f' value:   {str(options[values]["value"]):<65}\n'
-                                  f' type:    {str(options[values]["type"]):<65}\n'
-                                  f' description: {options[values]["description"]:<10}\n'
-                                  '---------------------------------------------------------------------------------------------------:')
+    def format_row(self, record: any) -> str:
+        return (f' section: {record["section"]}\n'
+                f' option:  {record["name"]:<25}\n'
+                f' value:   {str(record["value"]):<65}\n'
+                f' type:    {str(record["type"]):<65}\n'
+                f' description: {record["description"]:<10}\n'
+                '---------------------------------------------------------------------------------------------------:')
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from PyQt5.QtCore import QAbstractListModel
+from PyQt5.QtCore import QModelIndex
+from PyQt5.QtCore import Qt
+from difflib import SequenceMatcher
+
+
+def row_edits(old_rows: list, new_rows: list) -> list:
+    '''
+    this function gives back the edits that turn "old_rows" into
+    "new_rows" as (old_start, old_end, new_start, new_end) tuples, back to
+    front so the row numbers of the edits still to come are not moved by
+    the ones already done.  Unchanged runs of rows are left out.
+    '''
+    matcher: SequenceMatcher = SequenceMatcher(None, old_rows, new_rows, autojunk=False)
+    return [(old_start, old_end, new_start, new_end)
+            for tag, old_start, old_end, new_start, new_end in reversed(matcher.get_opcodes())
+            if tag != 'equal']
+
+
+class IntroListModel(QAbstractListModel):
+    '''
+    this class is the base for the introspection list models.  It keeps
+    the raw introspection records and only formats a row when a view asks
+    for it in "data", so rows never shown are never formatted.
+
+    New records are diffed against the current ones by their "row_key"
+    (the fields that name a row), rows that stay are only compared as a
+    whole to find the ones whose values changed.  Only the rows that
+    changed are inserted, removed or updated.
+    '''
+    placeholder: str = 'No Project data.'
+
+    def __init__(self):
+        super().__init__()
+        self._records: list = [None]
+        self._keys: list = [None]
+        self._source: any = None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._records)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole) -> any:
+        if not index.isValid() or index.row() >= len(self._records):
+            return None
+        record: any = self._records[index.row()]
+        if role == Qt.DisplayRole:
+            return self.placeholder if record is None else self.format_row(record)
+        if role == Qt.UserRole:
+            return record
+        return None
+
+    def get_list(self) -> list:
+        return [record for record in self._records if record is not None]
+
+    def format_row(self, record: any) -> str:
+        return str(record)
+
+    def sort_key(self, record: any) -> any:
+        return None
+
+    def row_key(self, record: any) -> any:
+        '''
+        this method gives back the fields that tell a row apart from the
+        others, by default the sort key.
+        '''
+        return self.sort_key(record)
+
+    def set_records(self, records: list, source: any = None) -> int:
+        '''
+        this method shows the given records, "source" is the object they
+        were made from and lets an unchanged (cached) object skip the diff.
+        Gives back the number of rows touched.
+        '''
+        if source is not None and source is self._source:
+            return 0
+        self._source = source
+
+        records = sorted(records, key=self.sort_key) if records else [None]
+        keys: list = [None if record is None else self.row_key(record) for record in records]
+        changed: int = 0
+        for old_start, old_end, new_start, new_end in row_edits(self._keys, keys):
+            overlap: int = min(old_end - old_start, new_end - new_start)
+            if overlap:
+                self._records[old_start:old_start + overlap] = records[new_start:new_start + overlap]
+                self._keys[old_start:old_start + overlap] = keys[new_start:new_start + overlap]
+                self.dataChanged.emit(self.index(old_start), self.index(old_start + overlap - 1))
+            if old_end - old_start > overlap:
+                self.beginRemoveRows(QModelIndex(), old_start + overlap, old_end - 1)
+                del self._records[old_start + overlap:old_end]
+                del self._keys[old_start + overlap:old_end]
+                self.endRemoveRows()
+            if new_end - new_start > overlap:
+                first: int = old_start + overlap
+                self.beginInsertRows(QModelIndex(), first, first + new_end - new_start - overlap - 1)
+                self._records[first:first] = records[new_start + overlap:new_end]
+                self._keys[first:first] = keys[new_start + overlap:new_end]
+                self.endInsertRows()
+            changed += max(old_end - old_start, new_end - new_start)
+        #
+        # Rows with the same key may still hold new values.
+        for row, record in enumerate(records):
+            if self._records[row] is not record and self._records[row] != record:
+                self._records[row] = record
+                self.dataChanged.emit(self.index(row), self.index(row))
+                changed += 1
+        return changed
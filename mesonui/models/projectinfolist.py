@@ -7,34 +7,34 @@
 #
 # copyright 2020 The Meson-UI development team
 #
-from ..containers.doublylist import MesonUiDLL
+from .introlistmodel import IntroListModel
 
 
-class ProjectInfoModel:
-    def __init__(self):
-        super().__init__()
-        self._dll: MesonUiDLL = MesonUiDLL()
-
-    def get_list(self) -> MesonUiDLL:
-        return self._dll
-
+class ProjectInfoModel(IntroListModel):
     def set_list(self, value) -> None:
         options = value.get_object(group='projectinfo')
         if options is None:
             return
-
-        while self._dll.head is not None:
-            self._dll.remove_item()
-
-        self._dll.append_item(f' descriptive_name: {options["descriptive_name"]}\n'
-                              f' target version:   {options["version"]}\n'
-                              f' subproject_dir:   {options["subproject_dir"]}\n'
-                              f' subprojects: {len(options["subprojects"])}\n'
-                              '---------------------------------------------------------------------------------------------------:')
-
-        for values in range(len(options['subprojects'])):
-            self._dll.append_item(f' Subproject:\n'
-                                  f' descriptive_name:  {options["subprojects"][values]["descriptive_name"]:<65}\n'
-                                  f' target version:    {options["subprojects"][values]["version"]:<65}\n'
-                                  f' target name:       {options["subprojects"][values]["name"]:<10}\n'
-                                  '---------------------------------------------------------------------------------------------------:')
+        #
+        # The project itself is the first row, its subprojects follow.
+        records: list = [('project', options)]
+        records.extend(('subproject', subproject) for subproject in options['subprojects'])
+        self.set_records(records, source=options)
+
+    def sort_key(self, record: any) -> any:
+        kind, info = record
+        return (kind != 'project', info.get('name', ''))
+
+    def format_row(self, record: any) -> str:
+        kind, info = record
+        if kind == 'project':
+            return (f' descriptive_name: {info["descriptive_name"]}\n'
+                    f' target version:   {info["version"]}\n'
+                    f' subproject_dir:   {info["subproject_dir"]}\n'
+                    f' subprojects: {len(info["subprojects"])}\n'
+                    '---------------------------------------------------------------------------------------------------:')
+        return (f' Subproject:\n'
+                f' descriptive_name:  {info["descriptive_name"]:<65}\n'
+                f' target version:    {info["version"]:<65}\n'
+                f' target name:       {info["name"]:<10}\n'
+                '---------------------------------------------------------------------------------------------------:')
@@ -7,28 +7,39 @@
 #
 # copyright 2020 The Meson-UI development team
 #
-from ..containers.doublylist import MesonUiDLL
+from .introlistmodel import IntroListModel
 
 
-class TestsLogsModel:
-    def __init__(self):
-        super().__init__()
-        self._dll: MesonUiDLL = MesonUiDLL()
-
-    def get_list(self) -> MesonUiDLL:
-        return self._dll
+class TestsLogsModel(IntroListModel):
+    placeholder: str = 'No Testlogs data.'
 
     def set_list(self, value) -> None:
         options = value.get_object(group='tests')
-        testlog = value.get_object(group='testlog')
-        if options is None or testlog is None:
+        if options is None:
+            return
+        #
+        # The test log is streamed one test run at a time and only the
+        # results are kept.  Newer Meson versions put the project name in
+        # front of the test name, so both forms are looked up.
+        results: dict = {}
+        for testlog in value.iter_object(group='testlog'):
+            results[testlog['name']] = testlog['result']
+            results.setdefault(testlog['name'].split(':', 1)[-1], testlog['result'])
+        if not results:
             return
+        self.set_records([(test, results.get(test['name'], 'not run')) for test in options.get('tests', [])])
+
+    def sort_key(self, record: any) -> any:
+        test, result = record
+        return (test['suite'], test['name'])
 
-        while self._dll.head is not None:
-            self._dll.remove_item()
+    def row_key(self, record: any) -> any:
+        test, result = record
+        return (tuple(test['suite']), test['name'])
 
-        for values in range(len(options["tests"])):
-            self._dll.append_item(f' suite:  {options["tests"][values]["suite"]}\n'
-                                  f' name:   {options["tests"][values]["name"]}\n'
-                                  f' result: {testlog["result"]}\n'
-                                  '---------------------------------------------------------------------------------------------------:')
+    def format_row(self, record: any) -> str:
+        test, result = record
+        return (f' suite:  {test["suite"]}\n'
+                f' name:   {test["name"]}\n'
+                f' result: {result}\n'
+                '---------------------------------------------------------------------------------------------------:')
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from os.path import join as join_paths
+import threading
+import logging
+import os
+
+#
+# Maps every API group onto the file Meson writes it to, relative to
+# the build directory.  Groups not listed here (like "scan-dependencies")
+# are stamped with "meson-info.json" which Meson rewrites on every
+# (re)configure.
+MESON_GROUP_FILES: dict = {
+    'buildoptions': ('meson-info', 'intro-buildoptions.json'),
+    'benchmarks': ('meson-info', 'intro-benchmarks.json'),
+    'buildsystem-files': ('meson-info', 'intro-buildsystem_files.json'),
+    'dependencies': ('meson-info', 'intro-dependencies.json'),
+    'installed': ('meson-info', 'intro-installed.json'),
+    'projectinfo': ('meson-info', 'intro-projectinfo.json'),
+    'targets': ('meson-info', 'intro-targets.json'),
+    'tests': ('meson-info', 'intro-tests.json'),
+    'meson-info': ('meson-info', 'meson-info.json'),
+    'testlog': ('meson-logs', 'testlog.json'),
+}
+
+_MESON_SCRIPT_FILES: tuple = (
+    'meson.build',
+    'meson_options.txt',
+    'meson.options'
+)
+
+
+def stat_stamp(path: str) -> tuple:
+    '''
+    this function returns the path with its modification time and size,
+    both None when the file can not be read.
+    '''
+    try:
+        info = os.stat(path)
+    except (OSError, TypeError, ValueError):
+        return (path, None, None)
+    return (path, info.st_mtime_ns, info.st_size)
+
+
+def builddir_stamp(builddir, group: str) -> tuple:
+    '''
+    this function returns the stamp for the intro file that backs the
+    given group inside a build directory.
+    '''
+    subdir, name = MESON_GROUP_FILES.get(group, ('meson-info', 'meson-info.json'))
+    return (stat_stamp(join_paths(str(builddir), subdir, name)),)
+
+
+def sourcedir_stamp(sourcedir) -> tuple:
+    '''
+    this function returns the stamp of every Meson script found in the
+    source tree, build directories (anything holding "meson-private")
+    and hidden directories are skipped.
+    '''
+    stamps: list = list()
+    if sourcedir is None:
+        return tuple(stamps)
+    for root, dirs, files in os.walk(str(sourcedir)):
+        if 'meson-private' in dirs:
+            dirs[:] = []
+            continue
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.'))
+        for name in _MESON_SCRIPT_FILES:
+            if name in files:
+                stamps.append(stat_stamp(join_paths(root, name)))
+    return tuple(stamps)
+
+
+class MesonApiCache:
+    '''
+    this class keeps introspection objects in memory so unchanged
+    groups are not parsed again.  Every entry remembers the stamp
+    (path, mtime, size) of the files it came from and is only served
+    while that stamp still matches.
+
+    Objects are handed out as-is, callers must treat them as read-only.
+    '''
+    def __init__(self):
+        self._entries: dict = {}
+        self._lock = threading.Lock()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def lookup(self, key: tuple, stamp: tuple) -> tuple:
+        '''
+        this method gives back a (found, value) pair for the given key
+        and counts the request as a hit or a miss.
+        '''
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stamp:
+                self.hits += 1
+                logging.debug(f'API cache hit for {key}')
+                return (True, entry[1])
+            self.misses += 1
+            logging.debug(f'API cache miss for {key}')
+            return (False, None)
+
+    def store(self, key: tuple, stamp: tuple, value: any) -> None:
+        with self._lock:
+            self._entries[key] = (stamp, value)
+
+    def invalidate(self, group: str = None, directory: str = None) -> None:
+        '''
+        this method drops every entry for the given group and directory,
+        or all entries if neither is given.
+        '''
+        with self._lock:
+            if group is None and directory is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries
+                        if (group is None or key[1] == group) and (directory is None or key[2] == directory)]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries)
+            }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+
+#
+# One cache is shared by every MesonAPI object so activities that make
+# their own API object still profit from data read by the main window.
+shared_cache: MesonApiCache = MesonApiCache()
@@ -8,6 +8,8 @@
 # copyright 2020 The Meson-UI development team
 #
 from os.path import join as join_paths
+from .datastream import iter_json_array
+from .datastream import iter_json_lines
 from pathlib import Path
 import logging
 import json
@@ -24,6 +26,20 @@ _MESON_INTRO_FILES: tuple = (
     'meson-info.json'
 )
 
+#
+# Groups that can be streamed item by item, mapped onto the file that
+# holds them.  Every intro file listed here is a JSON array, the test log
+# holds one JSON object per line.
+_MESON_STREAM_FILES: dict = {
+    'buildoptions': ('meson-info', 'intro-buildoptions.json'),
+    'benchmarks': ('meson-info', 'intro-benchmarks.json'),
+    'buildsystem-files': ('meson-info', 'intro-buildsystem_files.json'),
+    'dependencies': ('meson-info', 'intro-dependencies.json'),
+    'targets': ('meson-info', 'intro-targets.json'),
+    'tests': ('meson-info', 'intro-tests.json'),
+    'testlog': ('meson-logs', 'testlog.json')
+}
+
 class MesonBuilddirLoader:
     def __init__(self, builddir: Path = None):
         self._builddir = builddir
@@ -63,3 +79,31 @@ class MesonBuilddirLoader:
             return self._scan(group=f'intro-{group}.json')
         else:
             raise Exception(f'Group tag {group} not found in extract via data options!')
+
+    def extract_many(self, groups: list) -> dict:
+        '''
+        this method gives back all given groups as a dict keyed by group,
+        each intro file is its own JSON document so they are loaded one
+        by one.
+        '''
+        return {group: self.extract_from(group=group) for group in groups}
+
+    def iter_from(self, group: str) -> any:
+        '''
+        this method yields the items of a list group one at a time while
+        reading the file, so a huge "intro-targets.json" is never held in
+        memory as a whole.  Yields nothing if "testlog.json" is not found.
+        '''
+        if group not in _MESON_STREAM_FILES:
+            raise Exception(f'Group tag {group} can not be streamed via data options!')
+        logging.info(f'Try streaming {group} API object via build directory loader')
+
+        subdir, name = _MESON_STREAM_FILES[group]
+        path: str = join_paths(self._builddir, subdir, name)
+        if group == 'testlog' and not Path(path).exists():
+            return
+        with open(path) as stream:
+            if group == 'testlog':
+                yield from iter_json_lines(stream)
+            else:
+                yield from iter_json_array(stream)
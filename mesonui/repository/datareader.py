@@ -7,24 +7,40 @@
 #
 # copyright 2020 The Meson-UI development team
 #
+from ..mesonuilib.mesonengine import meson_engine
 from pathlib import Path
-import subprocess
 import logging
 import json
 
+#
+# Maps every API group onto the "meson introspect" flag, the key Meson
+# uses in the object output and whether to unwrap the value from that
+# key (True) or hand back the object holding only that key (False).
+_READER_GROUPS: dict = {
+    'buildoptions': ('--buildoptions', 'buildoptions', True),
+    'tests': ('--tests', 'tests', True),
+    'benchmarks': ('--benchmarks', 'benchmarks', True),
+    'buildsystem-files': ('--buildsystem-files', 'buildsystem_files', True),
+    'projectinfo': ('--projectinfo', 'projectinfo', True),
+    'scan-dependencies': ('--scan-dependencies', 'scan_dependencies', False),
+    'dependencies': ('--dependencies', 'dependencies', True),
+    'installed': ('--installed', 'installed', True),
+    'targets': ('--targets', 'targets', True)
+}
+
 
 class MesonBuilddirReader:
     def __init__(self, builddir: Path = None):
         self._builddir: Path = builddir
 
     def _introspect(self, args: list) -> any:
-        cmd: list = ['meson', 'introspect']
-        cmd.extend(args)
-        proc = subprocess.Popen(cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return proc.communicate()[0]
+        returncode, output, errors = meson_engine.run(['introspect', *args])
+        return output
 
-    def _scan(self, group: str) -> any:
-        info: any = json.loads(self._introspect([group, '--force-object-output', str(self._builddir)]))
+    def _scan(self, groups: list) -> any:
+        args: list = list(groups)
+        args.extend(['--force-object-output', str(self._builddir)])
+        info: any = json.loads(self._introspect(args))
         return info
 
     def extract_from(self, group: str) -> any:
@@ -32,34 +48,29 @@ class MesonBuilddirReader:
         # We need to make sure to return None if testlogs.json is not found. So
         # check to see if the group is "testlog" and if so give nothing back
         logging.info(f'Try getting {group} API object via read build directory.')
-        if group == 'testlog':
-            return None
-        elif group == 'buildoptions':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        elif group == 'tests':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        elif group == 'benchmarks':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        elif group == 'buildsystem-files':
-            info = self._scan(group=f'--{group}')
-            return info['buildsystem_files']
-        elif group == 'projectinfo':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        elif group == 'scan-dependencies':
-            info = self._scan(group=f'--{group}')
-            return info
-        elif group == 'dependencies':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        elif group == 'installed':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        elif group == 'targets':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        else:
-            raise Exception(f'Group tag {group} not found in extract via data options!')
+        return self.extract_many(groups=[group])[group]
+
+    def extract_many(self, groups: list) -> dict:
+        '''
+        this method gets all given groups with a single "meson introspect"
+        run and gives them back as a dict keyed by group, each value has
+        the same shape "extract_from" gives back for that group.
+        '''
+        for group in groups:
+            if group != 'testlog' and group not in _READER_GROUPS:
+                raise Exception(f'Group tag {group} not found in extract via data options!')
+
+        wanted: list = [group for group in dict.fromkeys(groups) if group != 'testlog']
+        info: dict = self._scan([_READER_GROUPS[group][0] for group in wanted]) if wanted else {}
+
+        objects: dict = {}
+        for group in groups:
+            if group == 'testlog':
+                objects[group] = None
+                continue
+            flag, key, unwrap = _READER_GROUPS[group]
+            if unwrap:
+                objects[group] = info[key]
+            else:
+                objects[group] = {key: info[key]} if key in info else {}
+        return objects
@@ -8,24 +8,48 @@
 # copyright 2020 The Meson-UI development team
 #
 from os.path import join as join_paths
+from ..mesonuilib.mesonengine import MesonEngine
+from ..mesonuilib.mesonengine import meson_engine
 from pathlib import Path
-import subprocess
 import logging
 import json
 
+#
+# Same layout as the build directory reader table, but only for the
+# groups Meson can answer from the "meson.build" script alone.
+SCRIPT_GROUPS: dict = {
+    'buildoptions': ('--buildoptions', 'buildoptions', True),
+    'tests': ('--tests', 'tests', False),
+    'benchmarks': ('--benchmarks', 'benchmarks', False),
+    'projectinfo': ('--projectinfo', 'projectinfo', True),
+    'scan-dependencies': ('--scan-dependencies', 'scan_dependencies', True),
+    'dependencies': ('--dependencies', 'dependencies', True),
+    'targets': ('--targets', 'targets', True)
+}
+
 
 class MesonScriptReader:
-    def __init__(self, sourcedir: Path = None):
+    '''
+    this class reads introspection groups from the "meson.build" script.
+    Given an engine and the stamp of the scripts, every group is asked
+    for at once so the engine worker can answer any later request with
+    the same stamp from memory.
+    '''
+    def __init__(self, sourcedir: Path = None, engine: MesonEngine = None, stamp: tuple = None):
         self._sourcedir: Path = sourcedir
+        self._engine: MesonEngine = meson_engine if engine is None else engine
+        self._stamp: tuple = stamp
 
     def _introspect(self, args: list) -> any:
-        cmd: list = ['meson', 'introspect']
-        cmd.extend(args)
-        proc = subprocess.Popen(cmd, encoding='utf8', stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return proc.communicate()[0]
+        returncode, output, errors = self._engine.run(['introspect', *args], stamp=self._stamp)
+        return output
 
-    def _scan(self, group: str) -> any:
-        info: any = json.loads(self._introspect([group, '--force-object-output', join_paths(self._sourcedir, 'meson.build')]))
+    def _scan(self, groups: list) -> any:
+        args: list = list(groups)
+        if self._stamp is not None:
+            args = [flag for flag, key, unwrap in SCRIPT_GROUPS.values()]
+        args.extend(['--force-object-output', join_paths(self._sourcedir, 'meson.build')])
+        info: any = json.loads(self._introspect(args))
         return info
 
     def extract_from(self, group: str) -> any:
@@ -33,26 +57,29 @@ class MesonScriptReader:
         # We need to make sure to return None if testlogs.json is not found. So
         # check to see if the group is "testlog" and if so give nothing back
         logging.info(f'Try getting {group} API object via script scanner')
-        if group == 'testlog':
-            return None
-        elif group == 'buildoptions':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        elif group == 'tests':
-            return self._scan(group=f'--{group}')
-        elif group == 'benchmarks':
-            return self._scan(group=f'--{group}')
-        elif group == 'projectinfo':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        elif group == 'scan-dependencies':
-            info = self._scan(group=f'--{group}')
-            return info['scan_dependencies']
-        elif group == 'dependencies':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        elif group == 'targets':
-            info = self._scan(group=f'--{group}')
-            return info[group]
-        else:
-            raise Exception(f'Group tag {group} not found in extract via data options!')
+        return self.extract_many(groups=[group])[group]
+
+    def extract_many(self, groups: list) -> dict:
+        '''
+        this method gets all given groups while Meson interprets the
+        script only once, and gives them back as a dict keyed by group
+        in the same shape "extract_from" gives back for that group.
+        '''
+        for group in groups:
+            if group != 'testlog' and group not in SCRIPT_GROUPS:
+                raise Exception(f'Group tag {group} not found in extract via data options!')
+
+        wanted: list = [group for group in dict.fromkeys(groups) if group != 'testlog']
+        info: dict = self._scan([SCRIPT_GROUPS[group][0] for group in wanted]) if wanted else {}
+
+        objects: dict = {}
+        for group in groups:
+            if group == 'testlog':
+                objects[group] = None
+                continue
+            flag, key, unwrap = SCRIPT_GROUPS[group]
+            if unwrap:
+                objects[group] = info[key]
+            else:
+                objects[group] = {key: info[key]} if key in info else {}
+        return objects
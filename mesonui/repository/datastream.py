@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+import json
+
+#
+# Size of the first read, a value too big for the buffer doubles the
+# size of the next read so huge values are not parsed over and over.
+STREAM_CHUNK_SIZE: int = 64 * 1024
+
+_WHITESPACE: str = ' \t\n\r'
+_ITEM_END: str = ' \t\n\r,]'
+
+
+class _ChunkReader:
+    '''
+    this class keeps the unparsed tail of a text stream and reads more of
+    it on request.
+    '''
+    def __init__(self, stream, chunk_size: int):
+        self.stream = stream
+        self.chunk_size: int = chunk_size
+        self.buffer: str = ''
+        self.pos: int = 0
+        self.eof: bool = False
+
+    def read_more(self) -> bool:
+        if self.eof:
+            return False
+        chunk: str = self.stream.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        #
+        # Drop what was parsed already before growing the buffer.
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def skip(self, chars: str) -> str:
+        '''
+        this method skips the given chars and gives back the next one,
+        or an empty string at the end of the stream.
+        '''
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in chars:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.read_more():
+                return ''
+
+
+def iter_json_array(stream, chunk_size: int = STREAM_CHUNK_SIZE) -> any:
+    '''
+    this function yields the items of the JSON array held by a text
+    stream one by one, only the item being parsed is kept in memory.
+    '''
+    decoder: json.JSONDecoder = json.JSONDecoder()
+    reader: _ChunkReader = _ChunkReader(stream, chunk_size)
+    if reader.skip(_WHITESPACE) != '[':
+        raise ValueError('Streamed JSON document is not an array')
+    reader.pos += 1
+
+    expect_item: bool = True
+    first_item: bool = True
+    while True:
+        char: str = reader.skip(_WHITESPACE)
+        if char == ']':
+            if expect_item and not first_item:
+                raise ValueError('Trailing "," in streamed JSON array')
+            return
+        if char == '':
+            raise ValueError('Streamed JSON array is not closed')
+        if not expect_item:
+            if char != ',':
+                raise ValueError(f'Expected "," in streamed JSON array, found {char!r}')
+            reader.pos += 1
+            expect_item = True
+            continue
+
+        while True:
+            try:
+                item, end = decoder.raw_decode(reader.buffer, reader.pos)
+                #
+                # A number cut by the chunk end ("1." of "1.5") still
+                # decodes, so a value only counts once it is followed by
+                # a char that may come after an array item.
+                if end < len(reader.buffer) and reader.buffer[end] in _ITEM_END or reader.eof:
+                    break
+            except json.JSONDecodeError:
+                if reader.eof:
+                    raise
+            reader.chunk_size *= 2
+            reader.read_more()
+        reader.pos = end
+        reader.chunk_size = chunk_size
+        expect_item = False
+        first_item = False
+        yield item
+
+
+def iter_json_lines(stream) -> any:
+    '''
+    this function yields one object per non empty line of a text stream,
+    the way Meson writes "testlog.json".
+    '''
+    for line in stream:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
@@ -7,20 +7,31 @@
 # copyright 2020 The Meson-UI development team
 #
 from ..mesonuilib.utilitylib import MesonUiException
+from ..mesonuilib.mesonengine import script_engines
 from .datascanner import MesonScriptReader
+from .datascanner import SCRIPT_GROUPS
 from .datareader import MesonBuilddirReader
 from .dataloader import MesonBuilddirLoader
-from .dataloader import _MESON_INTRO_FILES
+from .dataloader import _MESON_STREAM_FILES
+from .datacache import MesonApiCache
+from .datacache import sourcedir_stamp
+from .datacache import builddir_stamp
+from .datacache import shared_cache
+from .projectstate import ProjectState
+from .projectstate import project_states
 from pathlib import Path
 from os.path import join as join_paths
 import logging
 
 
 class MesonAPI:
-    def __init__(self, sourcedir: Path = Path().cwd(), builddir: Path = join_paths(Path().cwd(), 'builddir')):
+    def __init__(self, sourcedir: Path = Path().cwd(), builddir: Path = join_paths(Path().cwd(), 'builddir'),
+                 cache: MesonApiCache = None):
         super().__init__()
         self._sourcedir: Path = sourcedir
         self._builddir: Path = builddir
+        self._cache: MesonApiCache = shared_cache if cache is None else cache
+        self._generation: tuple = None
 
     @property
     def sourcedir(self):
@@ -30,6 +41,24 @@ class MesonAPI:
     def builddir(self):
         return self._builddir
 
+    @property
+    def cache(self) -> MesonApiCache:
+        return self._cache
+
+    def state(self) -> ProjectState:
+        '''
+        this method gives back the state of the source and build directory.
+        When Meson configured the build directory again since the last
+        call, the cached objects read from it are dropped.
+        '''
+        state: ProjectState = project_states.get(self.sourcedir, self.builddir)
+        if self._generation is not None and self._generation[0] == state.builddir and \
+           self._generation[1] != state.generation:
+            logging.info(f'Build directory {state.builddir} changed, drop its cached objects')
+            self._cache.invalidate(directory=state.builddir)
+        self._generation = (state.builddir, state.generation)
+        return state
+
     @sourcedir.setter
     def sourcedir(self, new_dir: Path):
         self._sourcedir = new_dir
@@ -42,47 +71,105 @@ class MesonAPI:
         if not isinstance(group, str):
             raise MesonUiException(f'API group key pair {type(group)} is not valid type!')
 
+        return self.get_objects(groups=[group], extract_method=extract_method, use_fallback=use_fallback)[group]
+
+    def get_objects(self, groups: list = [], extract_method: str = 'script', use_fallback: bool = False) -> dict:
+        '''
+        this method works like "get_object" for many groups at once, any
+        group not found in the cache is read with a single extract run.
+        '''
+        for group in groups:
+            if not isinstance(group, str):
+                raise MesonUiException(f'API group key pair {type(group)} is not valid type!')
+
         if not isinstance(extract_method, str):
             raise MesonUiException(f'API extract method {type(extract_method)} is not valid type!')
 
-        logging.info(f'protocol settings: use_fallback={use_fallback}, group={group}, extract={extract_method}')
+        logging.info(f'protocol settings: use_fallback={use_fallback}, groups={groups}, extract={extract_method}')
+        state: ProjectState = self.state()
+        has_builddir: bool = state.has_intro_files and state.is_builddir
+        has_script: bool = state.has_meson_script and state.is_sourcedir
         if extract_method == 'reader':
-            if use_fallback is False and self._has_intro_files() and self._is_builddir():
-                return MesonBuilddirReader(self.builddir).extract_from(group=group)
-            elif use_fallback is True or self._has_meson_script() and self._is_sourcedir():
-                return MesonScriptReader(self.sourcedir).extract_from(group=group)
+            if use_fallback is False and has_builddir:
+                return self._from_builddir('reader', groups, MesonBuilddirReader)
+            elif use_fallback is True or has_script:
+                return self._from_sourcedir(groups)
             else:
-                return None
+                return dict.fromkeys(groups)
 
         elif extract_method == 'loader':
-            if use_fallback is False and self._has_intro_files() and self._is_builddir():
-                return MesonBuilddirLoader(self.builddir).extract_from(group=group)
-            elif use_fallback is True or self._has_meson_script() and self._is_sourcedir():
-                return MesonScriptReader(self.sourcedir).extract_from(group=group)
+            if use_fallback is False and has_builddir:
+                return self._from_builddir('loader', groups, MesonBuilddirLoader)
+            elif use_fallback is True or has_script:
+                return self._from_sourcedir(groups)
             else:
-                return None
+                return dict.fromkeys(groups)
 
         elif extract_method == 'script':
-            if use_fallback is True or self._has_meson_script() and self._is_sourcedir():
-                return MesonScriptReader(self.sourcedir).extract_from(group=group)
+            if use_fallback is True or has_script:
+                return self._from_sourcedir(groups)
             else:
-                return None
+                return dict.fromkeys(groups)
         else:
             raise MesonUiException(f'Extract method {extract_method} not found in Meson "JSON" API!')
 
-    def _is_builddir(self):
-        return True if Path(self._builddir).exists() and \
-            Path(self._builddir).is_dir() else False
+    def iter_object(self, group: str = None) -> any:
+        '''
+        this method yields the items of a list group one by one.  They are
+        streamed from the build directory files when there are any, else
+        the group is read from the script like "get_object" does.
+        Streamed items are never cached.
+        '''
+        if not isinstance(group, str):
+            raise MesonUiException(f'API group key pair {type(group)} is not valid type!')
+        if group not in _MESON_STREAM_FILES:
+            raise MesonUiException(f'API group {group} can not be streamed from Meson "JSON" API!')
+
+        state: ProjectState = self.state()
+        if state.is_builddir and (group == 'testlog' or state.has_intro_files):
+            return MesonBuilddirLoader(self.builddir).iter_from(group=group)
+        if group not in SCRIPT_GROUPS:
+            return iter([])
+        info: any = self.get_object(group=group, extract_method='script')
+        if isinstance(info, dict):
+            #
+            # The script reader hands back "tests" and "benchmarks" wrapped
+            # in an object holding only that key.
+            info = info.get(group)
+        return iter(info if info is not None else [])
+
+    def _from_builddir(self, extract_method: str, groups: list, extractor) -> dict:
+        stamps: dict = {}
+        for group in groups:
+            stamps[group] = builddir_stamp(self.builddir, group)
+        return self._from_cache(extract_method, str(self.builddir), stamps,
+                                lambda missing: extractor(self.builddir).extract_many(groups=missing))
 
-    def _is_sourcedir(self):
-        return True if Path(self._sourcedir).exists() and \
-            Path(self._sourcedir).is_dir() else False
+    def _from_sourcedir(self, groups: list) -> dict:
+        stamp: tuple = sourcedir_stamp(self.sourcedir)
+        return self._from_cache('script', str(self.sourcedir), dict.fromkeys(groups, stamp),
+                                lambda missing: self._script_reader(stamp).extract_many(groups=missing))
 
-    def _has_meson_script(self):
-        return True if Path(join_paths(self._sourcedir, 'meson.build')).exists() else False
+    def _script_reader(self, stamp: tuple) -> MesonScriptReader:
+        #
+        # Each source directory gets its own warm worker, which answers
+        # again from memory while the stamp of the scripts is the same.
+        engine = script_engines.engine(str(Path(self.sourcedir).resolve()))
+        return MesonScriptReader(self.sourcedir, engine=engine, stamp=stamp)
+
+    def _from_cache(self, extract_method: str, directory: str, stamps: dict, extract_many) -> dict:
+        objects: dict = {}
+        missing: list = []
+        for group in stamps:
+            found, info = self._cache.lookup((extract_method, group, directory), stamps[group])
+            if found:
+                objects[group] = info
+            else:
+                missing.append(group)
 
-    def _has_intro_files(self):
-        for file in range(len(_MESON_INTRO_FILES)):
-            if not Path(join_paths(self._builddir, 'meson-info', _MESON_INTRO_FILES[file])).exists():
-                return False
-        return True
+        if missing:
+            fetched: dict = extract_many(missing)
+            for group in missing:
+                self._cache.store((extract_method, group, directory), stamps[group], fetched[group])
+                objects[group] = fetched[group]
+        return objects
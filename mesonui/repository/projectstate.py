@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from .dataloader import _MESON_INTRO_FILES
+from .datacache import stat_stamp
+from os.path import join as join_paths
+from os.path import isdir
+from os.path import exists
+import threading
+import logging
+import json
+
+#
+# How many (sourcedir, builddir) pairs keep their last state.
+PROJECT_STATE_ENTRIES: int = 8
+
+
+def _state_stamp(sourcedir, builddir) -> tuple:
+    #
+    # Meson rewrites "meson-info.json" on every (re)configure.  A file
+    # added to or removed from the top of either directory (a new build
+    # directory, "meson init" writing the script, a "subprojects" folder)
+    # changes the stamp of that directory.
+    return (
+        stat_stamp(join_paths(str(builddir), 'meson-info', 'meson-info.json')),
+        stat_stamp(str(builddir)),
+        stat_stamp(str(sourcedir))
+    )
+
+
+class ProjectState:
+    '''
+    this class is a snapshot of what a source and build directory hold,
+    taken from "meson-info/meson-info.json" and a few stats.  The API and
+    the action guards of the main window read it instead of checking
+    every file on their own.
+
+    A snapshot never changes, "is_current" tells whether it still matches
+    the disk (three stats).
+    '''
+    def __init__(self, sourcedir, builddir):
+        self.sourcedir: str = str(sourcedir)
+        self.builddir: str = str(builddir)
+        self.stamp: tuple = _state_stamp(sourcedir, builddir)
+        self.is_sourcedir: bool = isdir(self.sourcedir)
+        self.has_meson_script: bool = exists(join_paths(self.sourcedir, 'meson.build'))
+        self.has_subprojects: bool = exists(join_paths(self.sourcedir, 'subprojects'))
+        self.is_builddir: bool = isdir(self.builddir)
+        self.has_build_ninja: bool = self.is_builddir and exists(join_paths(self.builddir, 'build.ninja'))
+        self.meson_info: dict = self._read_meson_info() if self.stamp[0][1] is not None else None
+        self.has_intro_files: bool = self._intro_files_listed()
+
+    def _read_meson_info(self) -> dict:
+        try:
+            with open(join_paths(self.builddir, 'meson-info', 'meson-info.json')) as loaded_json:
+                return json.loads(loaded_json.read())
+        except (OSError, ValueError) as error:
+            logging.warning(f'Can not read meson-info.json: {error}')
+            return None
+
+    def _intro_files_listed(self) -> bool:
+        #
+        # Meson lists every intro file it wrote.  "meson configure" only
+        # writes the build options again and marks the others as not
+        # "updated", they are still the ones of the last setup.
+        if not isinstance(self.meson_info, dict) or self.meson_info.get('error', False):
+            return False
+        information: dict = self.meson_info.get('introspection', {}).get('information', {})
+        listed: set = set(info.get('file') for info in information.values())
+        listed.add('meson-info.json')
+        return all(name in listed and exists(join_paths(self.builddir, 'meson-info', name))
+                   for name in _MESON_INTRO_FILES)
+
+    @property
+    def generation(self) -> tuple:
+        '''
+        the stamp of "meson-info.json", it changes with every (re)configure.
+        '''
+        return self.stamp[0]
+
+    @property
+    def meson_version(self) -> str:
+        if not isinstance(self.meson_info, dict):
+            return None
+        return self.meson_info.get('meson_version', {}).get('full')
+
+    def is_current(self) -> bool:
+        return _state_stamp(self.sourcedir, self.builddir) == self.stamp
+
+    def __repr__(self) -> str:
+        return (f'<ProjectState sourcedir={self.sourcedir} builddir={self.builddir} '
+                f'script={self.has_meson_script} intro={self.has_intro_files}>')
+
+
+class ProjectStates:
+    '''
+    this class hands out the state of a source and build directory pair,
+    a state is only taken again once it no longer matches the disk.
+    '''
+    def __init__(self, size: int = PROJECT_STATE_ENTRIES):
+        self.size: int = size
+        self._states: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, sourcedir, builddir) -> ProjectState:
+        key: tuple = (str(sourcedir), str(builddir))
+        with self._lock:
+            state: ProjectState = self._states.pop(key, None)
+        if state is None or not state.is_current():
+            state = ProjectState(sourcedir, builddir)
+        with self._lock:
+            self._states[key] = state
+            while len(self._states) > max(self.size, 1):
+                self._states.pop(next(iter(self._states)))
+        return state
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+
+
+#
+# States shared by every MesonAPI object and the main window.
+project_states: ProjectStates = ProjectStates()
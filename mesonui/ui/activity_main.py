@@ -49,29 +49,32 @@ class Ui_Activity_Main_Window(object):
         self.tabWidget.setObjectName("tabWidget")
         self.tab = QtWidgets.QWidget()
         self.tab.setObjectName("tab")
-        self.buildoptions_list = QtWidgets.QListWidget(self.tab)
+        self.buildoptions_list = QtWidgets.QListView(self.tab)
         self.buildoptions_list.setGeometry(QtCore.QRect(20, 0, 811, 171))
         self.buildoptions_list.setStyleSheet("")
         self.buildoptions_list.setFrameShape(QtWidgets.QFrame.Panel)
         self.buildoptions_list.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.buildoptions_list.setUniformItemSizes(True)
         self.buildoptions_list.setObjectName("buildoptions_list")
         self.tabWidget.addTab(self.tab, "")
         self.tab_4 = QtWidgets.QWidget()
         self.tab_4.setObjectName("tab_4")
-        self.projectinfo_list = QtWidgets.QListWidget(self.tab_4)
+        self.projectinfo_list = QtWidgets.QListView(self.tab_4)
         self.projectinfo_list.setGeometry(QtCore.QRect(20, 0, 811, 171))
         self.projectinfo_list.setStyleSheet("")
         self.projectinfo_list.setFrameShape(QtWidgets.QFrame.Panel)
         self.projectinfo_list.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.projectinfo_list.setUniformItemSizes(True)
         self.projectinfo_list.setObjectName("projectinfo_list")
         self.tabWidget.addTab(self.tab_4, "")
         self.tab_3 = QtWidgets.QWidget()
         self.tab_3.setObjectName("tab_3")
-        self.testsinfo_list = QtWidgets.QListWidget(self.tab_3)
+        self.testsinfo_list = QtWidgets.QListView(self.tab_3)
         self.testsinfo_list.setGeometry(QtCore.QRect(20, 0, 811, 171))
         self.testsinfo_list.setStyleSheet("")
         self.testsinfo_list.setFrameShape(QtWidgets.QFrame.Panel)
         self.testsinfo_list.setFrameShadow(QtWidgets.QFrame.Sunken)
+        self.testsinfo_list.setUniformItemSizes(True)
         self.testsinfo_list.setObjectName("testsinfo_list")
         self.tabWidget.addTab(self.tab_3, "")
         self.layoutWidget = QtWidgets.QWidget(self.centralwidget)
@@ -208,6 +211,8 @@ class Ui_Activity_Main_Window(object):
         self.action_meson_init.setObjectName("action_meson_init")
         self.action_meson_setup = QtWidgets.QAction(Activity_Main_Window)
         self.action_meson_setup.setObjectName("action_meson_setup")
+        self.action_meson_matrix = QtWidgets.QAction(Activity_Main_Window)
+        self.action_meson_matrix.setObjectName("action_meson_matrix")
         self.action_meson_build = QtWidgets.QAction(Activity_Main_Window)
         self.action_meson_build.setObjectName("action_meson_build")
         self.action_meson_test = QtWidgets.QAction(Activity_Main_Window)
@@ -264,6 +269,7 @@ class Ui_Activity_Main_Window(object):
         self.menu_meson_actions.addSeparator()
         self.menu_meson_actions.addAction(self.action_meson_init)
         self.menu_meson_actions.addAction(self.action_meson_setup)
+        self.menu_meson_actions.addAction(self.action_meson_matrix)
         self.menu_meson_actions.addAction(self.action_meson_build)
         self.menu_meson_actions.addAction(self.action_meson_test)
         self.menu_meson_actions.addAction(self.action_meson_conf)
@@ -296,11 +302,8 @@ class Ui_Activity_Main_Window(object):
         Activity_Main_Window.setWindowTitle(_translate("Activity_Main_Window", "Meson-UI"))
         self.output_console_dashboard.setTitle(_translate("Activity_Main_Window", "Output Console:"))
         self.intro_dashboard.setTitle(_translate("Activity_Main_Window", "Introspection Dashboard:"))
-        self.buildoptions_list.setSortingEnabled(True)
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab), _translate("Activity_Main_Window", "Meson Build Options"))
-        self.projectinfo_list.setSortingEnabled(True)
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_4), _translate("Activity_Main_Window", "Project Information"))
-        self.testsinfo_list.setSortingEnabled(True)
         self.tabWidget.setTabText(self.tabWidget.indexOf(self.tab_3), _translate("Activity_Main_Window", "Unit Tests"))
         self.control_push_init.setText(_translate("Activity_Main_Window", "Init Project"))
         self.control_push_setup.setText(_translate("Activity_Main_Window", "Setup Project"))
@@ -325,6 +328,7 @@ class Ui_Activity_Main_Window(object):
         self.actionMeson_QnA.setText(_translate("Activity_Main_Window", "Meson QnA"))
         self.action_meson_init.setText(_translate("Activity_Main_Window", "Init new project"))
         self.action_meson_setup.setText(_translate("Activity_Main_Window", "Setup project"))
+        self.action_meson_matrix.setText(_translate("Activity_Main_Window", "Setup matrix"))
         self.action_meson_build.setText(_translate("Activity_Main_Window", "Compile project"))
         self.action_meson_test.setText(_translate("Activity_Main_Window", "Run tests"))
         self.action_meson_conf.setText(_translate("Activity_Main_Window", "Configure project"))
@@ -17,21 +17,21 @@ from ..mesonuilib.coredata import default_base
 from ..mesonuilib.coredata import default_test
 from ..mesonuilib.coredata import default_path
 from ..mesonuilib.coredata import default_backend
+from ..mesonuilib.optiondelta import OptionDelta
 from ..mesonuilib.backend import backend_factory
 from ..repository.mesonapi import MesonAPI
 from ..models.appmodel import MainModel
 from ..mesonuitheme import MesonUiTheme
 from ..containers.stack import MesonUiStack
+from .options_activity import MESON_BACKENDS
+from .options_activity import OptionsActivity
 
-from pathlib import Path
 import logging
 
 from ..ui.activity_conf import Ui_Activity_Configure_Dialog
 
-MESON_BACKENDS = ['xcode', 'ninja', 'vs2010', 'vs2015', 'vs2017', 'vs2019']
 
-
-class ConfigureActivity(QDialog, Ui_Activity_Configure_Dialog):
+class ConfigureActivity(QDialog, Ui_Activity_Configure_Dialog, OptionsActivity):
     '''
     this class is are Configure Activity
     '''
@@ -64,6 +64,7 @@ class ConfigureActivity(QDialog, Ui_Activity_Configure_Dialog):
 
         self._cache.init_cache()
         self._cache_default()
+        self._cache_from_api()
 
     @pyqtSlot()
     def exec_no_setup(self):
@@ -98,18 +99,19 @@ class ConfigureActivity(QDialog, Ui_Activity_Configure_Dialog):
             meson_args: MesonUiStack = MesonUiStack()
 
             self._cache_update()
-            self._cache_parser(meson_args=meson_args)
-            self._cache_sender(meson_args=meson_args)
+            delta: OptionDelta = OptionDelta.from_api(self.meson_api, self._cache_options())
+            if delta is not None:
+                #
+                # the build directory is set up already, so only the
+                # options that changed are passed to Meson.
+                self._delta_sender(delta)
+            else:
+                self._cache_parser(meson_args=meson_args)
+                self._cache_sender(meson_args=meson_args)
         #
         # then close are activity
         self.close()
 
-    def _cache_from_api(self, meson_args: MesonUiStack) -> None:
-        #
-        # TODO: this method should get introspection data from
-        #       Meson builddir API if builddir is found.
-        pass
-
     def _cache_sender(self, meson_args: MesonUiStack) -> None:
         '''
         this method will send the set to are Meson wrapper object
@@ -178,10 +180,6 @@ class ConfigureActivity(QDialog, Ui_Activity_Configure_Dialog):
         # are cache object.
         for conf in back:
             meson_args.push([f'{conf}={back[conf]}'])
-        #
-        # here we wipe the current builddir if it exists and start new
-        if Path(self._model.buildsystem().meson().builddir).exists():
-            meson_args.push(['--wipe'])
 
     def _cache_update(self) -> None:
         '''
@@ -201,8 +199,10 @@ class ConfigureActivity(QDialog, Ui_Activity_Configure_Dialog):
         self._cache.configure_core('wrap-mode',         self.combo_wrap_mode.currentText())
         self._cache.configure_core('werror',            self.combo_werror.currentText())
         self._cache.configure_core('strip',             self.combo_strip.currentText())
-        self._cache.configure_core('cmake-prefix-path', self.edit_cmake_prefix_path.text())
-        self._cache.configure_core('pkg-config-path',   self.edit_pkg_config_path.text())
+        if self.edit_cmake_prefix_path.text() != '':
+            self._cache.configure_core('cmake-prefix-path', self.edit_cmake_prefix_path.text())
+        if self.edit_pkg_config_path.text() != '':
+            self._cache.configure_core('pkg-config-path', self.edit_pkg_config_path.text())
         #
         # Meson args passed for (Base options)
         self._cache.configure_base('b_colorout',  self.combo_b_colorout.currentText())
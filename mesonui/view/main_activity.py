@@ -14,20 +14,19 @@ from PyQt5.QtGui import QDesktopServices
 from PyQt5.QtCore import QUrl
 from PyQt5.QtCore import pyqtSlot
 from PyQt5.QtCore import QDir
-
-from .subprojects_activity import SubprojectsActivity
-from .install_activity import InstallActivity
-from .setup_activity import SetupActivity
-from .conf_activity import ConfigureActivity
-from .dist_activity import DistActivity
-from .init_activity import InitActivity
-from .wrap_activity import WrapActivity
-
+#
+# The other activities are imported by the slots that open them, so
+# none of them is loaded before the user asks for it.
 from ..repository.mesonapi import MesonAPI
+from ..repository.projectstate import ProjectState
+from ..repository.projectstate import project_states
 from ..dashboard.appdashboard import IntrospectionDashboard
+from ..dashboard.introwatcher import IntrospectionWatcher
 from ..mesonuilib.outputconsole import OutputConsole
+from ..mesonuilib.processrunner import default_runner
 from ..models.appmodel import MainModel
 from ..mesonuitheme import MesonUiTheme
+from .progressbar import BuildProgressBar
 from os.path import join
 from pathlib import Path
 import logging
@@ -98,6 +97,7 @@ class MainActivity(QMainWindow, Ui_Activity_Main_Window):
         self.action_meson_dist.triggered.connect(lambda: self.exec_dist())
         self.action_meson_init.triggered.connect(lambda: self.exec_init())
         self.action_meson_test.triggered.connect(lambda: self.exec_test())
+        self.action_meson_matrix.triggered.connect(lambda: self.exec_matrix())
 
         self.action_ninja_version.triggered.connect(lambda: self._model.buildsystem().ninja().version())
         self.action_ninja_install.triggered.connect(lambda: self._model.buildsystem().ninja().install())
@@ -108,7 +108,10 @@ class MainActivity(QMainWindow, Ui_Activity_Main_Window):
 
         self.meson_api: MesonAPI = MesonAPI(str(self.get_sourcedir()), str(self.get_builddir()))
         self.console: OutputConsole = OutputConsole(self)
+        self.progress: BuildProgressBar = BuildProgressBar(self)
         self.dashboard: IntrospectionDashboard = IntrospectionDashboard(self, self.meson_api)
+        self.watcher: IntrospectionWatcher = IntrospectionWatcher(self.meson_api)
+        self.watcher.changed.connect(lambda groups: self.dashboard.refresh(self.meson_api, groups))
         self.exec_introspect()
 
     @pyqtSlot()
@@ -129,13 +132,15 @@ class MainActivity(QMainWindow, Ui_Activity_Main_Window):
         self._model.buildsystem().meson().builddir = self.get_builddir()
         self.meson_api.sourcedir = self.get_sourcedir()
         self.meson_api.builddir = self.get_builddir()
+        self.watcher.rewatch()
 
+        from .setup_activity import SetupActivity
         SetupActivity(self.console, model=self._model)
 
     @pyqtSlot()
     def exec_conf(self) -> None:
-        if not Path(join(self.get_builddir(), 'build.ninja')).exists() and \
-           not Path(self.get_builddir()).is_dir():
+        state: ProjectState = self.project_state()
+        if not state.has_build_ninja and not state.is_builddir:
             logging.warning('Block user from this action "builddir" directory not found')
             SnackBarMessage.warning(self, 'No builddir found',
                                           'There was no builddir found. Stop action.')
@@ -145,61 +150,81 @@ class MainActivity(QMainWindow, Ui_Activity_Main_Window):
         self._model.buildsystem().meson().builddir = self.get_builddir()
         self.meson_api.sourcedir = self.get_sourcedir()
         self.meson_api.builddir = self.get_builddir()
+        self.watcher.rewatch()
 
+        from .conf_activity import ConfigureActivity
         ConfigureActivity(self.console, model=self._model)
-        self.dashboard.update(self.meson_api)
+        self.dashboard.refresh(self.meson_api)
+
+    @pyqtSlot()
+    def exec_matrix(self) -> None:
+        if not self.project_state().has_meson_script:
+            logging.warning('Block user from this action "meson.build" script not found')
+            SnackBarMessage.warning(self, 'No Meson script found',
+                                          'There was no meson.build found. Stop action.')
+            return
+        logging.info('Setup matrix of build directories')
+        self._model.buildsystem().meson().sourcedir = self.get_sourcedir()
+
+        from .matrix_activity import MatrixActivity
+        self.matrix_activity = MatrixActivity(self.console, model=self._model)
 
     @pyqtSlot()
     def exec_compile(self) -> None:
-        if not Path(join(self.get_builddir(), 'build.ninja')).exists() and \
-           not Path(self.get_builddir()).is_dir():
+        state: ProjectState = self.project_state()
+        if not state.has_build_ninja and not state.is_builddir:
             logging.warning('Block user from this action "builddir" directory not found')
             SnackBarMessage.warning(self, 'No builddir found',
                                           'There was no builddir found. Stop action.')
             return
         logging.info('Compile build project')
-        self.console.command_run(str(self._model.buildsystem().meson().compile()))
-        self.dashboard.update(self.meson_api)
+        handle = self._model.buildsystem().meson().compile_async()
+        self.progress.track(handle)
+        self.console.command_start(handle, on_finished=lambda handle: self.dashboard.refresh(self.meson_api))
 
     @pyqtSlot()
     def exec_build(self) -> None:
-        if not Path(join(self.get_builddir(), 'build.ninja')).exists() and \
-           not Path(self.get_builddir()).is_dir():
+        state: ProjectState = self.project_state()
+        if not state.has_build_ninja and not state.is_builddir:
             logging.warning('Block user from this action "builddir" directory not found')
             SnackBarMessage.warning(self, 'No builddir found',
                                           'There was no builddir found. Stop action.')
             return
         logging.info('Build project with "ninja" command')
-        self.console.command_run(str(self._model.buildsystem().meson().build()))
-        self.dashboard.update(self.meson_api)
+        handle = self._model.buildsystem().meson().build_async()
+        self.progress.track(handle)
+        self.console.command_start(handle, on_finished=lambda handle: self.dashboard.refresh(self.meson_api))
 
     @pyqtSlot()
     def exec_introspect(self) -> None:
         logging.info('Getting project introspection data with "meson introspect" command')
-        if Path(join(self.get_sourcedir(), 'meson.build')):
-            self.dashboard.update(self.meson_api)
+        state: ProjectState = self.project_state()
+        if state.has_meson_script or state.has_intro_files:
+            self.dashboard.refresh(self.meson_api)
 
     @pyqtSlot()
     def exec_subprojects(self) -> None:
-        if not Path(join(self.get_sourcedir(), 'subprojects')).exists():
+        if not self.project_state().has_subprojects:
             logging.warning('Block user from this action "subprojects" directory not found')
             SnackBarMessage.warning(self, 'No builddir found',
                                           'There was no subprojects directory found. Stop action.')
             return
         logging.info('Subproject manager with "meson subprojects" command')
+        from .subprojects_activity import SubprojectsActivity
         SubprojectsActivity(model=self._model)
-        self.dashboard.update(self.meson_api)
+        self.dashboard.refresh(self.meson_api)
 
     @pyqtSlot()
     def exec_wrap(self) -> None:
-        if not Path(join(self.get_sourcedir(), 'subprojects')).exists():
+        if not self.project_state().has_subprojects:
             logging.warning(' Block user from this action "subprojects" directory not found')
             SnackBarMessage.warning(self, 'No builddir found',
                                           'There was no subprojects directory found. Stop action.')
             return
         logging.info(' WrapDB manager with "meson wrap" command')
+        from .wrap_activity import WrapActivity
         WrapActivity(model=self._model)
-        self.dashboard.update(self.meson_api)
+        self.dashboard.refresh(self.meson_api)
 
     @pyqtSlot()
     def exec_test(self) -> None:
@@ -209,15 +234,15 @@ class MainActivity(QMainWindow, Ui_Activity_Main_Window):
                                           'Both entry values should not be the same.')
             return
 
-        if not Path(join(self.get_builddir(), 'build.ninja')).exists() and \
-           not Path(self.get_builddir()).is_dir():
+        state: ProjectState = self.project_state()
+        if not state.has_build_ninja and not state.is_builddir:
             logging.warning(' Block user from this action "builddir" directory not found')
             SnackBarMessage.warning(self, 'No builddir found',
                                           'There was no builddir found. Stop action.')
             return
         logging.info('Run test cases written in the script')
-        self.console.command_run(str(self._model.buildsystem().meson().test()))
-        self.dashboard.update(self.meson_api)
+        self.console.command_start(self._model.buildsystem().meson().test_async(),
+                                   on_finished=lambda handle: self.dashboard.refresh(self.meson_api))
 
     @pyqtSlot()
     def exec_clean(self) -> None:
@@ -227,14 +252,14 @@ class MainActivity(QMainWindow, Ui_Activity_Main_Window):
                                           'Both entry values should not be the same.')
             return
 
-        if not Path(join(self.get_builddir(), 'build.ninja')).exists() and \
-           not Path(self.get_builddir()).is_dir():
+        state: ProjectState = self.project_state()
+        if not state.has_build_ninja and not state.is_builddir:
             logging.warning(' Block user from this action "builddir" directory not found')
             SnackBarMessage.warning(self, 'No builddir found',
                                           'There was no builddir found. Stop action.')
             return
         logging.info('Cleanning project directory')
-        self.console.command_run(str(self._model.buildsystem().meson().clean()))
+        self.console.command_start(self._model.buildsystem().meson().clean_async())
 
     @pyqtSlot()
     def exec_install(self) -> None:
@@ -244,13 +269,14 @@ class MainActivity(QMainWindow, Ui_Activity_Main_Window):
                                           'Both entry values should not be the same.')
             return
 
-        if not Path(join(self.get_builddir(), 'build.ninja')).exists() and \
-           not Path(self.get_builddir()).is_dir():
+        state: ProjectState = self.project_state()
+        if not state.has_build_ninja and not state.is_builddir:
             logging.warning(' Block user from this action "builddir" directory not found')
             SnackBarMessage.warning(self, 'No builddir found',
                                           'There was no builddir found. Stop action.')
             return
         logging.info(' Install project with "meson install" command')
+        from .install_activity import InstallActivity
         InstallActivity(model=self._model)
 
     @pyqtSlot()
@@ -258,8 +284,9 @@ class MainActivity(QMainWindow, Ui_Activity_Main_Window):
         self._model.buildsystem().meson().sourcedir = self.get_sourcedir()
         self._model.buildsystem().meson().builddir = self.get_builddir()
         logging.info(' Init new project template with "meson init" command')
+        from .init_activity import InitActivity
         InitActivity(model=self._model)
-        self.dashboard.update(self.meson_api)
+        self.dashboard.refresh(self.meson_api)
 
     @pyqtSlot()
     def exec_dist(self) -> None:
@@ -268,14 +295,15 @@ class MainActivity(QMainWindow, Ui_Activity_Main_Window):
                                           'Both entry values should not be the same.')
             return
 
-        if not Path(join(self.get_builddir(), 'build.ninja')).exists() and \
-           not Path(self.get_builddir()).is_dir():
+        state: ProjectState = self.project_state()
+        if not state.has_build_ninja and not state.is_builddir:
             SnackBarMessage.warning(self, 'No builddir found',
                                           'There was no builddir found. Stop action.')
             return
         logging.info(' Create project with "meson dist" command')
         self._model.buildsystem().meson().sourcedir = self.get_sourcedir()
         self._model.buildsystem().meson().builddir = self.get_builddir()
+        from .dist_activity import DistActivity
         DistActivity(model=self._model)
 
     @pyqtSlot()
@@ -288,12 +316,26 @@ class MainActivity(QMainWindow, Ui_Activity_Main_Window):
             self._model.buildsystem().ninja().builddir = join(source_root, 'builddir')
             self.meson_api.sourcedir = source_root
             self.meson_api.builddir = join(source_root, 'builddir')
+            self.watcher.rewatch()
             self.project_sourcedir.setText(str(self._model.buildsystem().meson().sourcedir))
             self.project_builddir.setText(str(self._model.buildsystem().meson().builddir))
         else:
             logging.info(' User just closed file dialog.')
             return
-        self.dashboard.update(self.meson_api)
+        self.dashboard.refresh(self.meson_api)
+
+    def closeEvent(self, event) -> None:
+        logging.info('Stop all background processes before closing')
+        default_runner.cancel_all()
+        self.dashboard.shutdown()
+        super().closeEvent(event)
+
+    def project_state(self) -> ProjectState:
+        '''
+        this method gives back the state of the directories entered, it is
+        only taken again once the directories changed on disk.
+        '''
+        return project_states.get(self.get_sourcedir(), self.get_builddir())
 
     @pyqtSlot()
     def get_sourcedir(self) -> T.AnyStr:
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from PyQt5.QtWidgets import QAbstractItemView
+from PyQt5.QtWidgets import QTableWidgetItem
+from PyQt5.QtWidgets import QTableWidget
+from PyQt5.QtWidgets import QHBoxLayout
+from PyQt5.QtWidgets import QVBoxLayout
+from PyQt5.QtWidgets import QPushButton
+from PyQt5.QtWidgets import QListWidgetItem
+from PyQt5.QtWidgets import QListWidget
+from PyQt5.QtWidgets import QSpinBox
+from PyQt5.QtWidgets import QDialog
+from PyQt5.QtWidgets import QLabel
+from PyQt5.QtCore import pyqtSlot
+from PyQt5.QtCore import QTimer
+from PyQt5.QtCore import Qt
+
+from ..mesonuilib.setupmatrix import SetupMatrix
+from ..mesonuilib.setupmatrix import MatrixEntry
+from ..mesonuilib.setupmatrix import MATRIX_FAILED
+from ..mesonuilib.setupmatrix import matrix_jobs
+from ..mesonuilib.outputconsole import CONSOLE_FRAME_INTERVAL
+from ..mesonuilib.profiles import SETUP_PROFILES
+from ..models.appmodel import MainModel
+from ..mesonuitheme import MesonUiTheme
+import logging
+
+#
+# Profiles checked when the activity opens.
+MATRIX_PROFILES: list = ['debug', 'release', 'asan', 'tsan', 'lto']
+#
+# Columns of the result table.
+MATRIX_COLUMNS: list = ['Profile', 'Status', 'Time', 'Build directory']
+
+
+class MatrixActivity(QDialog):
+    '''
+    this class is the setup matrix dialog, it sets up one build
+    directory for each profile checked and shows how long each one took
+    and which failed in one table.  The table is read from the matrix
+    once per frame on the GUI thread, the same way the build progress is.
+    '''
+    def __init__(self, console, model: MainModel = None):
+        super(self.__class__, self).__init__()
+        self.setStyleSheet(MesonUiTheme().set_theme())
+        self.setWindowTitle('Meson setup matrix')
+        self.resize(740, 421)
+
+        self._model: MainModel = model
+        self._console = console
+        self.matrix: SetupMatrix = None
+
+        self.on_activity_start()
+        self.show()
+
+    @pyqtSlot()
+    def on_activity_start(self) -> None:
+        '''
+        this method builds the profile list, the result table and the
+        buttons of the dialog.
+        '''
+        self.list_profiles: QListWidget = QListWidget(self)
+        for name in SETUP_PROFILES:
+            item: QListWidgetItem = QListWidgetItem(name, self.list_profiles)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Checked if name in MATRIX_PROFILES else Qt.Unchecked)
+        self.list_profiles.setMaximumWidth(180)
+
+        self.spin_jobs: QSpinBox = QSpinBox(self)
+        self.spin_jobs.setRange(1, matrix_jobs(len(SETUP_PROFILES)))
+        self.spin_jobs.setValue(matrix_jobs(len(MATRIX_PROFILES)))
+
+        self.table_results: QTableWidget = QTableWidget(0, len(MATRIX_COLUMNS), self)
+        self.table_results.setHorizontalHeaderLabels(MATRIX_COLUMNS)
+        self.table_results.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table_results.horizontalHeader().setStretchLastSection(True)
+
+        self.label_summary: QLabel = QLabel('', self)
+        self.control_push_do_matrix: QPushButton = QPushButton('Setup', self)
+        self.control_push_no_matrix: QPushButton = QPushButton('Cancel', self)
+        self.control_push_do_matrix.clicked.connect(lambda: self.exec_do_matrix())
+        self.control_push_no_matrix.clicked.connect(lambda: self.exec_no_matrix())
+
+        jobs: QHBoxLayout = QHBoxLayout()
+        jobs.addWidget(QLabel('Parallel runs', self))
+        jobs.addWidget(self.spin_jobs)
+        jobs.addStretch()
+        profiles: QVBoxLayout = QVBoxLayout()
+        profiles.addWidget(self.list_profiles)
+        profiles.addLayout(jobs)
+        content: QHBoxLayout = QHBoxLayout()
+        content.addLayout(profiles)
+        content.addWidget(self.table_results)
+        controls: QHBoxLayout = QHBoxLayout()
+        controls.addWidget(self.label_summary)
+        controls.addStretch()
+        controls.addWidget(self.control_push_no_matrix)
+        controls.addWidget(self.control_push_do_matrix)
+        layout: QVBoxLayout = QVBoxLayout(self)
+        layout.addLayout(content)
+        layout.addLayout(controls)
+
+        self._timer: QTimer = QTimer(self)
+        self._timer.timeout.connect(self._poll)
+
+    def checked_profiles(self) -> dict:
+        profiles: dict = dict()
+        for row in range(self.list_profiles.count()):
+            item: QListWidgetItem = self.list_profiles.item(row)
+            if item.checkState() == Qt.Checked:
+                profiles[item.text()] = SETUP_PROFILES[item.text()]
+        return profiles
+
+    def is_busy(self) -> bool:
+        return self._timer.isActive()
+
+    @pyqtSlot()
+    def exec_do_matrix(self) -> None:
+        '''
+        this method sets up the build directories of every profile checked
+        next to each other in the source directory.
+        '''
+        if self.is_busy():
+            return
+        self.matrix = SetupMatrix(self._model.buildsystem().meson().sourcedir, self.checked_profiles(),
+                                  jobs=self.spin_jobs.value())
+        self.table_results.setRowCount(len(self.matrix.entries))
+        self.control_push_do_matrix.setEnabled(False)
+        self.control_push_no_matrix.setText('Stop')
+        self.matrix.start()
+        self._timer.start(CONSOLE_FRAME_INTERVAL)
+        self._poll()
+
+    @pyqtSlot()
+    def exec_no_matrix(self) -> None:
+        '''
+        this method stops a running matrix, or closes the dialog once
+        nothing runs.
+        '''
+        if self.is_busy():
+            logging.info('User stops the setup matrix')
+            self.matrix.cancel()
+            return
+        self.close()
+
+    def _poll(self) -> None:
+        for row, entry in enumerate(self.matrix.entries):
+            self._show_entry(row, entry)
+        failed: list = self.matrix.failed()
+        self.label_summary.setText(f'{len(self.matrix.entries)} profiles, {len(failed)} failed, '
+                                   f'{self.matrix.elapsed:.1f}s')
+        if not self.matrix.is_running():
+            self._timer.stop()
+            self.control_push_do_matrix.setEnabled(True)
+            self.control_push_no_matrix.setText('Close')
+            if self._console is not None:
+                self._console.command_run('\n'.join(self.matrix.summary()))
+
+    def _show_entry(self, row: int, entry: MatrixEntry) -> None:
+        seconds: float = entry.elapsed if entry.handle is None or entry.elapsed is not None else entry.handle.elapsed
+        elapsed: str = f'{seconds:.1f}s' if seconds is not None else ''
+        status: str = entry.status if entry.command is None else f'{entry.status} ({entry.command})'
+        for column, text in enumerate([entry.profile, status, elapsed, entry.builddir]):
+            item: QTableWidgetItem = self.table_results.item(row, column)
+            if item is None:
+                item = QTableWidgetItem()
+                self.table_results.setItem(row, column, item)
+            item.setText(text)
+        if entry.status == MATRIX_FAILED:
+            self.table_results.item(row, 1).setToolTip(entry.errors())
+
+    def closeEvent(self, event) -> None:
+        if self.matrix is not None and self.matrix.is_running():
+            self.matrix.cancel()
+        self._timer.stop()
+        super().closeEvent(event)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from ..mesonuilib.optiondelta import OptionDelta
+from ..mesonuilib.optiondelta import option_value
+from ..mesonuilib.mesonapi.buildoptions import BuildOption
+from ..mesonuilib.mesonapi.buildoptions import MesonBuildOption
+from ..mesonuilib.processrunner import ProcessHandle
+from ..mesonuilib.backend import backend_factory
+
+import logging
+
+MESON_BACKENDS = ['xcode', 'ninja', 'vs2010', 'vs2015', 'vs2017', 'vs2019']
+
+
+class OptionsActivity:
+    '''
+    this class is the part the Setup and Configure Activity share, it
+    loads every option from the build directory and passes the options
+    that changed to Meson.  It is mixed into both dialogs and uses their
+    option widgets, "_cache", "_console", "_model" and "meson_api".
+    '''
+    def _cache_from_api(self) -> None:
+        '''
+        this method sets every option to the value it has in the build
+        directory, if there is one set up already.  Compiler and project
+        options have no widget, they are kept in the cache as they are.
+        '''
+        if not self.meson_api.state().has_intro_files:
+            return
+        options: BuildOption = BuildOption(self.meson_api)
+        #
+        # Meson args passed for (Core options)
+        self._load_combo(self.combo_auto_features,   options.get('auto_features'))
+        self._load_combo(self.combo_backend,         options.get('backend'))
+        self._load_combo(self.combo_buildtype,       options.get('buildtype'))
+        self._load_combo(self.combo_default_library, options.get('default_library'))
+        self._load_combo(self.combo_layout,          options.get('layout'))
+        self._load_combo(self.combo_unity,           options.get('unity'))
+        self._load_combo(self.combo_warnlevel,       options.get('warning_level'))
+        self._load_combo(self.combo_wrap_mode,       options.get('wrap_mode'))
+        self._load_combo(self.combo_werror,          options.get('werror'))
+        self._load_combo(self.combo_strip,           options.get('strip'))
+        self._load_edit(self.edit_cmake_prefix_path, options.get('cmake_prefix_path'))
+        self._load_edit(self.edit_pkg_config_path,   options.get('pkg_config_path'))
+        #
+        # Meson args passed for (Base options)
+        self._load_combo(self.combo_b_colorout,  options.get('b_colorout'))
+        self._load_combo(self.combo_b_coverage,  options.get('b_coverage'))
+        self._load_combo(self.combo_b_lundef,    options.get('b_lundef'))
+        self._load_combo(self.combo_b_ndebug,    options.get('b_ndebug'))
+        self._load_combo(self.combo_b_lto,       options.get('b_lto'))
+        self._load_combo(self.combo_b_pch,       options.get('b_pch'))
+        self._load_combo(self.combo_b_pgo,       options.get('b_pgo'))
+        self._load_combo(self.combo_b_pie,       options.get('b_pie'))
+        self._load_combo(self.combo_b_sanitize,  options.get('b_sanitize'))
+        self._load_combo(self.combo_b_staticpic, options.get('b_staticpic'))
+        self._load_combo(self.combo_b_vscrt,     options.get('b_vscrt'))
+        #
+        # Meson args passed for (Directory options)
+        self._load_edit(self.edit_prexif,         options.get('prefix'))
+        self._load_edit(self.edit_bindir,         options.get('bindir'))
+        self._load_edit(self.edit_datadir,        options.get('datadir'))
+        self._load_edit(self.edit_includedir,     options.get('includedir'))
+        self._load_edit(self.edit_infodir,        options.get('infodir'))
+        self._load_edit(self.edit_libdir,         options.get('libdir'))
+        self._load_edit(self.edit_libexecdir,     options.get('libexecdir'))
+        self._load_edit(self.edit_localedir,      options.get('localedir'))
+        self._load_edit(self.edit_localstatedir,  options.get('localstatedir'))
+        self._load_edit(self.edit_mandir,         options.get('mandir'))
+        self._load_edit(self.edit_sbindir,        options.get('sbindir'))
+        self._load_edit(self.edit_sharedstatedir, options.get('sharedstatedir'))
+        self._load_edit(self.edit_sysconfdir,     options.get('sysconfdir'))
+        #
+        # Meson args passed for (Backend options)
+        self._load_edit(self.edit_backend_max_links, options.get('backend_max_links'))
+        #
+        # Meson args passed for (Test options)
+        self._load_combo(self.combo_errorlogs, options.get('errorlogs'))
+        self._load_combo(self.combo_stdsplit,  options.get('stdsplit'))
+        #
+        # Meson args passed for (Compiler and project options)
+        for option in options.options:
+            if option['section'] in ('compiler', 'user'):
+                self._cache.configure_project(option['name'], option_value(option['value']))
+
+    def _load_combo(self, combo, option: MesonBuildOption) -> None:
+        if option is None or option_value(option.value) == '':
+            return
+        if combo.findText(option_value(option.value)) < 0:
+            combo.addItem(option_value(option.value))
+        combo.setCurrentText(option_value(option.value))
+
+    def _load_edit(self, edit, option: MesonBuildOption) -> None:
+        if option is not None:
+            edit.setText(option_value(option.value))
+
+    def _cache_options(self) -> dict:
+        '''
+        this method gives back the options set in this activity the way
+        the build directory should end up with them.
+        '''
+        options: dict = self._cache.get_options()
+        #
+        # an empty search path can not be kept in the cache, it is what
+        # the build directory has when nothing was added.
+        if self.edit_cmake_prefix_path.text() == '':
+            options['--cmake-prefix-path'] = ''
+        if self.edit_pkg_config_path.text() == '':
+            options['--pkg-config-path'] = ''
+        if options['--backend'] not in MESON_BACKENDS:
+            #
+            # IDE projects are generated next to a Ninja build.
+            options['--backend'] = 'ninja'
+        return options
+
+    def _delta_sender(self, delta: OptionDelta) -> None:
+        '''
+        this method passes the options that changed to "meson configure",
+        the build directory is only wiped when "meson configure" can not
+        change one of them.  Meson runs in the background and its output
+        goes to the console the same way a build does.
+        '''
+        if self._console is None:
+            return
+        backend: str = self.combo_backend.currentText()
+        if delta.is_empty():
+            logging.info(' Build options did not change, nothing to configure')
+            self._ide_sender(backend)
+            return
+        if delta.needs_wipe:
+            logging.info(f' Setup Meson project again, {list(delta.changed)} need a wipe')
+            handle: ProcessHandle = self._model.buildsystem().meson().setup_async(args=delta.setup_args())
+        else:
+            logging.info(f' Configure Meson project with {delta.configure_args()}')
+            handle = self._model.buildsystem().meson().configure_async(args=delta.configure_args())
+
+        def on_finished(handle: ProcessHandle) -> None:
+            if handle.returncode == 0:
+                self._ide_sender(backend)
+
+        self._console.command_start(handle, on_finished=on_finished)
+
+    def _ide_sender(self, backend: str) -> None:
+        '''
+        this method generates the IDE project files when the backend
+        chosen is not one Meson has.
+        '''
+        if backend not in MESON_BACKENDS:
+            ide = backend_factory(backend, self.meson_api)
+            ide.generator()
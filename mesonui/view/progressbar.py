@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from PyQt5.QtWidgets import QProgressBar
+from PyQt5.QtCore import QTimer
+from ..mesonuilib.buildprogress import NinjaProgressParser
+from ..mesonuilib.buildprogress import BuildProgress
+from ..mesonuilib.outputconsole import CONSOLE_FRAME_INTERVAL
+from ..mesonuilib.processrunner import ProcessHandle
+
+#
+# A build that finished no edge for this many seconds is shown as stalled.
+BUILD_STALL_SECONDS: float = 30.0
+
+
+class BuildProgressBar:
+    '''
+    this class shows the progress of a Ninja build in the status bar of
+    the main window.  The progress is read from the parser once per frame
+    on the GUI thread, the same way the output console picks up lines.
+    '''
+    def __init__(self, context=None):
+        self._context = context
+        self._parser: NinjaProgressParser = None
+        self._handle: ProcessHandle = None
+        self._bar: QProgressBar = QProgressBar(context)
+        self._bar.setTextVisible(True)
+        self._bar.setMaximumWidth(240)
+        self._bar.hide()
+        self._context.statusbar.addPermanentWidget(self._bar)
+        self._timer: QTimer = QTimer(context)
+        self._timer.timeout.connect(self._poll)
+
+    def track(self, handle: ProcessHandle) -> NinjaProgressParser:
+        '''
+        this method starts showing the progress of the given build, any
+        build tracked before is no longer shown.
+        '''
+        self._parser = NinjaProgressParser().attach(handle)
+        self._handle = handle
+        self._bar.setRange(0, 0)
+        self._bar.show()
+        self._timer.start(CONSOLE_FRAME_INTERVAL)
+        return self._parser
+
+    def progress(self) -> BuildProgress:
+        return self._parser.progress() if self._parser is not None else None
+
+    def is_busy(self) -> bool:
+        return self._timer.isActive()
+
+    def _poll(self) -> None:
+        running: bool = self._handle.is_running()
+        progress: BuildProgress = self._parser.progress()
+        if progress.total:
+            self._bar.setRange(0, progress.total)
+            self._bar.setValue(progress.finished)
+            self._bar.setFormat('%v/%m')
+        message: str = progress.summary()
+        if progress.idle >= BUILD_STALL_SECONDS and progress.last_edge:
+            message += f', no edge finished for {int(progress.idle)}s, last finished: {progress.last_edge}'
+        elif progress.last_edge:
+            message += f', last finished: {progress.last_edge}'
+        self._context.statusbar.showMessage(message)
+
+        if not running:
+            self._timer.stop()
+            self._bar.hide()
+            self._context.statusbar.showMessage(progress.summary())
@@ -17,21 +17,22 @@ from ..mesonuilib.coredata import default_base
 from ..mesonuilib.coredata import default_test
 from ..mesonuilib.coredata import default_path
 from ..mesonuilib.coredata import default_backend
+from ..mesonuilib.optiondelta import OptionDelta
 from ..mesonuilib.backend import backend_factory
 from ..repository.mesonapi import MesonAPI
 from ..models.appmodel import MainModel
 from ..mesonuitheme import MesonUiTheme
 from ..containers.stack import MesonUiStack
+from .options_activity import MESON_BACKENDS
+from .options_activity import OptionsActivity
 
 from pathlib import Path
 import logging
 
 from ..ui.activity_setup import Ui_Activity_Setup_Dialog
 
-MESON_BACKENDS = ['xcode', 'ninja', 'vs2010', 'vs2015', 'vs2017', 'vs2019']
 
-
-class SetupActivity(QDialog, Ui_Activity_Setup_Dialog):
+class SetupActivity(QDialog, Ui_Activity_Setup_Dialog, OptionsActivity):
     '''
     this class is are Setup Activity
     '''
@@ -65,6 +66,7 @@ class SetupActivity(QDialog, Ui_Activity_Setup_Dialog):
 
         self._cache.init_cache()
         self._cache_default()
+        self._cache_from_api()
 
     @pyqtSlot()
     def exec_no_setup(self):
@@ -99,8 +101,15 @@ class SetupActivity(QDialog, Ui_Activity_Setup_Dialog):
             meson_args: MesonUiStack = MesonUiStack()
 
             self._cache_update()
-            self._cache_parser(meson_args=meson_args)
-            self._cache_sender(meson_args=meson_args)
+            delta: OptionDelta = OptionDelta.from_api(self.meson_api, self._cache_options())
+            if delta is not None:
+                #
+                # the build directory is set up already, so only the
+                # options that changed are passed to Meson.
+                self._delta_sender(delta)
+            else:
+                self._cache_parser(meson_args=meson_args)
+                self._cache_sender(meson_args=meson_args)
         #
         # then close are activity
         self.close()
@@ -174,8 +183,8 @@ class SetupActivity(QDialog, Ui_Activity_Setup_Dialog):
         for conf in back:
             meson_args.push([f'{conf}={back[conf]}'])
         #
-        # here we wipe the current builddir if it exists and start new
-        if Path(self._model.buildsystem().meson().builddir).exists():
+        # here we wipe the current builddir if a setup left it half done
+        if Path(self._model.buildsystem().meson().builddir, 'meson-private').exists():
             meson_args.push(['--wipe'])
 
     def _cache_update(self) -> None:
@@ -196,8 +205,10 @@ class SetupActivity(QDialog, Ui_Activity_Setup_Dialog):
         self._cache.configure_core('wrap-mode',         self.combo_wrap_mode.currentText())
         self._cache.configure_core('werror',            self.combo_werror.currentText())
         self._cache.configure_core('strip',             self.combo_strip.currentText())
-        self._cache.configure_core('cmake-prefix-path', self.edit_cmake_prefix_path.text())
-        self._cache.configure_core('pkg-config-path',   self.edit_pkg_config_path.text())
+        if self.edit_cmake_prefix_path.text() != '':
+            self._cache.configure_core('cmake-prefix-path', self.edit_cmake_prefix_path.text())
+        if self.edit_pkg_config_path.text() != '':
+            self._cache.configure_core('pkg-config-path', self.edit_pkg_config_path.text())
         #
         # Meson args passed for (Base options)
         self._cache.configure_base('b_colorout',  self.combo_b_colorout.currentText())
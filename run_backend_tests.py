@@ -11,11 +11,17 @@ import pytest
 from mesonui.mesonuilib.utilitylib import OSUtility
 from mesonui.mesonuilib.buildsystem import Meson
 from mesonui.mesonuilib.backends.codeblocks import CodeBlocksBackend
+from mesonui.mesonuilib.backends.codeblocks import HeaderIndex
+from mesonui.mesonuilib.backends import codeblocks
 from mesonui.mesonuilib.backends.qtcreator import QtCreatorBackend
 from mesonui.mesonuilib.backends.kdevelop import KDevelopBackend
 from mesonui.mesonuilib.backends.gnome import GNOMEBuilderBackend
 
 from mesonui.repository.mesonapi import MesonAPI
+from mesonui.repository.datacache import MesonApiCache
+from run_benchmarks import write_synthetic_project
+from run_benchmarks import write_meson_project
+from run_benchmarks import compare_results
 from os.path import join as join_paths
 from pathlib import Path
 import os
@@ -69,7 +75,7 @@ class TestMesonBackend:
         assert os.path.exists(join_paths(build, 'compile_commands.json'))
         assert os.path.exists(join_paths(build, 'basic.cbp'))
 
-    def test_qtcreator_backend(self):
+    def test_qtcreator_backend(self, monkeypatch):
         #
         # Setting up tmp test directory
         source = Path(join_paths('test-cases', 'backends', '03-qtcreator'))
@@ -81,11 +87,16 @@ class TestMesonBackend:
 
         meson.setup()
         api = MesonAPI(sourcedir=source, builddir=build)
+        groups: list = []
+        iter_object = api.iter_object
+        monkeypatch.setattr(api, 'iter_object', lambda group: groups.append(group) or iter_object(group=group))
         ide = QtCreatorBackend(api)
         ide.generator()
 
         #
         # Run asserts to check it is working
+        assert groups == ['targets']
+        assert 'main.c' in open(join_paths(build, 'basic.files')).read()
         assert os.path.exists(join_paths(source, 'meson.build'))
         assert os.path.exists(join_paths(build, 'build.ninja'))
         assert os.path.exists(join_paths(build, 'meson-info', 'intro-projectinfo.json'))
@@ -115,12 +126,10 @@ class TestMesonBackend:
         assert os.path.exists(join_paths(build, 'build.ninja'))
         assert os.path.exists(join_paths(build, 'compile_commands.json'))
 
-    def test_ninja_backend(self, tmpdir):
+    def test_ninja_backend(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -136,12 +145,10 @@ class TestMesonBackend:
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
     @pytest.mark.skipif(not OSUtility.is_osx(), reason='Skipping because Xcode backend only works on OSX systems')
-    def test_xcode_backend(self, tmpdir):
+    def test_xcode_backend(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -160,12 +167,10 @@ class TestMesonBackend:
         assert tmpdir.join('builddir', 'test-prog.xcodeproj', 'project.pbxproj').ensure()
 
     @pytest.mark.skipif(not OSUtility.is_windows(), reason='Skipping because Visual Studio backend only works on Windows')
-    def test_vs_backend(self, tmpdir):
+    def test_vs_backend(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -180,4 +185,73 @@ class TestMesonBackend:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
+
+class TestCodeBlocksGenerator:
+    def test_header_index(self, tmpdir):
+        tmpdir.join('main.c').write('')
+        tmpdir.join('main.h').write('')
+        tmpdir.join('util.c').write('')
+        tmpdir.join('util.hpp').write('')
+        headers: HeaderIndex = HeaderIndex()
+
+        assert(headers.headers_for(str(tmpdir.join('main.c'))) == [str(tmpdir.join('main.h'))])
+        assert(headers.headers_for(str(tmpdir.join('util.c'))) == [str(tmpdir.join('util.hpp'))])
+        assert(headers.headers_for(str(tmpdir.join('missing', 'none.c'))) == [])
+
+    def test_parallel_output_matches(self, tmpdir, monkeypatch):
+        sourcedir, builddir = write_synthetic_project(str(tmpdir), targets=4, sources=40)
+        backend = CodeBlocksBackend(MesonAPI(sourcedir=sourcedir, builddir=builddir, cache=MesonApiCache()))
+        monkeypatch.setattr(codeblocks, 'CBP_PARALLEL_SOURCES', 0)
+
+        backend.generate_project(jobs=1)
+        with open(join_paths(builddir, 'synthetic.cbp')) as file:
+            serial = file.read()
+        backend.generate_project(jobs=2)
+        with open(join_paths(builddir, 'synthetic.cbp')) as file:
+            parallel = file.read()
+
+        assert(serial == parallel)
+        assert(serial.count('<Target title=') == 4)
+        assert(serial.count('<Unit filename=') == 40 + 20 + 1)
+
+
+    def test_targets_streamed(self, tmpdir, monkeypatch):
+        sourcedir, builddir = write_synthetic_project(str(tmpdir), targets=4, sources=40)
+        api: MesonAPI = MesonAPI(sourcedir=sourcedir, builddir=builddir, cache=MesonApiCache())
+        backend = CodeBlocksBackend(api)
+        read: list = []
+        iter_object = api.iter_object
+
+        def counting(group: str):
+            for item in iter_object(group=group):
+                read.append(item['name'])
+                yield item
+        monkeypatch.setattr(api, 'iter_object', counting)
+        fragments = backend._fragments(backend._iter_jobs(HeaderIndex()), workers=1)
+
+        assert('<Target title=' in next(fragments)[0])
+        assert(len(read) == 1)
+        assert(len(list(fragments)) == 3)
+
+
+class TestBenchmarkHarness:
+    def test_meson_project(self, tmpdir):
+        sourcedir, builddir = write_meson_project(str(tmpdir), targets=3, sources=6, options=5, subprojects=1)
+        api: MesonAPI = MesonAPI(sourcedir=sourcedir, builddir=builddir, cache=MesonApiCache())
+
+        options = api.get_object(group='buildoptions', extract_method='loader')
+        targets = api.get_object(group='targets', extract_method='loader')
+        projectinfo = api.get_object(group='projectinfo', extract_method='loader')
+        assert(len([option for option in options if option['section'] == 'user']) == 5)
+        assert(len(targets) == 3 + 1)
+        assert(len(projectinfo['subprojects']) == 1)
+        assert(len(list(api.iter_object(group='testlog'))) == 3)
+
+    def test_compare_results(self):
+        old: dict = {'results': {'a': {'cold': 1.0, 'warm': 0.1, 'rows': 10}}}
+        new: dict = {'results': {'a': {'cold': 1.1, 'warm': 0.2, 'rows': 20}, 'b': {'cold': 5.0}}}
+
+        assert(compare_results(old, new, threshold=0.2) == [('a.warm', 0.1, 0.2)])
+        assert(compare_results(old, new, threshold=1.5) == [])
+
 #TestMesonBackend().test_codeblocks_backend()
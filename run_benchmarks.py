@@ -0,0 +1,543 @@
+#!/usr/bin/env python3
+
+#
+# author : Michael Brockus.  
+# contact: <mailto:michaelbrockus@gmail.com>
+# license: Apache 2.0 :http://www.apache.org/licenses/LICENSE-2.0
+#
+# copyright 2020 The Meson-UI development team
+#
+from mesonui.mesonuilib.backends.codeblocks import CodeBlocksBackend
+from mesonui.mesonuilib.backends.codeblocks import HeaderIndex
+from mesonui.mesonuilib.xmlbuilder import Builder
+from mesonui.mesonuilib.buildsystem import Meson
+from mesonui.mesonuilib.mesonengine import MesonEngine
+from mesonui.mesonuilib.optiondelta import OptionDelta
+from mesonui.mesonuilib.setupmatrix import SetupMatrix
+from mesonui.mesonuilib.setupmatrix import matrix_jobs
+from mesonui.mesonuilib.jobserver import JobServer
+from mesonui.mesonuilib.processrunner import ProcessRunner
+from mesonui.mesonuilib.utilitylib import tool_registry
+from mesonui.mesonuilib.profiles import SETUP_PROFILES
+from mesonui.models.buildoptions import BuildOptionsModel
+from mesonui.models.projectinfolist import ProjectInfoModel
+from mesonui.models.testlogslist import TestsLogsModel
+from mesonui.dashboard.appdashboard import DASHBOARD_GROUPS
+from mesonui.repository.datacache import MesonApiCache
+from mesonui.repository.mesonapi import MesonAPI
+from mesonui.repository.dataloader import _MESON_INTRO_FILES
+from mesonui.repository.projectstate import ProjectState
+from mesonui.projectinfo import ProjectInfo
+from os.path import join as join_paths
+import itertools
+import argparse
+import platform
+import tempfile
+import json
+import time
+import sys
+import os
+
+#
+# Groups timed for every extract method, "script" can only answer the
+# first four of them.
+INTRO_GROUPS: list = ['buildoptions', 'projectinfo', 'tests', 'targets', 'buildsystem-files']
+INTRO_METHODS: list = ['loader', 'reader', 'script']
+#
+# Types cycled through for the options of a synthetic project.
+_OPTION_LINES: list = [
+    "option('opt{0}', type: 'string', value: 'value{0}', description: 'string option {0}')\n",
+    "option('opt{0}', type: 'boolean', value: true, description: 'boolean option {0}')\n",
+    "option('opt{0}', type: 'combo', choices: ['a', 'b', 'c'], value: 'b', description: 'combo option {0}')\n",
+    "option('opt{0}', type: 'integer', min: 0, max: 100, value: 50, description: 'integer option {0}')\n",
+    "option('opt{0}', type: 'array', value: ['x', 'y'], description: 'array option {0}')\n"
+]
+
+
+def write_synthetic_project(root: str, targets: int = 10, sources: int = 100) -> tuple:
+    '''
+    this function writes a source tree and a build directory holding the
+    intro files Meson would write for a project with the given number of
+    targets and sources (in total), and gives back (sourcedir, builddir).
+    '''
+    sourcedir: str = join_paths(root, 'source')
+    builddir: str = join_paths(sourcedir, 'builddir')
+    infodir: str = join_paths(builddir, 'meson-info')
+    os.makedirs(infodir)
+    with open(join_paths(sourcedir, 'meson.build'), 'w') as file:
+        file.write("project('synthetic', 'c')\n")
+
+    intro: dict = dict.fromkeys(_MESON_INTRO_FILES, [])
+    intro['intro-projectinfo.json'] = {
+        'version': '1.0', 'descriptive_name': 'synthetic', 'subproject_dir': 'subprojects', 'subprojects': []
+    }
+    intro['meson-info.json'] = {
+        'directories': {'source': sourcedir, 'build': builddir, 'info': infodir},
+        'introspection': {'information': {name[len('intro-'):-len('.json')]: {'file': name, 'updated': True}
+                                          for name in _MESON_INTRO_FILES if name.startswith('intro-')}},
+        'error': False
+    }
+    intro['intro-buildsystem_files.json'] = [join_paths(sourcedir, 'meson.build')]
+    intro['intro-installed.json'] = {}
+
+    per_target: int = max(1, sources // max(1, targets))
+    target_list: list = []
+    for index in range(targets):
+        subdir: str = join_paths(sourcedir, f'lib{index}')
+        os.makedirs(subdir)
+        files: list = []
+        for number in range(per_target):
+            files.append(join_paths(subdir, f'file{number}.c'))
+            open(files[-1], 'w').close()
+            if number % 2 == 0:
+                open(join_paths(subdir, f'file{number}.h'), 'w').close()
+        target_list.append({
+            'name': f'lib{index}', 'id': f'lib{index}@sta', 'type': 'static library',
+            'defined_in': join_paths(sourcedir, 'meson.build'), 'filename': [join_paths(builddir, f'liblib{index}.a')],
+            'target_sources': [{
+                'language': 'c', 'compiler': ['cc'], 'sources': files, 'generated_sources': [],
+                'parameters': [f'-I{subdir}', f'-DLIB_INDEX={index}', '-O2', '-g']
+            }, {
+                'linker': ['cc'], 'parameters': ['-Wl,--as-needed']
+            }]
+        })
+    intro['intro-targets.json'] = target_list
+
+    for name, info in intro.items():
+        with open(join_paths(infodir, name), 'w') as file:
+            json.dump(info, file)
+    return (sourcedir, builddir)
+
+
+def write_meson_project(root: str, targets: int = 10, sources: int = 100, options: int = 10,
+                        subprojects: int = 2) -> tuple:
+    '''
+    this function writes a real Meson project with the given number of
+    static library targets, sources (in total), options and subprojects,
+    sets it up with "meson setup" and gives back (sourcedir, builddir).
+    Every library has a test, and a test log with a result for each test
+    is written as if "meson test" had run.
+    '''
+    sourcedir: str = join_paths(root, 'project')
+    builddir: str = join_paths(sourcedir, 'builddir')
+    os.makedirs(sourcedir)
+
+    per_target: int = max(1, sources // max(1, targets))
+    script: list = ["project('synthetic', 'c', version: '1.0')\n"]
+    for index in range(subprojects):
+        subdir: str = join_paths(sourcedir, 'subprojects', f'sub{index}')
+        os.makedirs(subdir)
+        with open(join_paths(subdir, 'meson.build'), 'w') as file:
+            file.write(f"project('sub{index}', 'c', version: '0.{index}')\n"
+                       f"sub_lib = static_library('sub{index}', 'sub.c')\n")
+        with open(join_paths(subdir, 'sub.c'), 'w') as file:
+            file.write(f'int sub{index}(void) {{ return {index}; }}\n')
+        script.append(f"subproject('sub{index}')\n")
+
+    for index in range(targets):
+        subdir: str = join_paths(sourcedir, f'lib{index}')
+        os.makedirs(subdir)
+        names: list = []
+        for number in range(per_target):
+            names.append(f"'lib{index}/file{number}.c'")
+            with open(join_paths(subdir, f'file{number}.c'), 'w') as file:
+                file.write(f'int lib{index}_func{number}(void) {{ return {number}; }}\n')
+        script.append(f"lib{index} = static_library('lib{index}', {', '.join(names)})\n")
+        script.append(f"test('test{index}', find_program('true'), suite: 'synthetic')\n")
+
+    with open(join_paths(sourcedir, 'meson.build'), 'w') as file:
+        file.write(''.join(script))
+    with open(join_paths(sourcedir, 'meson_options.txt'), 'w') as file:
+        for index in range(options):
+            file.write(_OPTION_LINES[index % len(_OPTION_LINES)].format(index))
+
+    output: str = Meson(sourcedir=sourcedir, builddir=builddir).setup()
+    if not os.path.exists(join_paths(builddir, 'meson-info', 'meson-info.json')):
+        raise RuntimeError(f'Synthetic project setup failed:\n{output}')
+
+    os.makedirs(join_paths(builddir, 'meson-logs'), exist_ok=True)
+    with open(join_paths(builddir, 'meson-logs', 'testlog.json'), 'w') as file:
+        for index in range(targets):
+            file.write(json.dumps({'name': f'synthetic:test{index}', 'result': 'OK', 'duration': 0.01}) + '\n')
+    return (sourcedir, builddir)
+
+
+def _best_of(repeat: int, func) -> float:
+    best: float = None
+    for count in range(repeat):
+        start: float = time.perf_counter()
+        func()
+        elapsed: float = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def bench_codeblocks(sources: int = 20000, targets: int = 200, repeat: int = 3) -> dict:
+    '''
+    this function times the Code::Blocks project generator on a synthetic
+    project, once in this process and once with the worker pool.
+    '''
+    def exists_lookup(files: list) -> None:
+        for file in files:
+            base: str = os.path.splitext(file)[0]
+            [f'{base}.{ext}' for ext in ('h', 'hpp') if os.path.exists(f'{base}.{ext}')]
+
+    with tempfile.TemporaryDirectory() as root:
+        sourcedir, builddir = write_synthetic_project(root, targets=targets, sources=sources)
+        api: MesonAPI = MesonAPI(sourcedir=sourcedir, builddir=builddir, cache=MesonApiCache())
+        backend: CodeBlocksBackend = CodeBlocksBackend(api)
+        files: list = [file for target in api.iter_object(group='targets')
+                       for file in target['target_sources'][0]['sources']]
+        return {
+            'sources': sources,
+            'targets': targets,
+            'workers': os.cpu_count(),
+            'headers_exists': _best_of(repeat, lambda: exists_lookup(files)),
+            'headers_index': _best_of(repeat, lambda: list(map(HeaderIndex().headers_for, files))),
+            'serial': _best_of(repeat, lambda: backend.generate_project(jobs=1)),
+            'parallel': _best_of(repeat, lambda: backend.generate_project(jobs=None)),
+        }
+
+
+def bench_xmlbuilder(elements: int = 1000000, repeat: int = 3) -> dict:
+    '''
+    this function times writing the given number of elements to a file
+    with the XML builder, a tenth of them hold values that need escaping.
+    '''
+    def write_document(path: str) -> None:
+        with Builder.to_file(path, version='1.0', encoding='UTF-8') as xml, xml.project:
+            for number in range(elements // 10):
+                with xml.Unit(filename=f'/source/file{number}.c'):
+                    for option in range(5):
+                        xml.Option(target='library', virtualFolder='Sources')
+                    xml.Add(option='-DVALUE="a & b"')
+                    for command in range(3):
+                        xml.Build('ninja -v library')
+
+    with tempfile.TemporaryDirectory() as root:
+        elapsed: float = _best_of(repeat, lambda: write_document(join_paths(root, 'project.xml')))
+    return {
+        'elements': elements,
+        'seconds': elapsed,
+        'elements_per_second': int(elements / elapsed)
+    }
+
+
+def bench_mesonengine(targets: int = 10, sources: int = 100, options: int = 10, subprojects: int = 1,
+                      repeat: int = 3) -> dict:
+    '''
+    this function times the short Meson commands ("--version",
+    "introspect" and "configure") run as a new "meson" process against
+    the same commands run by the warm worker of the Meson engine, and
+    the script introspection answered from the worker memory.
+    '''
+    with tempfile.TemporaryDirectory() as root:
+        sourcedir, builddir = write_meson_project(root, targets=targets, sources=sources, options=options,
+                                                  subprojects=subprojects)
+        commands: dict = {
+            'version': ['--version'],
+            'introspect_builddir': ['introspect', '--projectinfo', '--buildoptions', '--targets', builddir],
+            'introspect_script': ['introspect', '--projectinfo', '--targets', join_paths(sourcedir, 'meson.build')],
+            'configure': ['configure', builddir],
+        }
+        engines: dict = {'process': MesonEngine(in_process=False), 'worker': MesonEngine(in_process=True)}
+        results: dict = {'worker_started': None}
+        try:
+            start: float = time.perf_counter()
+            engines['worker'].run(['--version'])
+            results['worker_started'] = engines['worker']._worker is not None
+            results['worker_start_seconds'] = time.perf_counter() - start
+            for name, args in commands.items():
+                results[name] = {engine: _best_of(repeat, lambda: engines[engine].run(args)) for engine in engines}
+            #
+            # What a dashboard refresh before "meson setup" costs while the
+            # scripts keep their stamp.
+            results['introspect_script']['worker_stamped'] = _best_of(
+                repeat, lambda: engines['worker'].run(commands['introspect_script'], stamp=['unchanged']))
+        finally:
+            engines['worker'].close()
+        return results
+
+
+def bench_reconfigure(targets: int = 20, sources: int = 400, repeat: int = 3) -> dict:
+    '''
+    this function times changing one option of a project that is built
+    already, once passing only that option to "meson configure" and once
+    with "meson setup --wipe", both followed by the build.
+    '''
+    with tempfile.TemporaryDirectory() as root:
+        sourcedir, builddir = write_meson_project(root, targets=targets, sources=sources, options=1, subprojects=0)
+        meson: Meson = Meson(sourcedir=sourcedir, builddir=builddir)
+        api: MesonAPI = MesonAPI(sourcedir=sourcedir, builddir=builddir)
+        values = itertools.count()
+        meson.build()
+
+        def delta() -> None:
+            meson.configure(args=OptionDelta.from_api(api, {'-Dopt0': f'delta{next(values)}'}).configure_args())
+            meson.build()
+
+        def wipe() -> None:
+            meson.setup(args=['--wipe', f'-Dopt0=wipe{next(values)}'])
+            meson.build()
+
+        return {'delta': _best_of(repeat, delta), 'wipe': _best_of(repeat, wipe)}
+
+
+def bench_matrix(targets: int = 20, sources: int = 200, repeat: int = 3) -> dict:
+    '''
+    this function times setting up a build directory for every built in
+    profile one after the other and all at once (one run per core).
+    '''
+    results: dict = {'profiles': len(SETUP_PROFILES), 'jobs': matrix_jobs(len(SETUP_PROFILES))}
+    with tempfile.TemporaryDirectory() as root:
+        sourcedir, builddir = write_meson_project(root, targets=targets, sources=sources, options=1, subprojects=0)
+        counter = itertools.count()
+
+        def setup(jobs: int) -> None:
+            matrix: SetupMatrix = SetupMatrix(sourcedir, SETUP_PROFILES, jobs=jobs,
+                                              builddir_root=join_paths(root, f'matrix{next(counter)}'))
+            matrix.start().wait()
+            if matrix.failed():
+                raise RuntimeError('Setup matrix failed:\n' + '\n'.join(matrix.summary()))
+
+        results['serial'] = _best_of(repeat, lambda: setup(1))
+        results['parallel'] = _best_of(repeat, lambda: setup(None))
+    return results
+
+
+#
+# Edge of the jobserver benchmark, it burns CPU for a while and logs
+# when it starts and ends so the peak of edges running can be counted.
+_BENCH_EDGE: str = '''\
+import sys
+with open(sys.argv[1], 'a') as log: log.write('+\\n')
+sum(range(3000000))
+with open(sys.argv[1], 'a') as log: log.write('-\\n')
+open(sys.argv[2], 'w').close()
+'''
+
+
+def bench_jobserver(builds: int = 4, edges: int = 16, repeat: int = 3) -> dict:
+    '''
+    this function times several Ninja builds run at once, each one with
+    its own "-j" and all of them taking their slots from one jobserver,
+    and counts the most edges that ran at the same time.
+    '''
+    jobserver: JobServer = JobServer()
+    results: dict = {'builds': builds, 'edges': edges, 'budget': jobserver.budget}
+    with tempfile.TemporaryDirectory() as root:
+        script: str = join_paths(root, 'edge.py')
+        with open(script, 'w') as file:
+            file.write(_BENCH_EDGE)
+        counter = itertools.count()
+
+        def build(shared: bool) -> int:
+            log: str = join_paths(root, f'edges{next(counter)}.log')
+            runner: ProcessRunner = ProcessRunner()
+            handles: list = []
+            for number in range(builds):
+                builddir: str = join_paths(root, f'build{number}')
+                os.makedirs(builddir, exist_ok=True)
+                with open(join_paths(builddir, 'build.ninja'), 'w') as file:
+                    file.write(f'rule edge\n  command = {sys.executable} {script} {log} $out\n')
+                    file.writelines(f'build out{edge}: edge\n' for edge in range(edges))
+                cmd: list = tool_registry.command('ninja', '-C', builddir)
+                if shared:
+                    handles.append(runner.start(cmd, jobserver=jobserver, jobs_arg=jobserver.ninja_jobs_arg()))
+                else:
+                    handles.append(runner.start(cmd + [f'-j{jobserver.budget}']))
+            for handle in handles:
+                if handle.wait() != 0:
+                    raise RuntimeError(f'Ninja build failed:\n{handle.output()}{handle.errors()}')
+            for number in range(builds):
+                os.remove(join_paths(root, f'build{number}', '.ninja_log'))
+            running: int = 0
+            peak: int = 0
+            with open(log) as file:
+                for line in file.read().split():
+                    running += 1 if line == '+' else -1
+                    peak = max(peak, running)
+            return peak
+
+        peaks: dict = {}
+        for name, shared in (('unshared', False), ('shared', True)):
+            results[name] = _best_of(repeat, lambda: peaks.__setitem__(name, build(shared)))
+            results[f'{name}_peak'] = peaks[name]
+    jobserver.close()
+    return results
+
+
+def bench_introspection(targets: int = 50, sources: int = 1000, options: int = 100, subprojects: int = 4,
+                        repeat: int = 3) -> dict:
+    '''
+    this function times the introspection pipeline on a synthetic project,
+    "get_object" for every extract method (cold with an empty cache and
+    warm), the list models and the dashboard update.
+    '''
+    with tempfile.TemporaryDirectory() as root:
+        start: float = time.perf_counter()
+        sourcedir, builddir = write_meson_project(root, targets=targets, sources=sources, options=options,
+                                                  subprojects=subprojects)
+        results: dict = {
+            'project': {'targets': targets, 'sources': sources, 'options': options, 'subprojects': subprojects},
+            'setup_seconds': time.perf_counter() - start,
+            'get_object': {},
+            'set_list': {},
+        }
+
+        for method in INTRO_METHODS:
+            results['get_object'][method] = {}
+            for group in INTRO_GROUPS:
+                if method == 'script' and group == 'buildsystem-files':
+                    continue
+                warm_api: MesonAPI = MesonAPI(sourcedir=sourcedir, builddir=builddir, cache=MesonApiCache())
+                warm_api.get_object(group=group, extract_method=method)
+                results['get_object'][method][group] = {
+                    'cold': _best_of(repeat, lambda: MesonAPI(sourcedir=sourcedir, builddir=builddir,
+                                                              cache=MesonApiCache()).get_object(group=group,
+                                                                                                extract_method=method)),
+                    'warm': _best_of(repeat, lambda: warm_api.get_object(group=group, extract_method=method))
+                }
+
+        api: MesonAPI = MesonAPI(sourcedir=sourcedir, builddir=builddir, cache=MesonApiCache())
+        api.get_objects(groups=DASHBOARD_GROUPS)
+        for name, model_class in (('buildoptions', BuildOptionsModel), ('projectinfo', ProjectInfoModel),
+                                  ('tests', TestsLogsModel)):
+            model = model_class()
+            model.set_list(api)
+            results['set_list'][name] = {
+                'rows': model.rowCount(),
+                'set_list': _best_of(repeat, lambda: model_class().set_list(api)),
+                'format': _best_of(repeat, lambda: [model.data(model.index(row)) for row in range(model.rowCount())])
+            }
+
+        state: ProjectState = ProjectState(sourcedir, builddir)
+        results['project_state'] = {
+            'take': _best_of(repeat, lambda: ProjectState(sourcedir, builddir)),
+            'is_current': _best_of(repeat, state.is_current)
+        }
+        results['dashboard'] = _bench_dashboard(sourcedir, builddir, repeat)
+        return results
+
+
+def _bench_dashboard(sourcedir: str, builddir: str, repeat: int) -> dict:
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    from PyQt5.QtWidgets import QApplication
+    from mesonui.view.main_activity import MainActivity
+    from mesonui.models.appmodel import MainModel
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    activity = MainActivity(MainModel())
+    activity.meson_api.sourcedir = sourcedir
+    activity.meson_api.builddir = builddir
+
+    def update(cold: bool) -> None:
+        if cold:
+            activity.meson_api.cache.invalidate()
+        activity.dashboard.update(activity.meson_api)
+
+    def refresh() -> None:
+        activity.meson_api.cache.invalidate()
+        activity.dashboard.refresh(activity.meson_api)
+        while activity.dashboard.is_busy():
+            app.processEvents()
+
+    update(cold=True)
+    results: dict = {
+        'cold': _best_of(repeat, lambda: update(cold=True)),
+        'warm': _best_of(repeat, lambda: update(cold=False)),
+        'refresh_cold': _best_of(repeat, refresh)
+    }
+    activity.close()
+    app.processEvents()
+    return results
+
+
+BENCHMARKS: dict = {
+    'codeblocks': bench_codeblocks,
+    'introspection': bench_introspection,
+    'jobserver': bench_jobserver,
+    'matrix': bench_matrix,
+    'mesonengine': bench_mesonengine,
+    'reconfigure': bench_reconfigure,
+    'xmlbuilder': bench_xmlbuilder,
+}
+
+
+def _timings(results: any, prefix: str = '') -> dict:
+    '''
+    this function flattens the timings (floats) of a result tree into a
+    dict keyed by their dotted path, counts and rates are left out.
+    '''
+    timings: dict = {}
+    if isinstance(results, dict):
+        for key, value in results.items():
+            timings.update(_timings(value, f'{prefix}{key}.'))
+    elif isinstance(results, float):
+        timings[prefix[:-1]] = results
+    return timings
+
+
+def compare_results(old: dict, new: dict, threshold: float = 0.2) -> list:
+    '''
+    this function gives back a (name, old, new) entry for every timing
+    that got slower than the threshold (a fraction) allows.
+    '''
+    old_timings: dict = _timings(old.get('results', {}))
+    new_timings: dict = _timings(new.get('results', {}))
+    slower: list = []
+    for name in sorted(set(old_timings) & set(new_timings)):
+        if new_timings[name] > old_timings[name] * (1.0 + threshold):
+            slower.append((name, old_timings[name], new_timings[name]))
+    return slower
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description='Meson-UI performance benchmarks')
+    parser.add_argument('benchmarks', nargs='*', choices=sorted(BENCHMARKS) + [[]], default=[],
+                        help='benchmarks to run, all if none given')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per benchmark, the best one counts')
+    parser.add_argument('--targets', type=int, default=50, help='targets of the introspection project')
+    parser.add_argument('--sources', type=int, default=1000, help='sources of the introspection project')
+    parser.add_argument('--options', type=int, default=100, help='options of the introspection project')
+    parser.add_argument('--subprojects', type=int, default=4, help='subprojects of the introspection project')
+    parser.add_argument('--output', help='write the results as JSON to this file')
+    parser.add_argument('--compare', help='JSON results of an earlier run to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='fraction a timing may grow before it counts as a regression')
+    args = parser.parse_args()
+
+    document: dict = {
+        'meta': {
+            'mesonui': ProjectInfo().get_version(),
+            'meson': Meson().version().strip(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': {}
+    }
+    for name in args.benchmarks or sorted(BENCHMARKS):
+        kwargs: dict = {'repeat': args.repeat}
+        if name == 'introspection':
+            kwargs.update(targets=args.targets, sources=args.sources, options=args.options,
+                          subprojects=args.subprojects)
+        document['results'][name] = BENCHMARKS[name](**kwargs)
+        print(f'{name}: {json.dumps(document["results"][name])}', flush=True)
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(document, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            slower: list = compare_results(json.load(file), document, threshold=args.threshold)
+        for name, old, new in slower:
+            print(f'slower: {name} {old:.4f}s -> {new:.4f}s ({new / old:.2f}x)')
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
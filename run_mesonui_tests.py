@@ -10,6 +10,7 @@
 from mesonui.view.main_activity import MainActivity
 from mesonui.view.setup_activity import SetupActivity
 from mesonui.view.conf_activity import ConfigureActivity
+from mesonui.view.matrix_activity import MatrixActivity
 from mesonui.view.dist_activity import DistActivity
 from mesonui.view.init_activity import InitActivity
 from mesonui.view.wrap_activity import WrapActivity
@@ -19,6 +20,18 @@ from mesonui.mesonuilib.outputconsole import OutputConsole
 
 from mesonui.models.appmodel import MainModel
 from PyQt5.QtCore import Qt
+from mesonui.mesonuilib.processrunner import default_runner
+from mesonui.models.buildoptions import BuildOptionsModel
+from mesonui.models.introlistmodel import IntroListModel
+from mesonui.models.introlistmodel import row_edits
+from mesonui.models.projectinfolist import ProjectInfoModel
+from mesonui.dashboard.introwatcher import IntrospectionWatcher
+from mesonui.repository.datacache import MesonApiCache
+from mesonui.repository.mesonapi import MesonAPI
+from os.path import join
+import threading
+import json
+import sys
 
 
 class TestMainActivity:
@@ -58,17 +71,306 @@ class TestMainActivity:
         assert activity.project_builddir.text() == ''
 
 
+    def test_compile_in_background(self, qtbot):
+        source = join('test-cases', 'meson-api', '02-read-builddir')
+        build = join('test-cases', 'meson-api', '02-read-builddir', 'builddir')
+        model: MainModel = MainModel()
+        model.buildsystem().meson().sourcedir = source
+        model.buildsystem().meson().builddir = build
+        model.buildsystem().meson().setup()
+
+        activity = MainActivity(model)
+        qtbot.addWidget(activity)
+        activity.exec_compile()
+
+        assert(activity.console.is_busy())
+        assert(activity.progress.is_busy())
+        qtbot.waitUntil(lambda: not activity.console.is_busy(), timeout=60000)
+        qtbot.waitUntil(lambda: not activity.progress.is_busy(), timeout=60000)
+        assert('Finished with exit code 0' in activity.output_console.toPlainText())
+        assert(activity.progress.progress().finished == activity.progress.progress().total)
+
+
+    def test_console_streams_bounded_lines(self, qtbot):
+        activity = MainActivity(MainModel())
+        qtbot.addWidget(activity)
+        activity.console.set_max_lines(50)
+        activity.console.command_start(default_runner.start([sys.executable, '-c', 'for i in range(1000): print(i)']))
+
+        qtbot.waitUntil(lambda: not activity.console.is_busy(), timeout=60000)
+        text = activity.output_console.toPlainText()
+
+        assert(activity.output_console.blockCount() <= 50)
+        assert('999' in text)
+        assert('Finished with exit code 0' in text)
+
+    def test_console_tells_dropped_lines(self, qtbot):
+        activity = MainActivity(MainModel())
+        qtbot.addWidget(activity)
+        activity.console.set_max_lines(50)
+        handle = default_runner.start([sys.executable, '-c', 'for i in range(1000): print(i)'])
+        handle.wait(60)
+        activity.console.command_start(handle)
+
+        qtbot.waitUntil(lambda: not activity.console.is_busy(), timeout=60000)
+        text = activity.output_console.toPlainText()
+
+        assert(text.endswith(', 950 lines dropped'))
+
+
+class _FakeApi:
+    def __init__(self, groups: dict):
+        self.groups = groups
+
+    def get_object(self, group: str, extract_method: str = 'script', use_fallback: bool = False) -> any:
+        return self.groups.get(group)
+
+    def iter_object(self, group: str) -> any:
+        return iter(self.groups.get(group) or [])
+
+
+def _option(name: str, value: any, section: str = 'core') -> dict:
+    return {
+        'name': name, 'value': value, 'section': section, 'machine': 'any',
+        'type': 'string', 'description': f'{name} option'
+    }
+
+
+class TestIntroListModel:
+    def _texts(self, model) -> list:
+        return [model.data(model.index(row)) for row in range(model.rowCount())]
+
+    def test_row_edits_back_to_front(self):
+        edits: list = row_edits(['a', 'b', 'c', 'd'], ['x', 'b', 'c'])
+
+        assert(edits == [(3, 4, 3, 3), (0, 1, 0, 1)])
+        assert(row_edits(['a'], ['a']) == [])
+
+    def test_placeholder(self, qtbot):
+        model = BuildOptionsModel()
+        model.set_list(_FakeApi({}))
+
+        assert(self._texts(model) == ['No Project data.'])
+        assert(model.get_list() == [])
+        testlogs = MainModel().model_testlogsinfo()
+        assert(testlogs.data(testlogs.index(0)) == 'No Testlogs data.')
+
+    def test_rows_sorted_by_section(self, qtbot):
+        model = BuildOptionsModel()
+        model.set_list(_FakeApi({'buildoptions': [_option('b', 1), _option('a', 2, 'base'), _option('a', 3)]}))
+
+        assert([record['value'] for record in model.get_list()] == [2, 3, 1])
+        assert(' option:  a ' in self._texts(model)[0])
+
+    def test_rows_formatted_lazily(self, qtbot, monkeypatch):
+        formatted = []
+        model = BuildOptionsModel()
+        monkeypatch.setattr(model, 'format_row', lambda record: formatted.append(record) or 'row')
+        model.set_list(_FakeApi({'buildoptions': [_option(f'opt{i}', i) for i in range(10000)]}))
+
+        assert(model.rowCount() == 10000)
+        assert(formatted == [])
+        model.data(model.index(42))
+        assert(len(formatted) == 1)
+
+    def test_only_changes_emitted(self, qtbot):
+        old = [_option(f'opt{i:03}', i) for i in range(100)]
+        new = list(old)
+        new[10] = _option('opt010', 'changed')
+        del new[50]
+        new.append(_option('opt999', 999))
+        model = BuildOptionsModel()
+        model.set_list(_FakeApi({'buildoptions': old}))
+        changes = []
+        model.dataChanged.connect(lambda first, last: changes.append(('changed', first.row(), last.row())))
+        model.rowsRemoved.connect(lambda parent, first, last: changes.append(('removed', first, last)))
+        model.rowsInserted.connect(lambda parent, first, last: changes.append(('inserted', first, last)))
+
+        assert(model.set_records(new, source=new) == 3)
+        assert(sorted(changes) == [('changed', 10, 10), ('inserted', 100, 100), ('removed', 50, 50)])
+        assert(model.get_list() == new)
+
+    def test_rows_keyed_by_identity(self, qtbot, monkeypatch):
+        keys = []
+        model = BuildOptionsModel()
+        monkeypatch.setattr(model, 'row_key', lambda record: keys.append(record['name']) or record['name'])
+        model.set_list(_FakeApi({'buildoptions': [_option('a', 1), _option('b', 2)]}))
+
+        assert(model.set_records([_option('a', 1), _option('b', 3)]) == 1)
+        assert(keys == ['a', 'b', 'a', 'b'])
+        assert(model.get_list()[1]['value'] == 3)
+
+    def test_default_format(self, qtbot):
+        model = IntroListModel()
+        model.set_records([{'name': 'one'}])
+
+        assert(model.data(model.index(0)) == "{'name': 'one'}")
+
+    def test_same_source_skipped(self, qtbot):
+        options = [_option('a', 1)]
+        api = _FakeApi({'buildoptions': options})
+        model = BuildOptionsModel()
+        model.set_list(api)
+
+        assert(model.set_records(options, source=options) == 0)
+        assert(model.set_records([], source=None) == 1)
+        assert(self._texts(model) == ['No Project data.'])
+
+    def test_project_rows(self, qtbot):
+        info = {
+            'descriptive_name': 'demo', 'version': '1.0', 'subproject_dir': 'subprojects',
+            'subprojects': [{'name': 'zlib', 'descriptive_name': 'zlib', 'version': '1.2'}]
+        }
+        model = ProjectInfoModel()
+        model.set_list(_FakeApi({'projectinfo': info}))
+        texts = self._texts(model)
+
+        assert(len(texts) == 2)
+        assert(texts[0].startswith(' descriptive_name: demo'))
+        assert(texts[1].startswith(' Subproject:'))
+
+    def test_test_results(self, qtbot):
+        tests = {'tests': [{'name': 'first', 'suite': ['demo']}, {'name': 'second', 'suite': ['demo']}]}
+        testlog = [{'name': 'demo:first', 'result': 'OK'}, {'name': 'other:third', 'result': 'FAIL'}]
+        model = MainModel().model_testlogsinfo()
+        model.set_list(_FakeApi({'tests': tests}))
+
+        assert(self._texts(model) == ['No Testlogs data.'])
+        model.set_list(_FakeApi({'tests': tests, 'testlog': testlog}))
+        assert([result for test, result in model.get_list()] == ['OK', 'not run'])
+
+    def test_dashboard_uses_models(self, qtbot):
+        model = MainModel()
+        activity = MainActivity(model)
+        qtbot.addWidget(activity)
+
+        assert(activity.buildoptions_list.model() is model.model_options())
+        assert(activity.projectinfo_list.model() is model.buildsysteminfo())
+        assert(activity.testsinfo_list.model() is model.model_testlogsinfo())
+
+
+class TestIntrospectionWatcher:
+    def _api(self, tmpdir) -> MesonAPI:
+        source = tmpdir.mkdir('source')
+        source.join('meson.build').write("project('demo', 'c')\n")
+        info = source.mkdir('builddir').mkdir('meson-info')
+        for name in ('intro-buildoptions.json', 'intro-projectinfo.json', 'intro-tests.json', 'meson-info.json'):
+            info.join(name).write('[]')
+        info.join('intro-buildsystem_files.json').write(json.dumps([str(source.join('meson.build'))]))
+        return MesonAPI(str(source), str(source.join('builddir')), cache=MesonApiCache())
+
+    def test_burst_reported_once(self, qtbot, tmpdir):
+        api = self._api(tmpdir)
+        api.cache.store(('loader', 'buildoptions', api.builddir), (), [])
+        api.cache.store(('loader', 'projectinfo', api.builddir), (), {})
+        watcher = IntrospectionWatcher(api, debounce=200, poll_interval=50)
+        reports = []
+        watcher.changed.connect(reports.append)
+
+        for count in range(5):
+            tmpdir.join('source', 'builddir', 'meson-info', 'intro-buildoptions.json').write(json.dumps(list(range(count))))
+        qtbot.waitUntil(lambda: len(reports) == 1, timeout=5000)
+        qtbot.wait(400)
+
+        assert(reports == [['buildoptions']])
+        assert(api.cache.stats()['entries'] == 1)
+
+    def test_buildsystem_files_polled(self, qtbot, tmpdir):
+        api = self._api(tmpdir)
+        watcher = IntrospectionWatcher(api, debounce=10, poll_interval=20, use_polling=True)
+
+        with qtbot.waitSignal(watcher.changed, timeout=5000) as blocker:
+            tmpdir.join('source', 'meson.build').write("project('demo', 'c', version: '2.0')\n")
+
+        assert('projectinfo' in blocker.args[0])
+        assert('buildoptions' in blocker.args[0])
+
+    def test_missing_builddir_polled(self, qtbot, tmpdir):
+        source = tmpdir.mkdir('source')
+        watcher = IntrospectionWatcher(MesonAPI(str(source), str(source.join('builddir')), cache=MesonApiCache()),
+                                       debounce=10, poll_interval=20)
+
+        with qtbot.waitSignal(watcher.changed, timeout=5000) as blocker:
+            source.mkdir('builddir').mkdir('meson-logs').join('testlog.json').write('{}')
+
+        assert(blocker.args[0] == ['testlog'])
+
+    def test_only_matching_tabs_updated(self, qtbot):
+        activity = MainActivity(MainModel())
+        qtbot.addWidget(activity)
+
+        assert(activity.dashboard.update_groups(activity.meson_api, ['testlog']) == [activity.dashboard._testloginfo])
+        assert(activity.dashboard.update_groups(activity.meson_api, ['meson-info', 'targets']) == [])
+
+
+class _SlowApi(_FakeApi):
+    def __init__(self, groups: dict, gate: threading.Event):
+        super().__init__(groups)
+        self.gate = gate
+
+    def get_objects(self, groups: list = []) -> dict:
+        self.gate.wait(30)
+        return {group: self.groups.get(group) for group in groups}
+
+
+class TestDashboardRefresh:
+    def test_refresh_in_background(self, qtbot):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        activity = MainActivity(MainModel())
+        qtbot.addWidget(activity)
+        api = MesonAPI(source, join(source, 'not-a-builddir'), cache=MesonApiCache())
+
+        with qtbot.waitSignal(activity.dashboard.refreshed, timeout=30000) as refreshed:
+            assert(activity.dashboard.refresh(api) == ['buildoptions', 'projectinfo', 'tests'])
+        assert(refreshed.args == [['buildoptions', 'projectinfo', 'tests']])
+        assert(not activity.dashboard.is_busy())
+        assert(activity._model.buildsysteminfo().get_list()[0][1]['descriptive_name'] == 'simple-case')
+
+    def test_stale_refresh_dropped(self, qtbot):
+        activity = MainActivity(MainModel())
+        qtbot.addWidget(activity)
+        qtbot.waitUntil(lambda: not activity.dashboard.is_busy(), timeout=30000)
+        old_gate, new_gate = threading.Event(), threading.Event()
+        old = _SlowApi({'buildoptions': [_option('old', 1)]}, old_gate)
+        new = _SlowApi({'buildoptions': [_option('new', 2)]}, new_gate)
+
+        activity.dashboard.refresh(old, ['buildoptions'])
+        activity.dashboard.refresh(new, ['buildoptions'])
+        with qtbot.waitSignal(activity.dashboard.refreshed, timeout=30000):
+            new_gate.set()
+        old_gate.set()
+        qtbot.wait(200)
+
+        assert([option['name'] for option in activity._model.model_options().get_list()] == ['new'])
+        assert(not activity.dashboard.is_busy())
+
+    def test_refresh_fetches_once(self, qtbot):
+        activity = MainActivity(MainModel())
+        qtbot.addWidget(activity)
+        qtbot.waitUntil(lambda: not activity.dashboard.is_busy(), timeout=30000)
+        gate = threading.Event()
+        gate.set()
+        api = _SlowApi({'buildoptions': [_option('once', 1)], 'projectinfo': None, 'tests': []}, gate)
+        calls: list = []
+        get_objects = api.get_objects
+        api.get_objects = lambda groups=[]: calls.append(groups) or get_objects(groups)
+
+        with qtbot.waitSignal(activity.dashboard.refreshed, timeout=30000):
+            activity.dashboard.refresh(api)
+
+        assert(calls == [['buildoptions', 'projectinfo', 'tests']])
+        assert([option['name'] for option in activity._model.model_options().get_list()] == ['once'])
+
+
 class TestSetupActivity:
     def test_is_renderable(self, qtbot):
         activity = SetupActivity(None, MainModel())
         qtbot.addWidget(activity)
 
-    def test_do_setup_prog(self, qtbot, tmpdir):
+    def test_do_setup_prog(self, qtbot, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         model = MainModel()
         model.buildsystem().meson().sourcedir = tmpdir
@@ -88,6 +390,29 @@ class TestSetupActivity:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
+    def test_do_setup_keeps_builddir(self, qtbot, tmpdir):
+        tmpdir.join('meson.build').write("project('delta')\n")
+        model = MainModel()
+        model.buildsystem().meson().sourcedir = str(tmpdir)
+        model.buildsystem().meson().builddir = str(tmpdir / 'builddir')
+        model.buildsystem().meson().setup()
+        tmpdir.join('builddir', 'marker').write('')
+
+        console: OutputConsole = OutputConsole(MainActivity(model))
+        setup_view: SetupActivity = SetupActivity(console, model)
+        qtbot.addWidget(setup_view)
+        setup_view.combo_buildtype.setCurrentText('release')
+        qtbot.mouseClick(setup_view.control_push_do_setup, Qt.LeftButton)
+        #
+        # "meson configure" runs in the background and streams to the console
+        assert(console.is_busy())
+        qtbot.waitUntil(lambda: not console.is_busy(), timeout=60000)
+
+        with open(tmpdir.join('builddir', 'meson-info', 'intro-buildoptions.json')) as loaded_json:
+            options = {option['name']: option['value'] for option in json.load(loaded_json)}
+        assert(options['buildtype'] == 'release')
+        assert(tmpdir.join('builddir', 'marker').exists())
+
     def test_no_setup_prog(self, qtbot):
         setup_view: SetupActivity = SetupActivity(None, MainModel())
         qtbot.addWidget(setup_view)
@@ -100,12 +425,10 @@ class TestConfigureActivity:
         activity = ConfigureActivity(None, MainModel())
         qtbot.addWidget(activity)
 
-    def test_do_configure_prog(self, qtbot, tmpdir):
+    def test_do_configure_prog(self, qtbot, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         model = MainModel()
         model.buildsystem().meson().sourcedir = tmpdir
@@ -123,6 +446,30 @@ class TestConfigureActivity:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
+    def test_options_from_builddir(self, qtbot, tmpdir, monkeypatch):
+        tmpdir.join('meson.build').write("project('loaded', 'c')\n")
+        tmpdir.join('meson_options.txt').write("option('feature', type: 'boolean', value: true)\n")
+        model = MainModel()
+        model.buildsystem().meson().sourcedir = str(tmpdir)
+        model.buildsystem().meson().builddir = str(tmpdir / 'builddir')
+        model.buildsystem().meson().setup(args=['-Dbuildtype=release', '-Dwarning_level=3', '-Db_lto=true'])
+
+        setup_view: ConfigureActivity = ConfigureActivity(OutputConsole(MainActivity(model)), model)
+        qtbot.addWidget(setup_view)
+
+        assert(setup_view.combo_buildtype.currentText() == 'release')
+        assert(setup_view.combo_warnlevel.currentText() == '3')
+        assert(setup_view.combo_b_lto.currentText() == 'true')
+        assert(setup_view.edit_pkg_config_path.text() == '')
+        assert(setup_view._cache.get_project()['-Dfeature'] == 'true')
+        #
+        # nothing changed, so no Meson command may run
+        calls: list = []
+        monkeypatch.setattr(model.buildsystem().meson(), 'configure_async', lambda args=[]: calls.append(args))
+        monkeypatch.setattr(model.buildsystem().meson(), 'setup_async', lambda args=[]: calls.append(args))
+        qtbot.mouseClick(setup_view.control_push_do_setup, Qt.LeftButton)
+        assert(calls == [])
+
     def test_no_setup_prog(self, qtbot):
         setup_view: ConfigureActivity = ConfigureActivity(None, MainModel())
         qtbot.addWidget(setup_view)
@@ -130,6 +477,33 @@ class TestConfigureActivity:
         qtbot.mouseClick(setup_view.control_push_no_setup, Qt.LeftButton)
 
 
+class TestMatrixActivity:
+    def test_is_renderable(self, qtbot):
+        activity = MatrixActivity(None, MainModel())
+        qtbot.addWidget(activity)
+
+        assert(list(activity.checked_profiles()) == ['debug', 'release', 'asan', 'tsan', 'lto'])
+
+    def test_do_matrix(self, qtbot, tmpdir):
+        tmpdir.join('meson.build').write("project('matrix', 'c')\n")
+        model = MainModel()
+        model.buildsystem().meson().sourcedir = str(tmpdir)
+        console = OutputConsole(MainActivity(model))
+
+        activity = MatrixActivity(console, model)
+        qtbot.addWidget(activity)
+        for row in range(activity.list_profiles.count()):
+            if activity.list_profiles.item(row).text() not in ('debug', 'release'):
+                activity.list_profiles.item(row).setCheckState(Qt.Unchecked)
+        qtbot.mouseClick(activity.control_push_do_matrix, Qt.LeftButton)
+
+        assert(activity.is_busy())
+        qtbot.waitUntil(lambda: not activity.is_busy(), timeout=120000)
+        assert([activity.table_results.item(row, 1).text() for row in range(2)] == ['done (setup)'] * 2)
+        assert(activity.control_push_no_matrix.text() == 'Close')
+        assert(tmpdir.join('builddir-debug', 'build.ninja').exists())
+
+
 class TestInitActivity:
     def test_is_renderable(self, qtbot):
         activity = InitActivity(MainModel())
@@ -78,12 +78,10 @@ class TestNinja:
         assert(ninja.sourcedir == 'test/dir/two')
         assert(ninja.builddir == 'test/dir/two/builddir')
 
-    def test_build_command(self, tmpdir):
+    def test_build_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -100,12 +98,10 @@ class TestNinja:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
-    def test_clean_command(self, tmpdir):
+    def test_clean_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -123,12 +119,10 @@ class TestNinja:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
-    def test_ninja_test_command(self, tmpdir):
+    def test_ninja_test_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -161,12 +155,10 @@ class TestMeson:
         assert(meson.sourcedir == 'test/dir/two')
         assert(meson.builddir == 'test/dir/two/builddir')
 
-    def test_setup_command(self, tmpdir):
+    def test_setup_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -181,12 +173,10 @@ class TestMeson:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
-    def test_build_command(self, tmpdir):
+    def test_build_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -202,12 +192,10 @@ class TestMeson:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
-    def test_configure_command(self, tmpdir):
+    def test_configure_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -223,12 +211,10 @@ class TestMeson:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
-    def test_rebuild_command(self, tmpdir):
+    def test_rebuild_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -246,12 +232,10 @@ class TestMeson:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
-    def test_compile_command(self, tmpdir):
+    def test_compile_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -267,12 +251,10 @@ class TestMeson:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
-    def test_clean_command(self, tmpdir):
+    def test_clean_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -289,12 +271,10 @@ class TestMeson:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
-    def test_install_command(self, tmpdir):
+    def test_install_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -311,12 +291,10 @@ class TestMeson:
         assert tmpdir.join('builddir', 'build.ninja').ensure()
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
-    def test_mtest_command(self, tmpdir):
+    def test_mtest_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -334,12 +312,10 @@ class TestMeson:
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
     @pytest.mark.skipif(not shutil.which('git'), reason='Did not find "git" on this system')
-    def test_mdist_command(self, tmpdir):
+    def test_mdist_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -359,12 +335,10 @@ class TestMeson:
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
         assert tmpdir.join('builddir', 'meson-dist', 'test_mdist_command0-0.1.tar.xz').ensure()
 
-    def test_init_command(self, tmpdir):
+    def test_init_command(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -382,12 +356,10 @@ class TestMeson:
         assert tmpdir.join('builddir', 'compile_commands.json').ensure()
 
     @pytest.mark.skipif(not shutil.which('git'), reason='Did not find "git" on this system')
-    def test_subproject_checkout_subcommand(self, tmpdir):
+    def test_subproject_checkout_subcommand(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -412,12 +384,10 @@ class TestMeson:
         assert tmpdir.join('subprojects', 'samplesubproject', '.gitignore').ensure()
         assert tmpdir.join('subprojects', 'samplesubproject', 'README.md').ensure()
 
-    def test_subproject_update_subcommand(self, tmpdir):
+    def test_subproject_update_subcommand(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -435,12 +405,10 @@ class TestMeson:
         assert tmpdir.join('meson.build').ensure()
         assert tmpdir.join('subprojects', 'sqlite.wrap').ensure()
 
-    def test_subproject_download_subcommand(self, tmpdir):
+    def test_subproject_download_subcommand(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -457,12 +425,10 @@ class TestMeson:
         assert tmpdir.join('meson.build').ensure()
         assert tmpdir.join('subprojects', 'sqlite.wrap').ensure()
 
-    def test_wrap_info_subcommand(self, tmpdir):
+    def test_wrap_info_subcommand(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -479,12 +445,10 @@ class TestMeson:
         assert tmpdir.join('meson.build').ensure()
         assert tmpdir.join('subprojects', 'sqlite.wrap').ensure()
 
-    def test_wrap_search_subcommand(self, tmpdir):
+    def test_wrap_search_subcommand(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -501,12 +465,10 @@ class TestMeson:
         assert tmpdir.join('meson.build').ensure()
         assert tmpdir.join('subprojects', 'sqlite.wrap').ensure()
 
-    def test_wrap_install_subcommand(self, tmpdir):
+    def test_wrap_install_subcommand(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -521,12 +483,10 @@ class TestMeson:
         assert tmpdir.join('meson.build').ensure()
         assert tmpdir.join('subprojects', 'sqlite.wrap').ensure()
 
-    def test_wrap_status_subcommand(self, tmpdir):
+    def test_wrap_status_subcommand(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -543,12 +503,10 @@ class TestMeson:
         assert tmpdir.join('meson.build').ensure()
         assert tmpdir.join('subprojects', 'sqlite.wrap').ensure()
 
-    def test_wrap_update_subcommand(self, tmpdir):
+    def test_wrap_update_subcommand(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
@@ -565,12 +523,10 @@ class TestMeson:
         assert tmpdir.join('meson.build').ensure()
         assert tmpdir.join('subprojects', 'sqlite.wrap').ensure()
 
-    def test_wrap_list_subcommand(self, tmpdir):
+    def test_wrap_list_subcommand(self, tmpdir, monkeypatch):
         #
         # Setting up tmp test directory
-        with tmpdir.as_cwd():
-            pass
-        tmpdir.chdir()
+        monkeypatch.chdir(tmpdir)
 
         #
         # Running Meson command
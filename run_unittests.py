@@ -9,7 +9,12 @@
 #
 from pathlib import Path
 from os.path import join
+import threading
 import pytest
+import json
+import sys
+import io
+import os
 
 
 from mesonui.mesonuilib.appconfig.core import MesonCoreConfig
@@ -29,17 +34,46 @@ from mesonui.mesonuilib.mesonapi.buildoptions import MESON_OPTION_MACHINE
 from mesonui.mesonuilib.mesonapi.buildoptions import MESON_OPTION_SECTION
 from mesonui.mesonuilib.mesonapi.buildoptions import MESON_OPTION_TYPES
 from mesonui.mesonuilib.mesonapi.buildoptions import BuildOption
+from mesonui.mesonuilib.mesonapi.buildoptions import split_option_name
 
 from mesonui.repository.dataloader import MesonBuilddirLoader
 from mesonui.repository.datareader import MesonBuilddirReader
 from mesonui.repository.datascanner import MesonScriptReader
 from mesonui.repository.mesonapi import MesonAPI
+from mesonui.repository.datacache import MesonApiCache
+from mesonui.repository.projectstate import ProjectState
+from mesonui.repository.projectstate import ProjectStates
+from mesonui.repository.datastream import iter_json_array
+from mesonui.repository.datastream import iter_json_lines
 from mesonui.mesonuilib.buildsystem import Meson
 from mesonui.containers.doublylist import MesonUiDLL
 from mesonui.containers.queue import MesonUiQueue
 from mesonui.containers.stack import MesonUiStack
 from mesonui.mesonuilib.utilitylib import MesonUiException
+from mesonui.mesonuilib.xmlbuilder import Builder
 from mesonui.mesonuilib.utilitylib import OSUtility
+from mesonui.mesonuilib.utilitylib import ToolRegistry
+from mesonui.mesonuilib.utilitylib import tool_registry
+from mesonui.mesonuilib.processrunner import ProcessRunner
+from mesonui.mesonuilib.processrunner import ProcessHandle
+from mesonui.mesonuilib.jobserver import JobServer
+from mesonui.mesonuilib.jobserver import version_tuple
+from mesonui.mesonuilib.mesonengine import MesonEngine
+from mesonui.mesonuilib.buildprogress import NinjaProgressParser
+from mesonui.mesonuilib.buildprogress import ninja_status_env
+from mesonui.mesonuilib.mesonengine import MesonEnginePool
+from mesonui.mesonuilib.mesonengine import script_engines
+from mesonui.mesonuilib.mesonengine import meson_engine
+from mesonui.mesonuilib.optiondelta import OptionDelta
+from mesonui.mesonuilib.optiondelta import option_name
+from mesonui.mesonuilib.setupmatrix import SetupMatrix
+from mesonui.mesonuilib.setupmatrix import MatrixEntry
+from mesonui.mesonuilib.setupmatrix import matrix_jobs
+from mesonui.mesonuilib.profiles import SETUP_PROFILES
+from mesonui.mesonuilib.profiles import load_profile
+from mesonui.mesonuilib.profiles import profile_args
+from mesonui.commandline import mesonui_cli
+from mesonui import commandline
 
 
 class TestBuildOptionWrapper:
@@ -273,6 +307,701 @@ class TestBuildOptionWrapper:
         assert('Option smap-option not found!' == str(e.value))
 
 
+class TestBuildOptionIndex:
+    def test_by_section(self):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        build = join('test-cases', 'meson-api', '01-scan-script', 'builddir')
+        meson: Meson = Meson(sourcedir=source, builddir=build)
+
+        meson.setup()
+
+        option: BuildOption = BuildOption(MesonAPI(sourcedir=source, builddir=build))
+        paths = option.by_section('directory')
+
+        assert('bindir' in [opt.name for opt in paths])
+        assert(all(opt.section == 'directory' for opt in paths))
+
+    def test_by_prefix(self):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        build = join('test-cases', 'meson-api', '01-scan-script', 'builddir')
+        meson: Meson = Meson(sourcedir=source, builddir=build)
+
+        meson.setup()
+
+        option: BuildOption = BuildOption(MesonAPI(sourcedir=source, builddir=build))
+        base = option.by_prefix('b_')
+
+        assert('b_lto' in [opt.name for opt in base])
+        assert(all(opt.name.startswith('b_') for opt in base))
+
+    def test_lookup_is_indexed(self):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        build = join('test-cases', 'meson-api', '01-scan-script', 'builddir')
+        meson: Meson = Meson(sourcedir=source, builddir=build)
+
+        meson.setup()
+
+        option: BuildOption = BuildOption(MesonAPI(sourcedir=source, builddir=build))
+
+        assert(option.combo('backend') is option.combo('backend'))
+        assert(option.get('backend').choices == option.combo('backend').choices)
+        assert(option.get('not-an-option') is None)
+        assert(option.by_subproject('') == option.all())
+
+    def test_option_has_slots(self):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        build = join('test-cases', 'meson-api', '01-scan-script', 'builddir')
+        meson: Meson = Meson(sourcedir=source, builddir=build)
+
+        meson.setup()
+
+        option: BuildOption = BuildOption(MesonAPI(sourcedir=source, builddir=build))
+
+        with pytest.raises(AttributeError):
+            option.string('bindir').not_a_field = 'value'
+
+    def test_full_meson_names(self):
+        class FakeApi:
+            def get_object(self, group, extract_method):
+                return [
+                    {'name': 'c_args', 'value': [], 'section': 'compiler', 'machine': 'host',
+                     'type': 'array', 'description': ''},
+                    {'name': 'build.c_args', 'value': [], 'section': 'compiler', 'machine': 'build',
+                     'type': 'array', 'description': ''},
+                    {'name': 'sub:opt', 'value': 'x', 'section': 'user', 'machine': 'any',
+                     'type': 'string', 'description': ''},
+                    {'name': 'sub:optimum', 'value': 'y', 'section': 'user', 'machine': 'any',
+                     'type': 'string', 'description': ''},
+                ]
+        option: BuildOption = BuildOption(FakeApi())
+
+        assert(option.string('sub:opt') is option.string('opt', subproject='sub'))
+        assert(option.array('build.c_args').machine == 'build')
+        assert(option.array('c_args').machine == 'host')
+        assert([opt.value for opt in option.by_prefix('opt')] == ['x', 'y'])
+        assert(option.by_prefix('zzz') == [])
+        assert([opt.name for opt in option.by_subproject('sub')] == ['opt', 'optimum'])
+        assert(len(option.by_section('compiler')) == 2)
+
+    def test_split_option_name(self):
+        assert(split_option_name('c_args', 'host') == ('c_args', ''))
+        assert(split_option_name('sub:c_args', 'host') == ('c_args', 'sub'))
+        assert(split_option_name('sub:build.c_args', 'build') == ('c_args', 'sub'))
+        assert(split_option_name('python.platlibdir', 'any') == ('python.platlibdir', ''))
+
+
+class TestToolRegistry:
+    def _tool(self, directory, name: str, version: str) -> str:
+        directory.join(name).write(f'#!/bin/sh\necho {version}\n')
+        directory.join(name).chmod(0o755)
+        return str(directory.join(name))
+
+    @pytest.mark.skipif(OSUtility.is_windows(), reason='uses shell script tools')
+    def test_path_and_version(self, tmpdir, monkeypatch):
+        old = self._tool(tmpdir.mkdir('old'), 'fake-tool', '1.2.3')
+        new = self._tool(tmpdir.mkdir('new'), 'fake-tool', '2.0.0')
+        registry: ToolRegistry = ToolRegistry({'fake': ('missing-tool', 'fake-tool')})
+
+        monkeypatch.setenv('PATH', str(tmpdir.join('old')))
+        assert(registry.path('fake') == old)
+        assert(registry.version('fake') == '1.2.3')
+        assert(registry.command('fake', 'a', 'b') == [old, 'a', 'b'])
+
+        monkeypatch.setenv('PATH', str(tmpdir.join('new')))
+        assert(registry.path('fake') == new)
+        assert(registry.version('fake') == '2.0.0')
+
+    def test_cached_lookup(self, monkeypatch):
+        registry: ToolRegistry = ToolRegistry()
+        path: str = registry.path('meson')
+        monkeypatch.setattr('shutil.which', lambda name: pytest.fail('PATH walked again'))
+
+        assert(registry.path('meson') == path)
+        assert(registry.command('meson', '--version')[-1] == '--version')
+
+    def test_missing_tool(self):
+        registry: ToolRegistry = ToolRegistry({'fake': ('no-such-tool-for-meson-ui',)})
+
+        with pytest.raises(RuntimeError):
+            registry.path('fake')
+
+    def test_wrappers_use_registry(self):
+        meson: Meson = Meson()
+
+        assert(meson.exe == tool_registry.path('meson'))
+        assert(meson.version() == tool_registry.version('meson'))
+
+    def test_version_from_engine(self, monkeypatch):
+        calls: list = []
+
+        def run(args: list, cwd: str = None, stamp: any = None) -> tuple:
+            calls.append(args)
+            return (0, '1.2.3\n', '')
+
+        monkeypatch.setattr(meson_engine, 'run', run)
+
+        assert(Meson().version() == '1.2.3')
+        assert(calls == [['--version']])
+
+
+class TestCommandLine:
+    def _project(self, tmpdir) -> str:
+        tmpdir.join('meson.build').write("project('cli', 'c')\nexecutable('main', 'main.c')\n")
+        tmpdir.join('main.c').write('int main(void) { return 0; }\n')
+        return str(tmpdir)
+
+    def test_gui_args(self):
+        args = mesonui_cli([])
+
+        assert(args.command is None)
+
+    def test_introspect(self, capsys):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        with pytest.raises(SystemExit) as error:
+            mesonui_cli(['introspect', 'projectinfo', '--method', 'script', '--sourcedir', source])
+
+        info: dict = json.loads(capsys.readouterr().out)
+        assert(error.value.code == 0)
+        assert(list(info) == ['projectinfo'])
+        assert(info['projectinfo']['descriptive_name'] == 'simple-case')
+
+    def test_introspect_nothing_found(self, tmpdir, capsys):
+        with pytest.raises(SystemExit) as error:
+            mesonui_cli(['introspect', 'projectinfo', '--method', 'loader', '--sourcedir', str(tmpdir)])
+
+        assert(error.value.code == 1)
+        assert(json.loads(capsys.readouterr().out) == {'projectinfo': None})
+
+    def test_fast_output_not_lost(self, capsys):
+        handle: ProcessHandle = ProcessRunner().start([sys.executable, '-c', 'print("early")'])
+        handle.wait(timeout=30)
+
+        assert(commandline._run(handle) == 0)
+        assert(capsys.readouterr().out == 'early\n')
+
+    def test_setup_profile(self, tmpdir, capsys):
+        source: str = self._project(tmpdir)
+        with pytest.raises(SystemExit) as error:
+            mesonui_cli(['setup', '--profile', 'release', '-Dwarning_level=2', '--sourcedir', source])
+        assert(error.value.code == 0)
+        capsys.readouterr()
+
+        with pytest.raises(SystemExit) as error:
+            mesonui_cli(['introspect', 'buildoptions', '--sourcedir', source])
+        info: dict = json.loads(capsys.readouterr().out)
+        options: dict = {option['name']: option['value'] for option in info['buildoptions']}
+        assert(options['buildtype'] == 'release')
+        assert(options['b_ndebug'] == 'if-release')
+        assert(options['warning_level'] == '2')
+
+    def test_matrix(self, tmpdir, capsys):
+        source: str = self._project(tmpdir)
+        with pytest.raises(SystemExit) as error:
+            mesonui_cli(['matrix', 'debug', 'release', '-j', '2', '--sourcedir', source])
+
+        lines: list = capsys.readouterr().out.splitlines()
+        assert(error.value.code == 0)
+        assert([line.split()[:2] for line in lines] == [['debug', 'done'], ['release', 'done']])
+        assert(tmpdir.join('builddir-release', 'build.ninja').exists())
+
+    def test_build_failure_code(self, tmpdir):
+        with pytest.raises(SystemExit) as error:
+            mesonui_cli(['build', '--builddir', str(tmpdir.join('missing'))])
+
+        assert(error.value.code != 0)
+
+    def test_unknown_profile(self, tmpdir, capsys):
+        with pytest.raises(SystemExit) as error:
+            mesonui_cli(['setup', '--profile', 'no-such-profile', '--sourcedir', str(tmpdir)])
+
+        assert(error.value.code == 2)
+        assert('no-such-profile' in capsys.readouterr().err)
+
+    def test_profiles(self, tmpdir):
+        tmpdir.join('profile.json').write('{"buildtype": "minsize", "b_lto": true, "c_args": ["-O1", "-g"]}')
+
+        assert(load_profile('release') == SETUP_PROFILES['release'])
+        assert(profile_args(load_profile(str(tmpdir.join('profile.json')))) == [
+            '-Dbuildtype=minsize', '-Db_lto=true', '-Dc_args=-O1,-g'
+        ])
+        tmpdir.join('broken.json').write('[1, 2]')
+        with pytest.raises(MesonUiException):
+            load_profile(str(tmpdir.join('broken.json')))
+
+
+class TestStartupImports:
+    #
+    # Printed in front of the modules a child process had loaded when it
+    # exited.
+    MODULES_MARKER: str = 'loaded modules:'
+
+    def _imported(self, code: str) -> set:
+        prelude: str = (
+            'import atexit, json, sys\n'
+            f'atexit.register(lambda: sys.stderr.write({self.MODULES_MARKER!r} + json.dumps(sorted(sys.modules))))\n'
+        )
+        handle: ProcessHandle = ProcessRunner().start([sys.executable, '-c', prelude + code])
+        assert(handle.wait(60) == 0)
+        for line in handle.errors().splitlines():
+            if line.startswith(self.MODULES_MARKER):
+                return set(json.loads(line[len(self.MODULES_MARKER):]))
+        raise AssertionError(f'No module list in: {handle.errors()}')
+
+    def test_cli_does_not_import_qt(self):
+        modules: set = self._imported(
+            'sys.argv = ["meson-ui", "--version"]\n'
+            'from mesonui.mesonuimain import mesonui_main\n'
+            'try:\n'
+            '    mesonui_main()\n'
+            'except SystemExit as error:\n'
+            '    sys.exit(error.code)\n')
+
+        assert('mesonui.mesonuimain' in modules)
+        assert([name for name in modules if name.startswith('PyQt5')] == [])
+        assert('mesonui.ui.resource_rc' not in modules)
+        assert('mesonui.view.main_activity' not in modules)
+
+    def test_headless_does_not_import_qt(self):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        modules: set = self._imported(
+            f'sys.argv = ["meson-ui", "introspect", "--method", "script", "--sourcedir", {source!r}]\n'
+            'from mesonui.mesonuimain import mesonui_main\n'
+            'try:\n'
+            '    mesonui_main()\n'
+            'except SystemExit as error:\n'
+            '    sys.exit(error.code)\n')
+
+        assert('mesonui.repository.mesonapi' in modules)
+        assert([name for name in modules if name.startswith('PyQt5')] == [])
+
+    def test_main_module_is_light(self):
+        modules: set = self._imported('import mesonui.mesonuimain\n')
+
+        assert([name for name in modules if name.startswith('PyQt5')] == [])
+        assert([name for name in modules if name.startswith('mesonui.view')] == [])
+
+    def test_activities_load_on_demand(self):
+        modules: set = self._imported('import mesonui.view.main_activity\n')
+
+        assert('mesonui.view.main_activity' in modules)
+        assert('mesonui.view.setup_activity' not in modules)
+        assert('mesonui.view.conf_activity' not in modules)
+        assert('mesonui.view.wrap_activity' not in modules)
+
+
+class TestProcessRunner:
+    def test_run_gives_stdout(self):
+        runner: ProcessRunner = ProcessRunner()
+        output = runner.run([sys.executable, '-c', 'print("one"); print("two")'])
+
+        assert(output.splitlines() == ['one', 'two'])
+        assert(runner.running() == [])
+
+    def test_start_gives_handle(self):
+        runner: ProcessRunner = ProcessRunner()
+        lines: list = []
+        handle: ProcessHandle = runner.start([sys.executable, '-c', 'import sys; print("out"); sys.exit(3)'])
+        handle.add_listener(lambda line: lines.append(line))
+
+        assert(handle.wait(timeout=30) == 3)
+        assert(handle.output() == 'out\n')
+        assert(handle.take_lines() == ['out\n'])
+        assert(handle.take_lines() == [])
+        assert(handle.elapsed > 0)
+        assert(handle.is_running() is False)
+
+    def test_done_callback(self):
+        runner: ProcessRunner = ProcessRunner()
+        done: list = []
+        handle: ProcessHandle = runner.start([sys.executable, '-c', 'pass'])
+        handle.wait(timeout=30)
+        handle.add_done_callback(lambda finished: done.append(finished.returncode))
+
+        assert(done == [0])
+
+    def test_cancel(self):
+        runner: ProcessRunner = ProcessRunner()
+        handle: ProcessHandle = runner.start([sys.executable, '-c', 'import time; time.sleep(60)'])
+
+        assert(handle.is_running())
+        runner.cancel_all()
+
+        assert(handle.wait(timeout=30) is not None)
+        assert(handle.cancelled is True)
+        assert(handle.elapsed < 60)
+
+
+    def test_replay_listener_calls_handle(self):
+        runner: ProcessRunner = ProcessRunner()
+        handle: ProcessHandle = runner.start([sys.executable, '-c', 'print("one"); print("two")'])
+        handle.wait(timeout=30)
+        seen: list = []
+        handle.add_listener(lambda line: seen.append((line, handle.output())), replay=True)
+
+        assert(seen == [('one\n', 'one\ntwo\n'), ('two\n', 'one\ntwo\n')])
+
+    def test_bounded_output(self):
+        runner: ProcessRunner = ProcessRunner()
+        handle: ProcessHandle = runner.start([sys.executable, '-c', 'print("\\n".join(map(str, range(100))))'],
+                                             max_lines=10)
+        handle.wait(timeout=30)
+
+        assert(handle.output().splitlines() == [str(i) for i in range(90, 100)])
+        assert(len(handle.take_lines()) == 10)
+        assert(handle.dropped_lines == 90)
+
+
+class TestJobServer:
+    def _edge_script(self, tmpdir) -> str:
+        script = tmpdir.join('edge.py')
+        script.write(
+            'import sys, time\n'
+            'with open(sys.argv[1], "a") as log: log.write("+\\n")\n'
+            'time.sleep(0.3)\n'
+            'with open(sys.argv[1], "a") as log: log.write("-\\n")\n'
+            'open(sys.argv[2], "w").close()\n'
+        )
+        return str(script)
+
+    def test_slots_are_shared(self):
+        jobserver: JobServer = JobServer(budget=2)
+        try:
+            assert(jobserver.acquire(2) == 2)
+            assert(jobserver.try_acquire() == 0)
+            jobserver.release(1)
+            assert(jobserver.try_acquire(5) == 1)
+            assert(jobserver.held == 2)
+            jobserver.release(2)
+            assert(jobserver.held == 0)
+            assert(jobserver.try_acquire(5) == 2)
+        finally:
+            jobserver.close()
+
+    def test_lost_tokens_come_back(self):
+        jobserver: JobServer = JobServer(budget=3)
+        try:
+            if jobserver.fifo is None:
+                pytest.skip('named pipes are not supported here')
+            #
+            # A client that got killed never writes its tokens back.
+            fd: int = os.open(jobserver.fifo, os.O_RDONLY | os.O_NONBLOCK)
+            assert(len(os.read(fd, 2)) == 2)
+            os.close(fd)
+            assert(jobserver.try_acquire(3) == 1)
+            jobserver.release(1)
+
+            assert(jobserver.try_acquire(5) == 3)
+            assert(jobserver.env({})['MAKEFLAGS'] == f' -j3 --jobserver-auth=fifo:{jobserver.fifo}')
+        finally:
+            jobserver.close()
+
+    def test_counted_without_fifo(self):
+        jobserver: JobServer = JobServer(budget=1)
+        jobserver.close()
+        cancelled = threading.Event()
+        cancelled.set()
+
+        assert(jobserver.acquire(4) == 1)
+        assert(jobserver.acquire(cancelled=cancelled) == 0)
+        assert('MAKEFLAGS' not in jobserver.env({'MAKEFLAGS': '-j8'}))
+        assert(jobserver.ninja_jobs_arg() == '-j{jobs}')
+        jobserver.release(1)
+        assert(jobserver.try_acquire() == 1)
+
+    def test_shared_made_on_first_use(self, tmpdir):
+        code: str = (
+            'import os, sys\n'
+            'from mesonui.mesonuilib.mesonbuild.compile import MesonCompile\n'
+            'from mesonui.mesonuilib import jobserver\n'
+            'print(jobserver._shared is None, os.listdir(sys.argv[1]))\n'
+            'print(jobserver.shared_jobserver() is jobserver.shared_jobserver())\n'
+        )
+        env: dict = dict(os.environ, TMPDIR=str(tmpdir))
+        handle: ProcessHandle = ProcessRunner().start([sys.executable, '-c', code, str(tmpdir)], env=env)
+        assert(handle.wait(60) == 0)
+        assert(handle.output().splitlines() == ['True []', 'True'])
+        assert(tmpdir.listdir() == [])
+
+    def test_version_tuple(self):
+        assert(version_tuple('1.13.2.git.kitware.jobserver-pipe-1') == (1, 13, 2))
+        assert(version_tuple('1.10.1') < (1, 13))
+        assert(version_tuple('') == ())
+
+    def test_process_waits_for_slot(self):
+        jobserver: JobServer = JobServer(budget=1)
+        runner: ProcessRunner = ProcessRunner()
+        try:
+            first: ProcessHandle = runner.start([sys.executable, '-c', 'import time; time.sleep(0.5)'],
+                                                jobserver=jobserver)
+            second: ProcessHandle = runner.start([sys.executable, '-c', 'print("second")'], jobserver=jobserver)
+
+            assert(second.is_waiting() and second.pid is None and second.elapsed == 0.0)
+            assert(second.wait(timeout=30) == 0)
+            assert(first.returncode == 0)
+            assert(second.output() == 'second\n')
+            assert(jobserver.held == 0)
+        finally:
+            runner.cancel_all()
+            jobserver.close()
+
+    def test_cancel_waiting_process(self):
+        jobserver: JobServer = JobServer(budget=1)
+        runner: ProcessRunner = ProcessRunner()
+        try:
+            first: ProcessHandle = runner.start([sys.executable, '-c', 'import time; time.sleep(60)'],
+                                                jobserver=jobserver)
+            second: ProcessHandle = runner.start([sys.executable, '-c', 'pass'], jobserver=jobserver)
+            second.cancel()
+
+            assert(second.wait(timeout=30) == -1)
+            assert(second.cancelled and second.pid is None)
+            assert(first.is_running())
+        finally:
+            runner.cancel_all()
+            jobserver.close()
+        assert(jobserver.held == 0)
+
+    def test_jobs_given_to_process(self):
+        jobserver: JobServer = JobServer(budget=3)
+        runner: ProcessRunner = ProcessRunner()
+        try:
+            handle: ProcessHandle = runner.start(
+                [sys.executable, '-c', 'import os, sys; print(sys.argv[1], os.environ["JOBS"])'],
+                jobserver=jobserver, jobs_arg='-j{jobs}', jobs_env='JOBS'
+            )
+
+            assert(handle.wait(timeout=30) == 0)
+            assert(handle.output() == '-j3 3\n')
+        finally:
+            jobserver.close()
+
+    def test_builds_share_budget(self, tmpdir):
+        jobserver: JobServer = JobServer(budget=2)
+        runner: ProcessRunner = ProcessRunner()
+        script: str = self._edge_script(tmpdir)
+        log: str = str(tmpdir.join('edges.log'))
+        handles: list = []
+        try:
+            for name in ('one', 'two'):
+                builddir = tmpdir.mkdir(name)
+                builddir.join('build.ninja').write(
+                    f'rule edge\n  command = {sys.executable} {script} {log} $out\n' +
+                    ''.join(f'build out{count}: edge\n' for count in range(4))
+                )
+                handles.append(runner.start(tool_registry.command('ninja', '-C', str(builddir)),
+                                            env=ninja_status_env(), jobserver=jobserver,
+                                            jobs_arg=jobserver.ninja_jobs_arg()))
+            for handle in handles:
+                assert(handle.wait(timeout=60) == 0)
+        finally:
+            runner.cancel_all()
+            jobserver.close()
+
+        running: int = 0
+        most: int = 0
+        for line in open(log).read().split():
+            running += 1 if line == '+' else -1
+            most = max(most, running)
+        assert(running == 0)
+        assert(1 <= most <= 2)
+
+
+class TestMesonEngine:
+    def test_worker_matches_process(self):
+        worker: MesonEngine = MesonEngine(in_process=True)
+        process: MesonEngine = MesonEngine(in_process=False)
+        args: list = ['introspect', '--projectinfo', join('test-cases', 'intro-scanner', '02-unittests', 'meson.build')]
+        try:
+            assert(worker.run(['--version']) == process.run(['--version']))
+            returncode, output, errors = worker.run(args)
+            assert(returncode == 0)
+            assert(json.loads(output) == json.loads(process.run(args)[1]))
+        finally:
+            worker.close()
+
+    def test_worker_failure_falls_back(self):
+        engine: MesonEngine = MesonEngine(in_process=True)
+        try:
+            engine.run(['--version'])
+            if engine._worker is None:
+                pytest.skip('mesonbuild can not be imported by this Python')
+            engine._worker._process.kill()
+            engine._worker._process.wait()
+
+            assert(engine.run(['--version'])[1].strip() == tool_registry.version('meson'))
+            assert(engine._worker is not None and engine._worker.is_alive())
+        finally:
+            engine.close()
+
+    def test_stamp_answers_from_memory(self, tmpdir):
+        tmpdir.join('meson.build').write("project('first')\n")
+        engine: MesonEngine = MesonEngine(in_process=True)
+        args: list = ['introspect', '--projectinfo', str(tmpdir.join('meson.build'))]
+        try:
+            first = engine.run(args, stamp=['one'])
+            if engine._worker is None:
+                pytest.skip('mesonbuild can not be imported by this Python')
+            tmpdir.join('meson.build').write("project('second')\n")
+
+            assert(engine.run(args, stamp=['one']) == first)
+            assert(json.loads(engine.run(args, stamp=['two'])[1])['descriptive_name'] == 'second')
+            assert(json.loads(engine.run(args)[1])['descriptive_name'] == 'second')
+        finally:
+            engine.close()
+
+    def test_configure_runs_as_process(self, tmpdir):
+        engine: MesonEngine = MesonEngine(in_process=True)
+        try:
+            engine.run(['--version'])
+            worker = engine._worker
+            returncode, output, errors = engine.run(['configure', str(tmpdir.join('missing'))])
+
+            assert(returncode != 0)
+            assert('ERROR' in output + errors)
+            assert(engine._worker is worker)
+        finally:
+            engine.close()
+
+    def test_engine_pool(self):
+        pool: MesonEnginePool = MesonEnginePool(size=2)
+        first: MesonEngine = pool.engine('a')
+        pool.engine('b')
+
+        assert(pool.engine('a') is first)
+        pool.engine('c')
+        assert(pool.keys() == ['a', 'c'])
+        pool.close()
+        assert(pool.keys() == [])
+
+    def test_in_process_switch(self, monkeypatch):
+        monkeypatch.setenv('MESONUI_IN_PROCESS', '0')
+        engine: MesonEngine = MesonEngine()
+
+        assert(engine.in_process is False)
+        assert(engine.run(['--version'])[0] == 0)
+        assert(engine._worker is None)
+
+
+class TestNinjaProgress:
+    def _parser(self) -> tuple:
+        now: list = [100.0]
+        return (NinjaProgressParser(rate_window=10.0, clock=lambda: now[0]), now)
+
+    def test_status_lines(self):
+        parser, now = self._parser()
+        seen: list = []
+        parser.add_listener(seen.append)
+
+        assert(parser.feed('The Meson build system\n') is None)
+        parser.feed('[1/40 4] Compiling C object a.o\n')
+        now[0] = 102.0
+        progress = parser.feed('[11/40 3] Compiling C object b.o\n')
+
+        assert((progress.finished, progress.total, progress.running) == (11, 40, 3))
+        assert(progress.rate == 5.0)
+        assert(progress.eta == 5.8)
+        assert(progress.last_edge == 'Compiling C object b.o')
+        assert(progress.last_finished == ['Compiling C object a.o', 'Compiling C object b.o'])
+        assert(progress.summary() == '11/40 edges, 5.0/s, ETA 0:05')
+        assert(len(seen) == 2)
+
+    def test_default_format_and_stall(self):
+        parser, now = self._parser()
+        parser.feed('[3/9] Linking target app')
+        now[0] = 160.0
+        progress = parser.progress()
+
+        assert(progress.running is None)
+        assert(progress.rate is None and progress.eta is None)
+        assert(progress.idle == 60.0)
+        assert(progress.fraction == 3 / 9)
+
+    def test_rate_window_and_regenerate(self):
+        parser, now = self._parser()
+        for second in range(30):
+            now[0] = 100.0 + second
+            parser.feed(f'[{second if second < 20 else 19 + (second - 19) * 10}/1000] edge')
+
+        assert(parser.progress().rate == 10.0)
+        now[0] = 200.0
+        parser.feed('[1/5] Regenerating build files')
+        now[0] = 201.0
+        assert(parser.feed('[3/5] edge').rate == 2.0)
+
+    def test_compile_reports_progress(self, tmpdir):
+        tmpdir.join('meson.build').write("project('progress', 'c')\n"
+                                         "executable('one', 'one.c')\nexecutable('two', 'two.c')\n")
+        tmpdir.join('one.c').write('int main(void) { return 0; }\n')
+        tmpdir.join('two.c').write('int main(void) { return 0; }\n')
+        meson: Meson = Meson(sourcedir=str(tmpdir), builddir=str(tmpdir.join('builddir')))
+        meson.setup()
+        seen: list = []
+
+        meson.compile_async(on_progress=seen.append).wait(timeout=120)
+
+        assert(seen[-1].finished == seen[-1].total == 4)
+        assert(all(progress.running is not None for progress in seen))
+
+    def test_wrappers_ask_status(self, monkeypatch):
+        monkeypatch.setenv('NINJA_STATUS', '%p ')
+
+        assert(ninja_status_env()['NINJA_STATUS'] == '[%f/%t %r] ')
+        assert(ninja_status_env({'PATH': '/bin'}) == {'PATH': '/bin', 'NINJA_STATUS': '[%f/%t %r] '})
+
+
+class TestXmlBuilder:
+    def _document(self, xml: Builder) -> Builder:
+        with xml.project(name='demo'):
+            xml.option(title='ünïcode & <more>')
+            with xml.units:
+                for number in range(3):
+                    xml.unit(f'file{number}.c', kind='source')
+        return xml
+
+    def test_stream_matches_memory(self, tmpdir):
+        path = str(tmpdir.join('demo.xml'))
+        in_memory = str(self._document(Builder(version='1.0', encoding='UTF-8')))
+        with Builder.to_file(path, version='1.0', encoding='UTF-8') as xml:
+            self._document(xml)
+
+        with open(path, encoding='utf-8', newline='') as file:
+            assert(file.read() == in_memory)
+        assert('&amp; &lt;more&gt;' in in_memory)
+
+    def test_stream_flushes(self, tmpdir):
+        path = str(tmpdir.join('flush.xml'))
+        xml = Builder.to_file(path, buffer_size=1024 * 1024)
+        xml.first(value='1')
+        xml.flush()
+
+        with open(path) as file:
+            assert(file.read() == '<first value="1" />')
+        xml.close()
+        xml.close()
+
+    def test_escaped_values(self):
+        xml = Builder()
+        xml.tag('a & b', plain='value', quoted='say "hi"', lines='one\ntwo', class_='x')
+
+        assert(str(xml) == '<tag class="x" lines="one&#10;two" plain="value" quoted=\'say "hi"\'>a &amp; b</tag>')
+
+    def test_element_has_slots(self):
+        xml = Builder()
+        element = xml.tag
+
+        assert(not hasattr(element, '__dict__'))
+        assert(not hasattr(element, '__del__'))
+
+    def test_stream_closed_on_error(self, tmpdir):
+        path = str(tmpdir.join('error.xml'))
+        with pytest.raises(RuntimeError):
+            with Builder.to_file(path) as xml:
+                xml.first(value='1')
+                raise RuntimeError('stop')
+
+        assert(xml._document.closed)
+
+
 class TestMesonUiQueue:
     def test_enqueue(self):
         queue: MesonUiQueue = MesonUiQueue()
@@ -552,6 +1281,385 @@ class TestMesonAPI:
         assert('API group key pair <class \'float\'> is not valid type!' == str(e.value))
 
 
+class TestMesonApiCache:
+    def test_cache_hit_on_unchanged_group(self):
+        source = join('test-cases', 'meson-api', '03-load-builddir')
+        build = join('test-cases', 'meson-api', '03-load-builddir', 'builddir')
+        meson: Meson = Meson(sourcedir=source, builddir=build)
+
+        meson.setup()
+
+        cache: MesonApiCache = MesonApiCache()
+        script: MesonAPI = MesonAPI(sourcedir=source, builddir=build, cache=cache)
+        first = script.get_object(group='projectinfo', extract_method='loader')
+        second = script.get_object(group='projectinfo', extract_method='loader')
+
+        assert(first is second)
+        assert(cache.stats() == {'hits': 1, 'misses': 1, 'entries': 1})
+
+    def test_cache_miss_on_changed_file(self):
+        source = join('test-cases', 'meson-api', '03-load-builddir')
+        build = join('test-cases', 'meson-api', '03-load-builddir', 'builddir')
+        meson: Meson = Meson(sourcedir=source, builddir=build)
+
+        meson.setup()
+
+        cache: MesonApiCache = MesonApiCache()
+        script: MesonAPI = MesonAPI(sourcedir=source, builddir=build, cache=cache)
+        script.get_object(group='projectinfo', extract_method='loader')
+
+        intro_file = join(build, 'meson-info', 'intro-projectinfo.json')
+        stat = os.stat(intro_file)
+        os.utime(intro_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+        info = script.get_object(group='projectinfo', extract_method='loader')
+
+        assert(info['descriptive_name'] == 'simple-case')
+        assert(cache.hits == 0)
+        assert(cache.misses == 2)
+
+    def test_cache_script_hit(self):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        build = join('test-cases', 'meson-api', '01-scan-script', 'not-a-builddir')
+
+        cache: MesonApiCache = MesonApiCache()
+        script: MesonAPI = MesonAPI(sourcedir=source, builddir=build, cache=cache)
+        first = script.get_object(group='projectinfo', extract_method='script')
+        second = script.get_object(group='projectinfo', extract_method='script')
+
+        assert(first == second)
+        assert(cache.hits == 1)
+
+    def test_cache_invalidate_group(self):
+        cache: MesonApiCache = MesonApiCache()
+        cache.store(('loader', 'tests', 'builddir'), ('stamp',), [])
+        cache.store(('loader', 'projectinfo', 'builddir'), ('stamp',), {})
+
+        cache.invalidate('tests')
+
+        assert(cache.lookup(('loader', 'tests', 'builddir'), ('stamp',)) == (False, None))
+        assert(cache.lookup(('loader', 'projectinfo', 'builddir'), ('stamp',)) == (True, {}))
+        assert(cache.stats() == {'hits': 1, 'misses': 1, 'entries': 1})
+
+
+class TestProjectState:
+    def _project(self, tmpdir) -> tuple:
+        tmpdir.join('meson.build').write("project('state')\n")
+        meson: Meson = Meson(sourcedir=str(tmpdir), builddir=str(tmpdir.join('builddir')))
+        return (meson, str(tmpdir), str(tmpdir.join('builddir')))
+
+    def test_state_of_builddir(self, tmpdir):
+        meson, source, build = self._project(tmpdir)
+        before: ProjectState = ProjectState(source, build)
+        meson.setup()
+        after: ProjectState = ProjectState(source, build)
+
+        assert(before.has_meson_script and not before.is_builddir and not before.has_intro_files)
+        assert(not before.is_current())
+        assert(after.is_builddir and after.has_build_ninja and after.has_intro_files)
+        assert(after.meson_version == tool_registry.version('meson'))
+        assert(after.is_current())
+
+    def test_intro_files_missing(self, tmpdir):
+        meson, source, build = self._project(tmpdir)
+        meson.setup()
+        meson.configure(args=['-Dbuildtype=release'])
+        assert(ProjectState(source, build).has_intro_files)
+
+        os.remove(join(build, 'meson-info', 'intro-targets.json'))
+        assert(not ProjectState(source, build).has_intro_files)
+
+    def test_states_reused_until_changed(self, tmpdir):
+        meson, source, build = self._project(tmpdir)
+        states: ProjectStates = ProjectStates()
+        first: ProjectState = states.get(source, build)
+
+        assert(states.get(source, build) is first)
+        tmpdir.mkdir('subprojects')
+        assert(states.get(source, build).has_subprojects)
+
+    def test_reconfigure_drops_cached_objects(self, tmpdir):
+        meson, source, build = self._project(tmpdir)
+        meson.setup()
+        cache: MesonApiCache = MesonApiCache()
+        api: MesonAPI = MesonAPI(sourcedir=source, builddir=build, cache=cache)
+        api.get_objects(groups=['projectinfo', 'buildoptions'], extract_method='loader')
+        cache.store(('script', 'projectinfo', source), (), {})
+
+        meson.configure(args=['-Dbuildtype=release'])
+        api.state()
+
+        assert(cache.stats()['entries'] == 1)
+
+
+class TestOptionDelta:
+    def _project(self, tmpdir) -> tuple:
+        tmpdir.join('meson.build').write("project('delta', 'c')\n")
+        meson: Meson = Meson(sourcedir=str(tmpdir), builddir=str(tmpdir.join('builddir')))
+        return (meson, MesonAPI(sourcedir=str(tmpdir), builddir=str(tmpdir.join('builddir'))))
+
+    def test_option_names(self):
+        assert(option_name('--buildtype') == 'buildtype')
+        assert(option_name('--default-library') == 'default_library')
+        assert(option_name('--warnlevel') == 'warning_level')
+        assert(option_name('-Db_lto') == 'b_lto')
+        assert(option_name('-Dbackend_max_links') == 'backend_max_links')
+
+    def test_only_changed_options(self, tmpdir):
+        meson, api = self._project(tmpdir)
+        meson.setup()
+        wanted: dict = {
+            '--buildtype': 'release',
+            '--warnlevel': '1',
+            '--werror': 'false',
+            '--fatal-meson-warnings': 'true',
+            '-Db_lto': 'false',
+            '-Db_sanitize': 'none',
+            '--stdsplit': 'true'
+        }
+        delta: OptionDelta = OptionDelta.from_api(api, wanted)
+
+        assert(delta.changed == {'buildtype': 'release'})
+        assert(delta.configure_args() == ['-Dbuildtype=release'])
+        assert(delta.unknown == ['--fatal-meson-warnings'])
+        assert(not delta.needs_wipe)
+
+        meson.configure(args=delta.configure_args())
+        assert(OptionDelta.from_api(api, wanted).is_empty())
+
+    def test_backend_needs_wipe(self, tmpdir):
+        meson, api = self._project(tmpdir)
+        meson.setup()
+        delta: OptionDelta = OptionDelta.from_api(api, {'--backend': 'vs2019', '--buildtype': 'debug'})
+
+        assert(delta.needs_wipe)
+        assert(delta.setup_args() == ['--wipe', '-Dbackend=vs2019', '-Dbuildtype=debug'])
+
+    def test_project_options(self):
+        cache: MesonUiCache = MesonUiCache()
+        cache.init_cache()
+        cache.configure_project('c_args', '')
+        cache.configure_project('sub:feature', 'true')
+
+        options: dict = cache.get_options()
+        assert(options['-Dc_args'] == '')
+        assert(options['-Dsub:feature'] == 'true')
+        assert(options['--buildtype'] == 'debug')
+        assert(option_name('-Dsub:feature') == 'sub:feature')
+
+    def test_no_builddir(self, tmpdir):
+        meson, api = self._project(tmpdir)
+
+        assert(OptionDelta.from_api(api, {'--buildtype': 'release'}) is None)
+
+
+class TestSetupMatrix:
+    def _project(self, tmpdir) -> str:
+        tmpdir.join('meson.build').write("project('matrix', 'c')\n")
+        return str(tmpdir)
+
+    def _buildtype(self, entry: MatrixEntry) -> str:
+        with open(join(entry.builddir, 'meson-info', 'intro-buildoptions.json')) as loaded_json:
+            return {option['name']: option['value'] for option in json.load(loaded_json)}['buildtype']
+
+    def test_jobs(self):
+        assert(matrix_jobs(0) == 1)
+        assert(1 <= matrix_jobs(3) <= 3)
+        assert(matrix_jobs(1000) == os.cpu_count())
+
+    def test_profiles_set_up_at_once(self, tmpdir):
+        source: str = self._project(tmpdir)
+        running: list = []
+        most: list = [0]
+
+        def on_status(entry: MatrixEntry) -> None:
+            if entry.status == 'running':
+                running.append(entry)
+            elif entry in running:
+                running.remove(entry)
+            most[0] = max(most[0], len(running))
+
+        profiles: dict = {name: SETUP_PROFILES[name] for name in ('debug', 'release', 'minsize')}
+        matrix: SetupMatrix = SetupMatrix(source, profiles, jobs=2)
+        matrix.add_listener(on_status)
+        assert(matrix.start().wait(300))
+
+        assert([entry.status for entry in matrix.entries] == ['done'] * 3)
+        assert([self._buildtype(entry) for entry in matrix.entries] == ['debug', 'release', 'minsize'])
+        assert(all(entry.command == 'setup' and entry.elapsed > 0 for entry in matrix.entries))
+        assert(most[0] == 2)
+        assert(len(matrix.summary()) == 3)
+
+    def test_set_up_builddirs_only_configured(self, tmpdir):
+        source: str = self._project(tmpdir)
+        SetupMatrix(source, {'debug': {'buildtype': 'debug'}, 'fast': {'buildtype': 'debug'}}).start().wait(300)
+
+        matrix: SetupMatrix = SetupMatrix(source, {'debug': {'buildtype': 'debug'}, 'fast': {'buildtype': 'release'}})
+        assert(matrix.start().wait(300))
+
+        assert([entry.status for entry in matrix.entries] == ['unchanged', 'done'])
+        assert(matrix.entries[1].command == 'configure')
+        assert(self._buildtype(matrix.entries[1]) == 'release')
+
+    def test_failed_profile(self, tmpdir):
+        source: str = self._project(tmpdir)
+        profiles: dict = {'debug': {'buildtype': 'debug'}, 'broken': {'buildtype': 'nonsense'}}
+        matrix: SetupMatrix = SetupMatrix(source, profiles)
+        assert(matrix.start().wait(300))
+
+        assert([entry.profile for entry in matrix.failed()] == ['broken'])
+        assert(matrix.entries[1].returncode != 0)
+        assert('nonsense' in matrix.entries[1].errors())
+        assert(matrix.entries[0].status == 'done')
+
+    def test_error_ends_profile(self, tmpdir, monkeypatch):
+        def broken(api, wanted):
+            raise ValueError('unreadable build directory')
+
+        monkeypatch.setattr('mesonui.mesonuilib.setupmatrix.OptionDelta.from_api', broken)
+        matrix: SetupMatrix = SetupMatrix(self._project(tmpdir), {'debug': {'buildtype': 'debug'}})
+        assert(matrix.start().wait(60))
+
+        assert(matrix.entries[0].status == 'failed')
+        assert(matrix.entries[0].errors() == 'unreadable build directory')
+
+    def test_cancel_while_reading(self, tmpdir, monkeypatch):
+        reading = threading.Event()
+        go_on = threading.Event()
+
+        def slow(api, wanted):
+            reading.set()
+            go_on.wait(60)
+            return None
+
+        monkeypatch.setattr('mesonui.mesonuilib.setupmatrix.OptionDelta.from_api', slow)
+        matrix: SetupMatrix = SetupMatrix(self._project(tmpdir), {'debug': {'buildtype': 'debug'}}).start()
+        assert(reading.wait(60))
+        matrix.cancel()
+        go_on.set()
+        assert(matrix.wait(60))
+
+        assert(matrix.entries[0].status == 'cancelled')
+        assert(matrix.entries[0].handle is None)
+
+
+class TestApiBatchedExtract:
+    def test_reader_extract_many(self):
+        source = join('test-cases', 'intro-reader', '01-projectinfo')
+        build = join('test-cases', 'intro-reader', '01-projectinfo', 'builddir')
+        meson: Meson = Meson(sourcedir=source, builddir=build)
+
+        meson.setup()
+
+        reader: MesonBuilddirReader = MesonBuilddirReader(build)
+        info = reader.extract_many(groups=['projectinfo', 'buildoptions', 'scan-dependencies', 'testlog'])
+
+        assert(info['projectinfo'] == reader.extract_from(group='projectinfo'))
+        assert(info['buildoptions'] == reader.extract_from(group='buildoptions'))
+        assert(info['scan-dependencies'] == reader.extract_from(group='scan-dependencies'))
+        assert(info['testlog'] is None)
+
+    def test_script_extract_many(self):
+        script: MesonScriptReader = MesonScriptReader(join('test-cases', 'intro-scanner', '02-unittests'))
+        info = script.extract_many(groups=['projectinfo', 'tests', 'benchmarks', 'targets'])
+
+        assert(info['projectinfo'] == script.extract_from(group='projectinfo'))
+        assert(info['tests'] == script.extract_from(group='tests'))
+        assert(info['benchmarks'] == script.extract_from(group='benchmarks'))
+        assert(info['targets'] == script.extract_from(group='targets'))
+
+    def test_script_extract_many_bad_group(self):
+        script: MesonScriptReader = MesonScriptReader(None)
+        with pytest.raises(Exception) as e:
+            script.extract_many(groups=['projectinfo', 'not-a-key'])
+        assert('Group tag not-a-key not found in extract via data options!' == str(e.value))
+
+    def test_meson_api_get_objects(self):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        build = join('test-cases', 'meson-api', '01-scan-script', 'not-a-builddir')
+
+        cache: MesonApiCache = MesonApiCache()
+        script: MesonAPI = MesonAPI(sourcedir=source, builddir=build, cache=cache)
+        info = script.get_objects(groups=['projectinfo', 'buildoptions', 'testlog'])
+
+        assert(info['projectinfo']['descriptive_name'] == 'simple-case')
+        assert(info['testlog'] is None)
+        assert(script.get_object(group='buildoptions') is info['buildoptions'])
+        assert(cache.stats() == {'hits': 1, 'misses': 3, 'entries': 3})
+
+    def test_meson_api_script_worker(self):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        build = join('test-cases', 'meson-api', '01-scan-script', 'not-a-builddir')
+
+        first = MesonAPI(sourcedir=source, builddir=build, cache=MesonApiCache()).get_object(group='projectinfo')
+        again = MesonAPI(sourcedir=source, builddir=build, cache=MesonApiCache()).get_object(group='targets')
+
+        assert(first['descriptive_name'] == 'simple-case')
+        assert(isinstance(again, list))
+        assert(str(Path(source).resolve()) in script_engines.keys())
+
+
+class TestJsonStream:
+    def test_array_items(self):
+        items = [1, -2.5e3, 'text ] with , chars', {'a': [1, {'b': None}]}, [], {}, True, None, 'é']
+        document = json.dumps(items, indent=1)
+
+        for chunk_size in (1, 2, 3, 7, 64, 4096):
+            assert(list(iter_json_array(io.StringIO(document), chunk_size=chunk_size)) == items)
+
+    def test_array_is_lazy(self):
+        stream = io.StringIO(json.dumps([{'name': f'target{i}', 'sources': ['x' * 100]} for i in range(1000)]))
+        items = iter_json_array(stream, chunk_size=256)
+
+        assert(next(items)['name'] == 'target0')
+        assert(stream.tell() < 4096)
+
+    def test_empty_array(self):
+        assert(list(iter_json_array(io.StringIO(' [ ] '))) == [])
+
+    @pytest.mark.parametrize('document', ['', '{}', '[1, 2', '[1 2]', '[1,]', '[1,,2]'])
+    def test_bad_array(self, document):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.StringIO(document), chunk_size=2))
+
+    def test_json_lines(self):
+        stream = io.StringIO('{"name": "a", "result": "OK"}\n\n{"name": "b", "result": "FAIL"}\n')
+
+        assert([record['name'] for record in iter_json_lines(stream)] == ['a', 'b'])
+
+    def test_loader_iter_targets(self):
+        source = join('test-cases', 'intro-loader', '06-targets')
+        build = join('test-cases', 'intro-loader', '06-targets', 'builddir')
+        meson: Meson = Meson(sourcedir=source, builddir=build)
+
+        meson.setup()
+
+        loader: MesonBuilddirLoader = MesonBuilddirLoader(build)
+        assert(list(loader.iter_from(group='targets')) == loader.extract_from(group='targets'))
+        assert(list(MesonAPI(sourcedir=source, builddir=build).iter_object(group='targets')) ==
+               loader.extract_from(group='targets'))
+
+    def test_loader_iter_missing_testlog(self):
+        loader: MesonBuilddirLoader = MesonBuilddirLoader(join('test-cases', 'meson-api', '01-scan-script'))
+
+        assert(list(loader.iter_from(group='testlog')) == [])
+
+    def test_loader_iter_bad_group(self):
+        loader: MesonBuilddirLoader = MesonBuilddirLoader(None)
+        with pytest.raises(Exception) as e:
+            list(loader.iter_from(group='projectinfo'))
+        assert('Group tag projectinfo can not be streamed via data options!' == str(e.value))
+
+    def test_meson_api_iter_without_builddir(self):
+        source = join('test-cases', 'meson-api', '01-scan-script')
+        build = join('test-cases', 'meson-api', '01-scan-script', 'not-a-builddir')
+        script: MesonAPI = MesonAPI(sourcedir=source, builddir=build, cache=MesonApiCache())
+
+        assert(list(script.iter_object(group='buildoptions')) == script.get_object(group='buildoptions'))
+        assert(list(script.iter_object(group='testlog')) == [])
+        with pytest.raises(MesonUiException):
+            script.iter_object(group='projectinfo')
+
+
 class TestApiBuilddirLoader:
     def test_loader_projectinfo(self):
         source = join('test-cases', 'intro-loader', '01-projectinfo')